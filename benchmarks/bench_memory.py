@@ -0,0 +1,92 @@
+"""
+Benchmark: memory of a large catalog as objects and as columns.
+
+Loads the same processed catalog three ways and measures the Python heap
+it takes with tracemalloc: a plain dataclass with a per-instance
+``__dict__`` (the previous Book), the slotted Book, and a BookCatalog.
+Also compares building the export DataFrame from per-book dictionaries
+and from the catalog's columns.
+
+Usage:
+    python -m benchmarks.bench_memory [--books 100000]
+"""
+
+import argparse
+import dataclasses
+import gc
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import pandas as pd
+
+from benchmarks.fake_backend import synthetic_catalog
+from src.models import Book, BookCatalog
+
+# The previous Book: same fields, no __slots__
+LegacyBook = dataclasses.make_dataclass(
+    'LegacyBook', [(field.name, field.type, field) for field in dataclasses.fields(Book)]
+)
+
+
+def catalog_lines(size: int):
+    """Catalog lines in the books file format, as read from disk."""
+    return [f"{book.titulo} | {book.autor} | {book.año}" for book in synthetic_catalog(size, seed=7)]
+
+
+def load(lines, cls) -> list:
+    """Parse the lines into books of ``cls`` and mark half of them as found."""
+    books = []
+    for numero, line in enumerate(lines, 1):
+        titulo, autor, año = (part.strip() for part in line.split('|'))
+        book = cls(numero=numero, titulo=titulo, autor=autor, año=año, seccion="NOVELA")
+        if numero % 2:
+            book.url_youtube = f"https://www.youtube.com/watch?v={numero:011d}"
+            book.duracion = "1:02:03"
+            book.tipo_contenido = "Lectura Completa"
+            book.disponibilidad = "ENCONTRADO"
+        books.append(book)
+    return books
+
+
+def measure(build: Callable[[], object]) -> Tuple[object, float, float]:
+    """Build an object and return it with its retained heap in MB and the build time."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0] / 1e6
+    tracemalloc.stop()
+    return result, size, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--books", type=int, default=100000)
+    args = parser.parse_args()
+    
+    lines = catalog_lines(args.books)
+    legacy, legacy_mb, _ = measure(lambda: load(lines, LegacyBook))
+    del legacy
+    books, slotted_mb, _ = measure(lambda: load(lines, Book))
+    catalog, catalog_mb, _ = measure(lambda: BookCatalog(load(lines, Book)))
+    
+    print(f"Libros: {args.books}")
+    for label, size in (
+        ("Dataclass con __dict__:", legacy_mb),
+        ("Book con __slots__:", slotted_mb),
+        ("BookCatalog (columnas):", catalog_mb),
+    ):
+        print(f"   {label:<26} {size:7.1f} MB ({size * 1e6 / args.books:5.0f} B/libro)")
+    
+    rows, rows_mb, rows_seconds = measure(lambda: pd.DataFrame([book.to_dict() for book in books]))
+    del rows
+    frame, frame_mb, frame_seconds = measure(catalog.to_pandas)
+    print("DataFrame de exportación:")
+    print(f"   {'Desde to_dict por libro:':<26} {rows_mb:7.1f} MB {rows_seconds:6.2f}s")
+    print(f"   {'Desde BookCatalog:':<26} {frame_mb:7.1f} MB {frame_seconds:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark: per-query latency with a fresh HTTP session vs the pooled one.
+
+Serves a fake YouTube results page from a local keep-alive HTTP server and
+runs the same searches two ways: opening a new InnerTubeSession for every
+query (what scrapetube does internally) and sharing one pooled session.
+Over loopback, connection setup is nearly free, so ``--connect-delay``
+emulates the TCP/TLS handshake cost of a real connection to YouTube by
+delaying the first response on every new connection.
+
+Usage:
+    python -m benchmarks.bench_session [--queries 300] [--workers 1 4] [--connect-delay 0.03]
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List
+
+from src.clients import InnerTubeSession
+
+
+def results_page(videos: int) -> bytes:
+    """Build a minimal results page in the shape the InnerTube parser expects."""
+    items = [
+        {"videoRenderer": {
+            "videoId": f"vid{i:08d}",
+            "title": {"runs": [{"text": f"Libro {i} - Autor audiolibro completo"}]},
+            "lengthText": {"simpleText": "1:02:03"},
+        }}
+        for i in range(videos)
+    ]
+    data = {"contents": {"sectionListRenderer": {"contents": [{"itemSectionRenderer": {"contents": items}}]}}}
+    html = (
+        '<html><script>ytcfg.set({"INNERTUBE_CONTEXT":{"client":{"clientVersion":"2.20240101"}},'
+        '"innertubeApiKey":"bench-key"});</script>'
+        f'<script>var ytInitialData = {json.dumps(data)};</script></html>'
+    )
+    return html.encode('utf-8')
+
+
+def start_server(page: bytes, connect_delay: float) -> ThreadingHTTPServer:
+    """Start the fake YouTube server on a free local port."""
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are separate writes; avoid Nagle/delayed-ACK stalls
+        disable_nagle_algorithm = True
+        
+        def setup(self):
+            super().setup()
+            self.fresh_connection = True
+        
+        def do_GET(self):
+            if self.fresh_connection:
+                time.sleep(connect_delay)
+                self.fresh_connection = False
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(search: Callable[[str], None], queries: int, workers: int) -> Dict[str, float]:
+    """Run the queries on a thread pool and summarize per-query latency."""
+    latencies: List[float] = []
+    lock = threading.Lock()
+    
+    def one(i: int):
+        start = time.perf_counter()
+        search(f"libro {i} autor audiolibro completo")
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(one, range(queries)))
+    wall = time.perf_counter() - start
+    
+    latencies.sort()
+    return {
+        'mean_ms': statistics.mean(latencies) * 1000,
+        'p50_ms': latencies[len(latencies) // 2] * 1000,
+        'p95_ms': latencies[int(len(latencies) * 0.95)] * 1000,
+        'queries_per_s': queries / wall,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--queries', type=int, default=300)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--videos', type=int, default=20, help='videos on the fake results page')
+    parser.add_argument('--connect-delay', type=float, default=0.03,
+                        help='seconds added to the first response of each connection')
+    args = parser.parse_args()
+    
+    server = start_server(results_page(args.videos), args.connect_delay)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    
+    def fresh_search(query: str):
+        session = InnerTubeSession(base_url=base_url)
+        try:
+            list(session.search(query, 3))
+        finally:
+            session.close()
+    
+    print(f"{args.queries} consultas, retardo de conexión {args.connect_delay * 1000:.0f} ms\n")
+    print(f"{'modo':<22}{'hilos':>6}{'media ms':>10}{'p50 ms':>9}{'p95 ms':>9}{'consultas/s':>13}")
+    for workers in args.workers:
+        pooled = InnerTubeSession(pool_size=max(workers, 1), base_url=base_url)
+        results = {
+            'sesión nueva/consulta': run(fresh_search, args.queries, workers),
+            'sesión compartida': run(lambda query: list(pooled.search(query, 3)), args.queries, workers),
+        }
+        pooled.close()
+        for mode, stats in results.items():
+            print(f"{mode:<22}{workers:>6}{stats['mean_ms']:>10.2f}{stats['p50_ms']:>9.2f}"
+                  f"{stats['p95_ms']:>9.2f}{stats['queries_per_s']:>13.1f}")
+        fresh, shared = results.values()
+        print(f"{'':<22}{'':>6}  latencia media {(shared['mean_ms'] / fresh['mean_ms'] - 1) * 100:+.0f}%\n")
+    
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
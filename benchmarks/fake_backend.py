@@ -0,0 +1,105 @@
+"""
+Local stand-ins for YouTube used by the benchmarks: a fake search backend
+and synthetic book catalogs.
+"""
+
+import random
+import threading
+import time
+import zlib
+from typing import List
+
+from src.clients.search_backend import SearchBackend
+from src.models.book import Book
+
+WORDS = [
+    "sombra", "casa", "noche", "río", "montaña", "mar", "ciudad", "memoria",
+    "silencio", "tiempo", "camino", "jardín", "fuego", "cielo", "tierra",
+    "voces", "isla", "sangre", "luz", "viento", "puerta", "sueños", "cartas",
+    "palabras", "historia", "muerte", "amor", "guerra", "lluvia", "espejo",
+]
+FIRST_NAMES = ["Juan", "Ana", "Pedro", "Rosa", "Manuel", "Julia", "Marcio", "Aída", "Frank", "Hilma"]
+SURNAMES = [
+    "Bosch", "Veloz", "Cartagena", "Contín", "Hernández", "Pérez", "Valdez", "Mir",
+    "Incháustegui", "Ureña", "Báez", "Lantigua", "Cestero", "Avelino", "Mejía", "Rueda",
+]
+DISTRACTORS = [
+    "Música relajante para dormir", "Resumen del capítulo", "Tutorial de lectura rápida",
+    "Trailer oficial", "Entrevista al autor", "Clase de literatura",
+]
+DURATIONS = ["8:05", "45:12", "1:12:40", "2:01:33", "3:15:02", "N/A"]
+
+
+def synthetic_catalog(size: int, seed: int = 42) -> List[Book]:
+    """
+    Build a catalog of made-up books with a realistic author distribution.
+    
+    Args:
+        size: Number of books
+        seed: Random seed (same seed, same catalog)
+    
+    Returns:
+        List of Book objects numbered from 1
+    """
+    rng = random.Random(seed)
+    authors = [
+        f"{rng.choice(FIRST_NAMES)} {rng.choice(SURNAMES)} {rng.choice(SURNAMES)}{i}"
+        for i in range(max(10, size // 4))
+    ]
+    books = []
+    for numero in range(1, size + 1):
+        titulo = " ".join(rng.sample(WORDS, rng.randint(2, 4))).capitalize() + f" {numero}"
+        books.append(Book(numero=numero, titulo=titulo, autor=rng.choice(authors), año=str(rng.randint(1900, 2024))))
+    return books
+
+
+class FakeSearchBackend(SearchBackend):
+    """
+    Search backend answering from memory with configurable latency.
+    
+    A query is a hit with probability ``hit_rate`` (decided by a stable hash
+    of the query, so runs are repeatable); a hit echoes the query back as the
+    title of one of the videos, which matches the book it was built from.
+    The other videos are distractors with random durations.
+    """
+    
+    def __init__(self, latency: float = 0.0, hit_rate: float = 0.5, seed: int = 0):
+        """
+        Initialize the backend.
+        
+        Args:
+            latency: Seconds each search takes
+            hit_rate: Fraction of queries that return the book
+            seed: Changes which queries hit
+        """
+        self.latency = latency
+        self.hit_rate = hit_rate
+        self.seed = seed
+        self._requests = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def requests(self) -> int:
+        return self._requests
+    
+    def search(self, query: str, limit: int) -> List[dict]:
+        """Return ``limit`` fake renderers for a query."""
+        with self._lock:
+            self._requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        
+        digest = zlib.crc32(f"{self.seed}|{query}".encode('utf-8'))
+        rng = random.Random(digest)
+        hit = (digest % 1000) < self.hit_rate * 1000
+        hit_position = rng.randrange(limit) if hit else -1
+        
+        videos = []
+        for position in range(limit):
+            title = query if position == hit_position else f"{rng.choice(DISTRACTORS)} {rng.randint(1, 999)}"
+            videos.append({
+                'videoId': f"{digest:08x}{position:03d}",
+                'title': {'runs': [{'text': title}]},
+                'lengthText': {'simpleText': rng.choice(DURATIONS)},
+            })
+        return videos
@@ -0,0 +1,177 @@
+"""
+Benchmark suite: end-to-end pipeline throughput plus microbenchmarks.
+
+Runs AudiobookService.process_multiple_books against FakeSearchBackend on
+synthetic catalogs of growing size, then times the hot helpers one by one.
+Results are written as JSON (with the git commit) so runs can be compared;
+``--compare`` prints the ratio of every metric against an earlier file.
+
+Usage:
+    python -m benchmarks.suite [--sizes 50 1000 10000 100000] [--latency 0]
+        [--hit-rate 0.5] [--workers 1] [--output FILE] [--compare OLD.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict
+
+from benchmarks.fake_backend import DURATIONS, FakeSearchBackend, synthetic_catalog
+from src.clients import YouTubeClient
+from src.models.book import Book
+from src.services import AudiobookService
+from src.utils import config, FileHandler
+from src.utils.metrics import metrics
+
+
+def git_commit() -> str:
+    """Current commit hash, or 'unknown' outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def bench_pipeline(size: int, latency: float, hit_rate: float, workers: int) -> Dict[str, float]:
+    """Process a synthetic catalog end to end and report throughput."""
+    books = synthetic_catalog(size)
+    client = YouTubeClient(
+        videos_per_search=config.VIDEOS_PER_SEARCH,
+        backend=FakeSearchBackend(latency=latency, hit_rate=hit_rate)
+    )
+    service = AudiobookService(client)
+    metrics.reset()
+    
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, stats = service.process_multiple_books(books, show_progress=False, max_workers=workers)
+    seconds = time.perf_counter() - start
+    
+    return {
+        'books': size,
+        'seconds': seconds,
+        'books_per_s': size / seconds,
+        'requests': stats['requests'],
+        'requests_per_book': stats['requests_per_book'],
+        'found': stats['found'],
+        'partial': stats['partial'],
+        'not_found': stats['not_found'],
+        'strategies': service.strategy_hit_rates(),
+    }
+
+
+def time_per_call(func: Callable[[int], object], calls: int) -> float:
+    """Microseconds per call of ``func(i)`` over ``calls`` iterations."""
+    start = time.perf_counter()
+    for i in range(calls):
+        func(i)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def bench_micro(calls: int, excel_books: int) -> Dict[str, float]:
+    """Time the hot helpers of the pipeline (microseconds per call or per book)."""
+    books = synthetic_catalog(2000, seed=7)
+    titles = [f"{book.titulo} - {book.autor} audiolibro completo" for book in books]
+    lines = [f"{book.titulo} | {book.autor} | {book.año}" for book in books]
+    client = YouTubeClient()
+    client.build_signatures(books)
+    n = len(books)
+    
+    results = {
+        'normalize_text_us': time_per_call(lambda i: client._normalize_text(titles[i % n]), calls),
+        'matches_book_us': time_per_call(
+            lambda i: client._matches_book(titles[i % n], books[(i * 7) % n].titulo, books[(i * 7) % n].autor), calls
+        ),
+        'classify_content_us': time_per_call(
+            lambda i: client._classify_content(titles[i % n], DURATIONS[i % len(DURATIONS)]), calls
+        ),
+        'create_from_text_us': time_per_call(lambda i: Book.create_from_text(i, lines[i % n]), calls),
+    }
+    
+    export = synthetic_catalog(excel_books, seed=11)
+    for book in export[::2]:
+        book.mark_as_found("https://www.youtube.com/watch?v=xxxxxxxxxxx", "1:02:03", "Lectura Completa")
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "bench.xlsx")
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            FileHandler.save_to_excel(export, filename)
+        seconds = time.perf_counter() - start
+    results['save_to_excel_us_per_book'] = seconds / excel_books * 1e6
+    results['save_to_excel_books'] = excel_books
+    return results
+
+
+def compare(current: dict, baseline: dict):
+    """Print each metric next to the baseline value and their ratio."""
+    print(f"\nComparación con {baseline['meta']['commit']} ({baseline['meta']['timestamp']}), >1x = más rápido:")
+    old_pipeline = {run['books']: run for run in baseline.get('pipeline', [])}
+    for run in current['pipeline']:
+        old = old_pipeline.get(run['books'])
+        if old:
+            print(f"   pipeline {run['books']:>7} libros: {old['books_per_s']:10.1f} -> "
+                  f"{run['books_per_s']:10.1f} libros/s ({run['books_per_s'] / old['books_per_s']:.2f}x)")
+    for name, value in current['micro'].items():
+        old = baseline.get('micro', {}).get(name)
+        if old and not name.endswith('_books'):
+            print(f"   {name:<24} {old:10.3f} -> {value:10.3f} ({old / value:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 1000, 10000, 100000])
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds per fake search')
+    parser.add_argument('--hit-rate', type=float, default=0.5, help='fraction of queries that find the book')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--calls', type=int, default=20000, help='iterations per microbenchmark')
+    parser.add_argument('--excel-books', type=int, default=5000)
+    parser.add_argument('--output', help='JSON file (default: .cache/benchmarks/<commit>-<time>.json)')
+    parser.add_argument('--compare', help='earlier JSON result to compare against')
+    args = parser.parse_args()
+    
+    meta = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'latency': args.latency,
+        'hit_rate': args.hit_rate,
+        'workers': args.workers,
+    }
+    results = {'meta': meta, 'pipeline': [], 'micro': {}}
+    
+    print(f"Pipeline (latencia {args.latency * 1000:.0f} ms, aciertos {args.hit_rate:.0%}, hilos {args.workers}):")
+    for size in args.sizes:
+        run = bench_pipeline(size, args.latency, args.hit_rate, args.workers)
+        results['pipeline'].append(run)
+        print(f"   {size:>7} libros: {run['seconds']:8.2f}s  {run['books_per_s']:10.1f} libros/s  "
+              f"{run['requests_per_book']:.2f} peticiones/libro")
+    
+    results['micro'] = bench_micro(args.calls, args.excel_books)
+    print("Microbenchmarks:")
+    for name, value in results['micro'].items():
+        print(f"   {name:<24} {value:10.3f}")
+    
+    output = args.output or os.path.join(
+        config.CACHE_DIR, "benchmarks", f"{meta['commit']}-{meta['timestamp'].replace(':', '')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResultados: {output}")
+    
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,63 +5,558 @@ Books Eater - Dominican Audiobooks Finder
 Searches for Dominican literature audiobooks on YouTube
 """
 
-from src.clients import YouTubeClient
-from src.services import AudiobookService
-from src.utils import config, FileHandler, DOMINICAN_BOOKS
+import argparse
+import asyncio
+import contextlib
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
+
+from src.clients import (
+    AsyncInnerTubeBackend, AsyncInnerTubeSession, AsyncYouTubeClient, InnerTubeBackend,
+    InnerTubeSession, RecordingBackend, ReplayBackend, YouTubeClient
+)
+from src.services import AsyncAudiobookService, AudiobookService, QueryPlanner
+from src.utils import config, CatalogCache, FileHandler, DOMINICAN_BOOKS, SearchCache, RunJournal, VideoIndex, RateLimiter, SearchArchive, StrategyStats, NegativeCache
+from src.utils.analytics import build_report, write_report
 from src.utils.dominican_books import get_books_as_objects
+from src.utils.keyword_classifier import KeywordClassifier
+from src.utils.keyword_rules import load_keyword_rules
+from src.utils.result_sink import ResultSink
+from src.utils.metrics import metrics
+from src.utils.sharding import (
+    find_shards, merge_shard_counters, merge_shards, parse_shard, remove_shard_files,
+    save_shard_stats, select_shard, shard_metrics_path, shard_paths
+)
+from src.utils.text import book_key, normalize_text
 
 
-def main() -> None:
-    """Main entry point for the application."""
-    print(f"\n{'='*60}")
-    print("Books Eater - Buscador de Audiolibros Dominicanos")
-    print(f"{'='*60}\n")
+def shard_arg(text: str):
+    """argparse type for --shard i/N."""
+    try:
+        return parse_shard(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Buscador de audiolibros dominicanos en YouTube")
+    parser.add_argument(
+        "command", nargs="?", default="run", choices=["run", "crawl", "merge"],
+        help="run: buscar el catálogo (por defecto); crawl: indexar canales y listas de audiolibros; "
+             "merge: combinar los resultados de los shards"
+    )
+    parser.add_argument(
+        "--channel", action="append", default=[],
+        help="Canal a indexar con 'crawl' (URL, @usuario o id); se puede repetir"
+    )
+    parser.add_argument(
+        "--playlist", action="append", default=[],
+        help="Lista de reproducción a indexar con 'crawl' (id); se puede repetir"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=config.MAX_WORKERS,
+        help=f"Libros buscados en paralelo (por defecto: {config.MAX_WORKERS})"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="No usar la caché de búsquedas en disco"
+    )
+    parser.add_argument(
+        "--refresh", action="store_true",
+        help="Ignorar la caché existente y guardar resultados nuevos"
+    )
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="Continuar una ejecución interrumpida usando el journal de progreso"
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Buscar solo libros nuevos, no encontrados, parciales o antiguos"
+    )
+    parser.add_argument(
+        "--max-age", type=float, default=config.INCREMENTAL_MAX_AGE_DAYS,
+        help=f"Días tras los cuales se vuelve a buscar un libro encontrado "
+             f"(por defecto: {config.INCREMENTAL_MAX_AGE_DAYS:g})"
+    )
+    parser.add_argument(
+        "--hedge-delay", type=float, default=config.HEDGE_DELAY, metavar="SECONDS",
+        help="Lanzar las estrategias de búsqueda en paralelo, escalonadas por SECONDS "
+             "(0 = todas a la vez)"
+    )
+    parser.add_argument(
+        "--recheck", action="append", default=[], metavar="TITULO",
+        help="Volver a buscar este libro aunque no se encontrara hace poco; se puede repetir"
+    )
+    parser.add_argument(
+        "--recheck-misses", action="store_true",
+        help="Volver a buscar todos los libros no encontrados en ejecuciones recientes"
+    )
+    parser.add_argument(
+        "--fixed-order", action="store_true",
+        help="Probar siempre todas las estrategias en el orden fijo, sin aprender de ejecuciones previas"
+    )
+    parser.add_argument(
+        "--no-dedup", action="store_true",
+        help="Buscar cada fila del catálogo aunque repita una obra de otra fila"
+    )
+    parser.add_argument(
+        "--plan-by-author", action="store_true",
+        help="Hacer primero una búsqueda amplia por autor y resolver localmente sus libros"
+    )
+    parser.add_argument(
+        "--async", dest="use_async", action="store_true",
+        help="Buscar con asyncio (requiere aiohttp) en lugar de hilos"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=config.ASYNC_CONCURRENCY,
+        help=f"Libros en curso a la vez con --async (por defecto: {config.ASYNC_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--books", default=config.BOOKS_FILE, metavar="ARCHIVO",
+        help=f"Catálogo a buscar: texto 'Título | Autor | Año', .csv, .jsonl o .parquet "
+             f"(por defecto: {config.BOOKS_FILE})"
+    )
+    sharding = parser.add_mutually_exclusive_group()
+    sharding.add_argument(
+        "--shard", type=shard_arg, metavar="i/N",
+        help=f"Buscar solo la parte i de N del catálogo y guardarla en '{config.SHARD_DIR}' "
+             f"(combinar después con 'merge')"
+    )
+    sharding.add_argument(
+        "--processes", type=int, default=1,
+        help="Repartir el catálogo en N shards buscados por procesos locales y combinarlos al final"
+    )
+    parser.add_argument(
+        "--shards", type=int, metavar="N",
+        help="Número de shards a combinar con 'merge' (por defecto: el único encontrado)"
+    )
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument(
+        "--record", action="store_true",
+        help=f"Guardar las respuestas de búsqueda en '{config.SEARCH_ARCHIVE_FILE}'"
+    )
+    archive.add_argument(
+        "--replay", action="store_true",
+        help="Reprocesar usando solo las respuestas grabadas, sin conexión"
+    )
+    archive.add_argument(
+        "--replay-strict", action="store_true",
+        help="Como --replay, pero las búsquedas que no estén grabadas cuentan como errores "
+             "en lugar de resultados vacíos"
+    )
+    parser.set_defaults(rate_share=1.0)
+    args = parser.parse_args()
+    args.replay = args.replay or args.replay_strict
+    return args
+
+
+def crawl(args: argparse.Namespace) -> None:
+    """Crawl audiobook channels and playlists into the local video index."""
+    channels = args.channel or config.CRAWL_CHANNELS
+    playlists = args.playlist or config.CRAWL_PLAYLISTS
+    if not channels and not playlists:
+        print("No hay canales ni listas configurados (use --channel/--playlist o Config.CRAWL_CHANNELS)")
+        return
+    
+    youtube_client = YouTubeClient(videos_per_search=config.VIDEOS_PER_SEARCH)
+    video_index = VideoIndex(config.VIDEO_INDEX_FILE)
+    
+    sources = [('canal', channel, youtube_client.crawl_channel) for channel in channels]
+    sources += [('lista', playlist, youtube_client.crawl_playlist) for playlist in playlists]
+    for kind, source, crawl_source in sources:
+        try:
+            print(f"Indexando {kind} {source}...")
+            videos = crawl_source(source, config.CRAWL_LIMIT)
+            print(f"   {video_index.add_many(videos, source)} videos")
+        except Exception as e:
+            print(f"   Error indexando {source}: {e}")
+    
+    print(f"\nÍndice local: {len(video_index)} videos en '{config.VIDEO_INDEX_FILE}'")
+    video_index.close()
+    youtube_client.close()
+
+
+def run_async(audiobook_service: AsyncAudiobookService, books, args: argparse.Namespace, previous_results):
+    """
+    Run the async pipeline, keeping its partial results on Ctrl-C.
     
-    # Try to load books from file first
-    books = FileHandler.load_books_from_file(config.BOOKS_FILE)
+    On Ctrl-C the pipeline stops and returns the books processed so far,
+    but asyncio.run re-raises KeyboardInterrupt afterwards and would drop
+    that return value, so the results are kept aside first.
+    
+    Returns:
+        Tuple of (updated books list, statistics dictionary)
+    """
+    outcome = []
+    
+    async def pipeline():
+        # The HTTP session is closed on the same event loop
+        try:
+            outcome.append(await audiobook_service.process_multiple_books_async(
+                books,
+                max_concurrency=max(1, args.concurrency),
+                resume=args.resume,
+                previous_results=previous_results,
+                max_age_days=args.max_age
+            ))
+        finally:
+            await audiobook_service.async_client.close()
+    
+    try:
+        asyncio.run(pipeline())
+    except KeyboardInterrupt:
+        if not outcome:
+            raise
+    return outcome[0]
+
+
+def run(args: argparse.Namespace) -> None:
+    """Search the catalog, or one shard of it, and save the results."""
+    # Try to load books from file first (parsed once, then from the catalog cache)
+    catalog_cache = CatalogCache(config.CATALOG_CACHE_DIR)
+    try:
+        books = catalog_cache.load(args.books)
+    except ImportError as e:
+        print(f"Error leyendo {args.books}: {e}")
+        return
 
     if books:
-        print(f"Cargados {len(books)} libros desde '{config.BOOKS_FILE}'")
+        source = " (caché)" if catalog_cache.hit else ""
+        print(f"Cargados {len(books)} libros desde '{args.books}'{source}")
     else:
+        if books is not None:
+            print(f"Advertencia: no se encontraron libros en '{args.books}' "
+                  f"(revise el formato y los nombres de columna)")
         # Use predefined dataset
         print(f"Usando dataset predefinido de literatura dominicana")
         books = get_books_as_objects()
         print(f"{len(books)} libros en el dataset")
     
+    journal_file = config.JOURNAL_FILE
+    if args.shard:
+        index, count = args.shard
+        books = select_shard(books, index, count)
+        root, ext = os.path.splitext(config.JOURNAL_FILE)
+        journal_file = f"{root}-{index}-of-{count}{ext}"
+        print(f"Shard {index}/{count}: {len(books)} libros")
+    else:
+        # Only the books being searched become Book objects
+        books = list(books)
+    
     print(f"\n{'='*60}")
     print("Iniciando búsqueda en YouTube...")
     print(f"{'='*60}\n")
     
+    # Persistent search cache (a replay needs none; a recording must reach YouTube)
+    cache = None
+    if not args.no_cache and not args.replay:
+        cache = SearchCache(
+            config.SEARCH_CACHE_FILE,
+            ttl_seconds=config.SEARCH_CACHE_TTL_HOURS * 3600,
+            max_entries=config.SEARCH_CACHE_MAX_ENTRIES
+        )
+        print(f"Caché de búsquedas: {config.SEARCH_CACHE_FILE} ({len(cache)} consultas)")
+    
+    # Search backend: live InnerTube, recorded, or replayed from the archive
+    if args.replay:
+        archive = SearchArchive(config.SEARCH_ARCHIVE_FILE)
+        backend = ReplayBackend(archive, strict=args.replay_strict)
+        print(f"Reproduciendo búsquedas grabadas: {config.SEARCH_ARCHIVE_FILE} ({len(archive)} consultas)")
+    else:
+        backend = InnerTubeBackend(
+            session=InnerTubeSession(
+                pool_size=max(config.HTTP_POOL_SIZE, args.workers),
+                timeout=config.HTTP_TIMEOUT
+            ),
+            # Local shards share one IP, so each gets its share of the rate
+            rate_limiter=RateLimiter(
+                rate=args.rate_share / config.SLEEP_BETWEEN_SEARCHES,
+                min_rate=args.rate_share * config.RATE_LIMIT_MIN,
+                max_rate=args.rate_share * config.RATE_LIMIT_MAX
+            ),
+            max_retries=config.SEARCH_MAX_RETRIES
+        )
+        if args.record:
+            backend = RecordingBackend(backend, SearchArchive(config.SEARCH_ARCHIVE_FILE))
+            print(f"Grabando búsquedas en: {config.SEARCH_ARCHIVE_FILE}")
+    
+    # Learned strategy order (a replay keeps the fixed order of the recording)
+    strategy_stats = None
+    if not args.fixed_order and not args.replay:
+        strategy_stats = StrategyStats(
+            config.STRATEGY_STATS_FILE,
+            min_queries=config.STRATEGY_MIN_QUERIES,
+            skip_below=config.STRATEGY_SKIP_BELOW
+        )
+    
     # Initialize YouTube client (no API key needed!)
-    youtube_client = YouTubeClient(videos_per_search=config.VIDEOS_PER_SEARCH)
+    youtube_client = YouTubeClient(
+        videos_per_search=config.VIDEOS_PER_SEARCH,
+        cache=cache,
+        refresh_cache=args.refresh or args.record,
+        hedge_delay=args.hedge_delay,
+        classifier=KeywordClassifier(load_keyword_rules(config.KEYWORD_RULES_FILE)),
+        backend=backend,
+        strategy_stats=strategy_stats
+    )
     print("Cliente de YouTube inicializado (sin límites de API!)\n")
     
-    # Initialize service
-    audiobook_service = AudiobookService(youtube_client)
+    sink = None
+    try:
+        # Optional author-level query planner
+        planner = None
+        if args.plan_by_author:
+            planner = QueryPlanner(
+                youtube_client,
+                template=config.AUTHOR_QUERY_TEMPLATE,
+                limit=config.AUTHOR_QUERY_LIMIT,
+                min_books=config.AUTHOR_QUERY_MIN_BOOKS
+            )
     
-    # Process all books
-    books, stats = audiobook_service.process_multiple_books(books)
+        # Local index of crawled audiobook channels, if any
+        video_index = None
+        if os.path.exists(config.VIDEO_INDEX_FILE):
+            video_index = VideoIndex(config.VIDEO_INDEX_FILE)
+            print(f"Índice local de canales: {len(video_index)} videos")
     
-    if books:
-        print(f"\n{'='*60}")
-        print("Guardando resultados...")
-        print(f"{'='*60}\n")
+        # Confirmed misses are skipped until their re-check is due (a replay searches everything)
+        negative_cache = None
+        if not args.replay:
+            negative_cache = NegativeCache(config.NEGATIVE_CACHE_FILE, config.NEGATIVE_CACHE_SCHEDULE_DAYS)
+            if args.recheck_misses:
+                negative_cache.force_recheck()
+            recheck = {normalize_text(title) for title in args.recheck}
+            for book in books:
+                if normalize_text(book.titulo) in recheck:
+                    negative_cache.force_recheck(book.titulo, book.autor)
+            print(f"No encontrados conocidos: {len(negative_cache)} libros")
+    
+        # Results of the previous run for incremental mode
+        previous_results = None
+        if args.incremental:
+            previous_file = config.OUTPUT_CSV if os.path.exists(config.OUTPUT_CSV) else config.OUTPUT_FILE
+            previous_results = FileHandler.load_previous_results(previous_file)
+            print(f"Resultados previos: {len(previous_results)} libros en '{previous_file}'")
+    
+        # Finished books are streamed to the CSV (read the previous results first)
+        csv_file = shard_paths(config.SHARD_DIR, *args.shard)[0] if args.shard else config.OUTPUT_CSV
+        jsonl_file = config.OUTPUT_JSONL
+        if args.shard and jsonl_file:
+            # Each shard streams its own copy next to its CSV
+            jsonl_file = f"{os.path.splitext(csv_file)[0]}.jsonl"
+        sink = ResultSink(csv_file, jsonl_file, flush_every=config.RESULTS_FLUSH_EVERY)
+        print(f"Resultados en curso: {csv_file}")
+    
+        # Rows naming the same work are searched once (1.0 = identical keys only)
+        dedup_threshold = None if args.no_dedup else config.DEDUP_SIMILARITY
+    
+        # Initialize service (recording and replay run on the threaded path)
+        if args.use_async and (args.record or args.replay):
+            print("--async no se combina con --record/--replay; se usarán hilos")
+        if args.use_async and not (args.record or args.replay):
+            audiobook_service = AsyncAudiobookService(
+                AsyncYouTubeClient(
+                    youtube_client,
+                    AsyncInnerTubeBackend(
+                        backend,
+                        AsyncInnerTubeSession(pool_size=max(config.HTTP_POOL_SIZE, args.concurrency), timeout=config.HTTP_TIMEOUT)
+                    )
+                ),
+                journal=RunJournal(journal_file),
+                planner=planner,
+                video_index=video_index,
+                negative_cache=negative_cache,
+                sink=sink,
+                dedup_threshold=dedup_threshold
+            )
+        else:
+            audiobook_service = AudiobookService(
+                youtube_client,
+                journal=RunJournal(journal_file),
+                planner=planner,
+                video_index=video_index,
+                negative_cache=negative_cache,
+                sink=sink,
+                dedup_threshold=dedup_threshold
+            )
+    
+        # Process all books
+        if isinstance(audiobook_service, AsyncAudiobookService):
+            books, stats = run_async(audiobook_service, books, args, previous_results)
+        else:
+            books, stats = audiobook_service.process_multiple_books(
+                books,
+                max_workers=max(1, args.workers),
+                resume=args.resume,
+                previous_results=previous_results,
+                max_age_days=args.max_age
+            )
+        sink.close()
+    
+        if args.shard:
+            # Partial results, combined later by "main.py merge"
+            index, count = args.shard
+            stats_file = save_shard_stats(stats, config.SHARD_DIR, index, count)
+            metrics_file = shard_metrics_path(config.SHARD_DIR, index, count)
+            audiobook_service.export_metrics(stats, metrics_file, metrics_file.replace('.metrics.json', '.prom'))
+            audiobook_service.print_statistics(stats)
+            print(f"Shard {index}/{count} guardado en '{csv_file}' y '{stats_file}'")
+        elif books:
+            print(f"\n{'='*60}")
+            print("Guardando resultados...")
+            print(f"{'='*60}\n")
         
-        # Save to Excel
-        FileHandler.save_to_excel(books, config.OUTPUT_FILE)
+            # Per-stage latency and hit-rate metrics
+            audiobook_service.export_metrics(stats, config.METRICS_JSON_FILE, config.METRICS_PROM_FILE)
         
-        # Optionally save to CSV
-        FileHandler.save_to_csv(books, config.OUTPUT_CSV)
+            # Hit rates and audio hours per section, content type and author
+            report = build_report(books)
+            write_report(report, config.REPORT_JSON_FILE)
         
-        # Print statistics
-        audiobook_service.print_statistics(stats)
-
-        print(f"Archivos generados:")
-        print(f"   - {config.OUTPUT_FILE}")
-        print(f"   - {config.OUTPUT_CSV}")
+            # The CSV is already complete; the Excel file is built from it
+            FileHandler.save_stream_to_excel(config.OUTPUT_CSV, config.OUTPUT_FILE, report)
+            audiobook_service.print_statistics(stats, report)
         
+            print(f"Archivos generados:")
+            print(f"   - {config.OUTPUT_FILE}")
+            print(f"   - {config.OUTPUT_CSV}")
+            if config.OUTPUT_JSONL:
+                print(f"   - {config.OUTPUT_JSONL}")
+            print(f"   - {config.REPORT_JSON_FILE}")
+            print(f"   - {config.METRICS_JSON_FILE}")
+            print(f"   - {config.METRICS_PROM_FILE}")
+        
+        else:
+            print("\nNo se procesaron libros")
+    
+    finally:
+        # Also on errors and Ctrl-C, so recorded searches and streamed rows are not lost
+        if sink is not None:
+            sink.close()
+        youtube_client.close()
+        if strategy_stats is not None:
+            strategy_stats.close()
+        if negative_cache is not None:
+            negative_cache.close()
+        if cache is not None:
+            print(f"Caché de búsquedas: {cache.hits} aciertos, {cache.misses} fallos")
+            cache.close()
+        if args.replay:
+            print(f"Búsquedas no grabadas: {backend.misses}"
+                  + (" (contadas como errores de búsqueda)" if backend.strict else ""))
+
+
+def save_results(books, stats) -> None:
+    """Write the final Excel, CSV and report files and print the statistics."""
+    report = build_report(books)
+    write_report(report, config.REPORT_JSON_FILE)
+    FileHandler.save_to_excel(books, config.OUTPUT_FILE, report)
+    FileHandler.save_to_csv(books, config.OUTPUT_CSV)
+    if config.OUTPUT_JSONL:
+        sink = ResultSink(jsonl_file=config.OUTPUT_JSONL)
+        for book in books:
+            sink.write(book)
+        sink.close()
+    AudiobookService.export_metrics(stats, config.METRICS_JSON_FILE, config.METRICS_PROM_FILE)
+    AudiobookService.print_statistics(stats, report)
+    print(f"Archivos generados:")
+    print(f"   - {config.OUTPUT_FILE}")
+    print(f"   - {config.OUTPUT_CSV}")
+    if config.OUTPUT_JSONL:
+        print(f"   - {config.OUTPUT_JSONL}")
+    print(f"   - {config.REPORT_JSON_FILE}")
+    print(f"   - {config.METRICS_JSON_FILE}")
+    print(f"   - {config.METRICS_PROM_FILE}")
+
+
+def merge(args: argparse.Namespace, count: Optional[int] = None) -> None:
+    """Combine the shard results into the final output files."""
+    if count is None:
+        found = find_shards(config.SHARD_DIR)
+        if args.shards:
+            count = args.shards
+        elif len(found) == 1:
+            count = next(iter(found))
+        else:
+            runs = ", ".join(f"{n} ({len(indexes)} presentes)" for n, indexes in sorted(found.items()))
+            print(f"Indique el número de shards con --shards; encontrados en '{config.SHARD_DIR}': {runs or 'ninguno'}")
+            return
+    
+    try:
+        books, stats = merge_shards(config.SHARD_DIR, count)
+    except FileNotFoundError as e:
+        print(e)
+        return
+    print(f"Combinados {count} shards: {len(books)} libros")
+    
+    # Shard files do not carry the catalog section; take it from the catalog
+    try:
+        catalog = CatalogCache(config.CATALOG_CACHE_DIR).load(args.books)
+    except ImportError as e:
+        print(f"Secciones no disponibles, error leyendo {args.books}: {e}")
+        catalog = None
+    if catalog:
+        sections = {
+            book_key(titulo, autor): seccion
+            for titulo, autor, seccion in zip(catalog.column('titulo'), catalog.column('autor'), catalog.column('seccion'))
+        }
+        for book in books:
+            book.seccion = sections.get(book_key(book.titulo, book.autor), book.seccion)
+    
+    # Counters of every shard, exported with the merged statistics
+    metrics.reset()
+    merge_shard_counters(config.SHARD_DIR, count, metrics)
+    save_results(books, stats)
+
+
+def run_shard(args: argparse.Namespace) -> int:
+    """Run one local shard with its output going to a log file."""
+    index, count = args.shard
+    log_file = os.path.splitext(shard_paths(config.SHARD_DIR, index, count)[0])[0] + ".log"
+    with open(log_file, 'w', encoding='utf-8') as f, contextlib.redirect_stdout(f):
+        run(args)
+    return index
+
+
+def run_local_shards(args: argparse.Namespace) -> None:
+    """Search the catalog as N local shard processes, then merge them."""
+    count = args.processes
+    os.makedirs(config.SHARD_DIR, exist_ok=True)
+    remove_shard_files(config.SHARD_DIR)
+    
+    print(f"Buscando en {count} procesos (registros en '{config.SHARD_DIR}')...")
+    with ProcessPoolExecutor(max_workers=count) as executor:
+        futures = [
+            executor.submit(run_shard, argparse.Namespace(**{**vars(args), 'shard': (index, count), 'rate_share': 1 / count}))
+            for index in range(1, count + 1)
+        ]
+        for future in as_completed(futures):
+            try:
+                print(f"   Shard {future.result()}/{count} terminado")
+            except Exception as e:
+                print(f"   Error en un shard: {e}")
+    
+    merge(args, count)
+
+
+def main() -> None:
+    """Main entry point for the application."""
+    args = parse_args()
+    
+    print(f"\n{'='*60}")
+    print("Books Eater - Buscador de Audiolibros Dominicanos")
+    print(f"{'='*60}\n")
+    
+    if args.command == "crawl":
+        crawl(args)
+    elif args.command == "merge":
+        merge(args)
+    elif args.processes > 1:
+        run_local_shards(args)
     else:
-        print("\nNo se procesaron libros")
+        run(args)
 
 
 if __name__ == "__main__":
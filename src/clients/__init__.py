@@ -1,5 +1,11 @@
 """API clients for external services."""
 
+from .innertube import InnerTubeSession
+from .search_backend import SearchBackend, InnerTubeBackend, RecordingBackend, ReplayBackend
 from .youtube_client import YouTubeClient
+from .async_youtube_client import AsyncInnerTubeSession, AsyncInnerTubeBackend, AsyncYouTubeClient
 
-__all__ = ['YouTubeClient']
+__all__ = [
+    'InnerTubeSession', 'SearchBackend', 'InnerTubeBackend', 'RecordingBackend', 'ReplayBackend',
+    'YouTubeClient', 'AsyncInnerTubeSession', 'AsyncInnerTubeBackend', 'AsyncYouTubeClient'
+]
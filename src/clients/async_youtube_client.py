@@ -0,0 +1,301 @@
+"""Non-blocking YouTube search client built on asyncio and aiohttp."""
+
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency, only needed for --async
+    aiohttp = None
+
+from scrapetube.scrapetube import get_next_data, search_dict
+
+from .innertube import (
+    CHANNEL_LISTING, PLAYLIST_LISTING, SEARCH_LISTING, SEARCH_PARAMS, USER_AGENT,
+    channel_path, continuation_request, parse_page
+)
+from .search_backend import InnerTubeBackend
+from ..utils.metrics import metrics
+from .youtube_client import YouTubeClient
+
+
+class AsyncInnerTubeSession:
+    """
+    asyncio counterpart of InnerTubeSession.
+    
+    Sends the same page and continuation requests through one pooled
+    ``aiohttp.ClientSession`` and parses them with the same helpers, so it
+    returns the same renderer dictionaries.
+    """
+    
+    def __init__(self, pool_size: int = 100, timeout: float = 15.0, base_url: str = "https://www.youtube.com"):
+        """
+        Configure the session (it is opened on first use, inside the event loop).
+        
+        Args:
+            pool_size: Maximum simultaneous connections
+            timeout: Seconds before a request is abandoned
+            base_url: YouTube origin (overridable for local benchmarks)
+        """
+        if aiohttp is None:
+            raise ImportError("The async backend needs aiohttp: pip install aiohttp")
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.base_url = base_url.rstrip('/')
+        self._session: Optional["aiohttp.ClientSession"] = None
+    
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Open the pooled session on first use."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"User-Agent": USER_AGENT, "Accept-Language": "en"},
+                cookies={"CONSENT": "YES+cb"},
+            )
+        return self._session
+    
+    def _url(self, path: str) -> str:
+        """Resolve a path (or absolute URL) against the base URL."""
+        return path if path.startswith('http') else self.base_url + path
+    
+    async def search(self, query: str, limit: Optional[int] = None, pace: Optional[Callable[[], Awaitable[None]]] = None) -> List[dict]:
+        """
+        Search YouTube videos.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of videos (None for all)
+            pace: Awaited before each continuation page (e.g. a rate limiter)
+        
+        Returns:
+            List of ``videoRenderer`` dictionaries
+        """
+        path, api_path, selector_list, selector_item = SEARCH_LISTING
+        return await self._list_videos(
+            path, {"search_query": query, "sp": SEARCH_PARAMS},
+            api_path, selector_list, selector_item, limit, pace
+        )
+    
+    async def channel(self, channel: str, limit: Optional[int] = None, pace: Optional[Callable[[], Awaitable[None]]] = None) -> List[dict]:
+        """
+        List the videos of a channel.
+        
+        Args:
+            channel: Channel URL, "@username" or channel id
+            limit: Maximum number of videos (None for all)
+            pace: Awaited before each continuation page
+        
+        Returns:
+            List of ``videoRenderer`` dictionaries
+        """
+        path, api_path, selector_list, selector_item = CHANNEL_LISTING
+        return await self._list_videos(
+            channel_path(channel) + path, {"view": 0, "flow": "grid"},
+            api_path, selector_list, selector_item, limit, pace
+        )
+    
+    async def playlist(self, playlist_id: str, limit: Optional[int] = None, pace: Optional[Callable[[], Awaitable[None]]] = None) -> List[dict]:
+        """
+        List the videos of a playlist.
+        
+        Args:
+            playlist_id: Playlist id
+            limit: Maximum number of videos (None for all)
+            pace: Awaited before each continuation page
+        
+        Returns:
+            List of ``playlistVideoRenderer`` dictionaries
+        """
+        path, api_path, selector_list, selector_item = PLAYLIST_LISTING
+        return await self._list_videos(
+            path, {"list": playlist_id},
+            api_path, selector_list, selector_item, limit, pace
+        )
+    
+    async def _list_videos(
+        self,
+        path: str,
+        params: Dict[str, object],
+        api_path: str,
+        selector_list: str,
+        selector_item: str,
+        limit: Optional[int],
+        pace: Optional[Callable[[], Awaitable[None]]]
+    ) -> List[dict]:
+        """
+        Fetch a listing page and its continuations.
+        
+        Args:
+            path: Page path or absolute URL
+            params: Query string parameters of the page
+            api_path: InnerTube endpoint for continuation pages
+            selector_list: Key of the list holding the items on the first page
+            selector_item: Key of each video renderer
+            limit: Maximum number of videos (None for all)
+            pace: Awaited before each continuation page
+        
+        Returns:
+            Video renderer dictionaries
+        
+        Raises:
+            aiohttp.ClientResponseError: On a non-2xx response (e.g. 429 when throttled)
+            ValueError: If the page has no parseable InnerTube data
+        """
+        session = self._get_session()
+        async with session.get(self._url(path), params={**params, "ucbcb": 1}) as response:
+            response.raise_for_status()
+            html = await response.text()
+        context, data, next_data = parse_page(html, selector_list)
+        
+        videos = []
+        while True:
+            for video in search_dict(data, selector_item):
+                videos.append(video)
+                if len(videos) == limit:
+                    return videos
+            if not next_data:
+                return videos
+            if pace is not None:
+                await pace()
+            params, headers, body = continuation_request(context, next_data)
+            async with session.post(self._url(api_path), params=params, headers=headers, json=body) as response:
+                response.raise_for_status()
+                data = await response.json()
+            next_data = get_next_data(data)
+    
+    async def close(self):
+        """Close every pooled connection."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncInnerTubeBackend:
+    """
+    Live async searches, paced and counted by a sync InnerTubeBackend.
+    
+    Shares the network backend's rate limiter, request counter and failure
+    reporting, so async and threaded traffic are paced and reported together.
+    """
+    
+    def __init__(self, network: InnerTubeBackend, session: Optional[AsyncInnerTubeSession] = None):
+        """
+        Initialize the backend.
+        
+        Args:
+            network: Sync network backend providing limiter and counters
+            session: Pooled async HTTP session
+        """
+        self.network = network
+        self.session = session or AsyncInnerTubeSession()
+    
+    async def search(self, query: str, limit: int) -> List[dict]:
+        """
+        Run a live search, paced by the rate limiter and retried on failure.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of videos
+        
+        Returns:
+            Raw video renderer dictionaries
+        
+        Raises:
+            Exception: The last error once every retry has failed
+        """
+        limiter = self.network.rate_limiter
+        for attempt in range(self.network.max_retries + 1):
+            await self.network.pace_async()
+            start = time.perf_counter()
+            try:
+                videos = await self.session.search(query, limit, pace=self.network.pace_async)
+            except Exception as e:
+                self.network.report_failure(e)
+                if attempt == self.network.max_retries:
+                    raise
+                continue
+            finally:
+                metrics.observe('books_eater_request_seconds', time.perf_counter() - start)
+            limiter.on_success()
+            return videos
+        return []
+    
+    async def close(self):
+        """Close the async HTTP session."""
+        await self.session.close()
+
+
+class AsyncYouTubeClient:
+    """
+    Coroutine-based search front end for a YouTubeClient.
+    
+    Only the network calls are asynchronous. Query building, caching,
+    matching and classification are delegated to the wrapped YouTubeClient,
+    so results are identical to the sync path.
+    """
+    
+    def __init__(self, client: YouTubeClient, backend: Optional[AsyncInnerTubeBackend] = None):
+        """
+        Initialize the async client.
+        
+        Args:
+            client: Sync client providing cache, matching and rules; its
+                backend must be an InnerTubeBackend unless ``backend`` is given
+            backend: Async search backend
+        """
+        self.client = client
+        self.backend = backend or AsyncInnerTubeBackend(client.backend)
+    
+    async def fetch_videos(self, query: str, limit: int) -> List[Dict[str, str]]:
+        """
+        Run a YouTube search, going through the cache when available.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of videos to fetch
+        
+        Returns:
+            List of slim video records
+        """
+        cached = self.client.cached_videos(query, limit)
+        if cached is not None:
+            metrics.inc('books_eater_cache_hits_total')
+            return cached
+        
+        start = time.perf_counter()
+        videos = self.client._slim_videos(await self.backend.search(query, limit))
+        metrics.observe('books_eater_fetch_seconds', time.perf_counter() - start, source='network')
+        self.client.store_videos(query, limit, videos)
+        return videos
+    
+    async def search_audiobook(self, title: str, author: str, section: Optional[str] = None) -> Optional[Dict[str, str]]:
+        """
+        Search for an audiobook, trying the strategies in priority order.
+        
+        Args:
+            title: Book title
+            author: Author name
+            section: Catalog section of the book, used to rank strategies
+        
+        Returns:
+            Video info dictionary or None
+        """
+        for template, query in self.client.search_plan(title, author, section):
+            start = time.perf_counter()
+            try:
+                videos = await self.fetch_videos(query, self.client.videos_per_search)
+                result = self.client.pick_result(videos, title, author)
+            except Exception as e:
+                self.client.count_search_error(e)
+                result = None
+            else:
+                self.client.record_strategy(template, author, section, result)
+            self.client.record_query(template, time.perf_counter() - start, result)
+            if result:
+                return result
+        return None
+    
+    async def close(self):
+        """Close the async search backend."""
+        await self.backend.close()
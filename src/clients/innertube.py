@@ -0,0 +1,229 @@
+"""Pooled HTTP session for YouTube's InnerTube web endpoints."""
+
+import json
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from scrapetube.scrapetube import get_json_from_html, get_next_data, search_dict
+
+# Search filter "sort by relevance, videos only" (same as scrapetube's default)
+SEARCH_PARAMS = "CAASAhAB"
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
+)
+
+# (page path, continuation endpoint, list key, item key) of each listing
+SEARCH_LISTING = ("/results", "/youtubei/v1/search", "contents", "videoRenderer")
+CHANNEL_LISTING = ("/videos", "/youtubei/v1/browse", "contents", "videoRenderer")
+PLAYLIST_LISTING = ("/playlist", "/youtubei/v1/browse", "playlistVideoListRenderer", "playlistVideoRenderer")
+
+
+def parse_page(html: str, selector_list: str) -> Tuple[dict, Optional[dict], Optional[dict]]:
+    """
+    Extract the InnerTube context and first page of items from a listing page.
+    
+    Args:
+        html: HTML of the results, channel or playlist page
+        selector_list: Key of the list holding the items
+    
+    Returns:
+        Tuple (context, data, next_data): the client context and API key
+        needed for continuations, the item list, and the continuation
+        token (None on the last page)
+    
+    Raises:
+        ValueError: If the page has no parseable InnerTube data
+    """
+    client = json.loads(get_json_from_html(html, "INNERTUBE_CONTEXT", 2, '"}},') + '"}}')["client"]
+    context = {
+        "client": client,
+        "api_key": get_json_from_html(html, "innertubeApiKey", 3),
+        "headers": {"X-YouTube-Client-Name": "1", "X-YouTube-Client-Version": client["clientVersion"]},
+    }
+    data = json.loads(get_json_from_html(html, "var ytInitialData = ", 0, "};") + "}")
+    data = next(search_dict(data, selector_list), None)
+    return context, data, get_next_data(data)
+
+
+def continuation_request(context: dict, next_data: dict) -> Tuple[Dict[str, str], Dict[str, str], dict]:
+    """
+    Build the InnerTube call fetching the next page of a listing.
+    
+    Args:
+        context: Context returned by parse_page
+        next_data: Continuation token of the current page
+    
+    Returns:
+        Tuple of (query params, headers, JSON body)
+    """
+    body = {
+        "context": {"clickTracking": next_data["click_params"], "client": context["client"]},
+        "continuation": next_data["token"],
+    }
+    return {"key": context["api_key"]}, context["headers"], body
+
+
+def channel_path(channel: str) -> str:
+    """
+    Resolve a channel reference to its page path or URL.
+    
+    Args:
+        channel: Channel URL, "@username" or channel id
+    
+    Returns:
+        Absolute URL or path of the channel page
+    """
+    if channel.startswith('http'):
+        return channel.rstrip('/')
+    if channel.startswith('@'):
+        return f"/{channel}"
+    return f"/channel/{channel}"
+
+
+class InnerTubeSession:
+    """
+    Long-lived, keep-alive HTTP session for YouTube searches and listings.
+    
+    Issues the same requests as scrapetube (initial HTML page, then
+    InnerTube continuation calls) and yields the same renderer dictionaries,
+    but every call reuses one pooled ``requests.Session`` instead of opening
+    a new one, so TCP/TLS setup is paid once per connection rather than once
+    per query. Per-request headers are passed explicitly and the session is
+    never mutated after construction, so it is safe to share between threads.
+    """
+    
+    def __init__(self, pool_size: int = 16, timeout: float = 15.0, base_url: str = "https://www.youtube.com"):
+        """
+        Create the pooled session.
+        
+        Args:
+            pool_size: Connections kept alive (at least the number of workers)
+            timeout: Seconds before a request is abandoned
+            base_url: YouTube origin (overridable for local benchmarks)
+        """
+        self.timeout = timeout
+        self.base_url = base_url.rstrip('/')
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._session.headers["User-Agent"] = USER_AGENT
+        self._session.headers["Accept-Language"] = "en"
+        self._session.cookies.set("CONSENT", "YES+cb", domain=".youtube.com")
+    
+    def search(self, query: str, limit: Optional[int] = None, pace: Optional[Callable[[], None]] = None) -> Iterator[dict]:
+        """
+        Search YouTube videos.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of videos (None for all)
+            pace: Called before each continuation page (e.g. a rate limiter)
+        
+        Yields:
+            ``videoRenderer`` dictionaries
+        """
+        path, api_path, selector_list, selector_item = SEARCH_LISTING
+        return self._iter_videos(
+            path, {"search_query": query, "sp": SEARCH_PARAMS},
+            api_path, selector_list, selector_item, limit, pace
+        )
+    
+    def channel(self, channel: str, limit: Optional[int] = None, pace: Optional[Callable[[], None]] = None) -> Iterator[dict]:
+        """
+        List the videos of a channel.
+        
+        Args:
+            channel: Channel URL, "@username" or channel id
+            limit: Maximum number of videos (None for all)
+            pace: Called before each continuation page
+        
+        Yields:
+            ``videoRenderer`` dictionaries
+        """
+        path, api_path, selector_list, selector_item = CHANNEL_LISTING
+        return self._iter_videos(
+            channel_path(channel) + path, {"view": 0, "flow": "grid"},
+            api_path, selector_list, selector_item, limit, pace
+        )
+    
+    def playlist(self, playlist_id: str, limit: Optional[int] = None, pace: Optional[Callable[[], None]] = None) -> Iterator[dict]:
+        """
+        List the videos of a playlist.
+        
+        Args:
+            playlist_id: Playlist id
+            limit: Maximum number of videos (None for all)
+            pace: Called before each continuation page
+        
+        Yields:
+            ``playlistVideoRenderer`` dictionaries
+        """
+        path, api_path, selector_list, selector_item = PLAYLIST_LISTING
+        return self._iter_videos(
+            path, {"list": playlist_id},
+            api_path, selector_list, selector_item, limit, pace
+        )
+    
+    def _url(self, path: str) -> str:
+        """Resolve a path (or absolute URL) against the base URL."""
+        return path if path.startswith('http') else self.base_url + path
+    
+    def _iter_videos(
+        self,
+        path: str,
+        params: Dict[str, object],
+        api_path: str,
+        selector_list: str,
+        selector_item: str,
+        limit: Optional[int],
+        pace: Optional[Callable[[], None]]
+    ) -> Iterator[dict]:
+        """
+        Walk a listing page and its continuations, yielding video renderers.
+        
+        Args:
+            path: Page path or absolute URL
+            params: Query string parameters of the page
+            api_path: InnerTube endpoint for continuation pages
+            selector_list: Key of the list holding the items on the first page
+            selector_item: Key of each video renderer
+            limit: Maximum number of videos (None for all)
+            pace: Called before each continuation page
+        
+        Yields:
+            Video renderer dictionaries
+        
+        Raises:
+            requests.HTTPError: On a non-2xx response (e.g. 429 when throttled)
+            ValueError: If the page has no parseable InnerTube data
+        """
+        response = self._session.get(self._url(path), params={**params, "ucbcb": 1}, timeout=self.timeout)
+        response.raise_for_status()
+        context, data, next_data = parse_page(response.text, selector_list)
+        
+        count = 0
+        while True:
+            for video in search_dict(data, selector_item):
+                yield video
+                count += 1
+                if count == limit:
+                    return
+            if not next_data:
+                return
+            if pace is not None:
+                pace()
+            params, headers, body = continuation_request(context, next_data)
+            response = self._session.post(
+                self._url(api_path), params=params, headers=headers, json=body, timeout=self.timeout
+            )
+            response.raise_for_status()
+            data = response.json()
+            next_data = get_next_data(data)
+    
+    def close(self):
+        """Close every pooled connection."""
+        self._session.close()
@@ -0,0 +1,268 @@
+"""Pluggable sources of raw YouTube search results."""
+
+import threading
+from typing import List, Optional
+
+import requests
+
+from .innertube import InnerTubeSession
+from ..utils.metrics import metrics
+from ..utils.rate_limiter import RateLimiter
+from ..utils.search_archive import SearchArchive
+
+
+def is_throttled(error: Exception) -> bool:
+    """
+    Check whether a failed request looks like YouTube throttling us.
+    
+    A throttled request gets a 429/503 status, or a consent/captcha page
+    instead of results, which fails to parse.
+    
+    Args:
+        error: Exception raised by the request
+    
+    Returns:
+        True for throttling signals, False for other errors
+    """
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in (429, 503)
+    # aiohttp.ClientResponseError carries the status directly
+    status = getattr(error, 'status', None)
+    if isinstance(status, int):
+        return status in (429, 503)
+    return isinstance(error, (ValueError, KeyError, IndexError))
+
+
+class SearchBackend:
+    """
+    Source of raw ``videoRenderer`` dictionaries for a search query.
+    
+    YouTubeClient only calls ``search``; matching and classification stay
+    in the client, so any backend can feed them.
+    """
+    
+    # Limiter pacing the backend's network traffic (None if it has none)
+    rate_limiter: Optional[RateLimiter] = None
+    
+    @property
+    def requests(self) -> int:
+        """Number of network requests sent so far."""
+        return 0
+    
+    def search(self, query: str, limit: int) -> List[dict]:
+        """
+        Run a search.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of videos
+        
+        Returns:
+            Raw video renderer dictionaries
+        """
+        raise NotImplementedError
+    
+    def channel(self, channel: str, limit: Optional[int] = None) -> List[dict]:
+        """List the videos of a channel (network backends only)."""
+        raise NotImplementedError(f"{type(self).__name__} cannot list channels")
+    
+    def playlist(self, playlist_id: str, limit: Optional[int] = None) -> List[dict]:
+        """List the videos of a playlist (network backends only)."""
+        raise NotImplementedError(f"{type(self).__name__} cannot list playlists")
+    
+    def close(self):
+        """Release the backend's resources."""
+
+
+class InnerTubeBackend(SearchBackend):
+    """
+    Live YouTube searches through the pooled InnerTube session.
+    
+    Every HTTP request, continuation pages included, is paced by the shared
+    rate limiter and counted; failures are reported to the limiter and
+    searches are retried up to ``max_retries`` times.
+    """
+    
+    def __init__(
+        self,
+        session: Optional[InnerTubeSession] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = 2
+    ):
+        """
+        Initialize the backend.
+        
+        Args:
+            session: Pooled HTTP session shared by every search and listing
+            rate_limiter: Limiter pacing every request; share one instance
+                between backends to pace them together
+            max_retries: Retries of a search after throttling or errors
+        """
+        self.session = session or InnerTubeSession()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_retries = max_retries
+        self._requests = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def requests(self) -> int:
+        return self._requests
+    
+    def count_request(self):
+        """Count one network request (thread-safe)."""
+        with self._lock:
+            self._requests += 1
+    
+    def pace(self):
+        """Wait for the rate limiter and count the HTTP request that follows."""
+        self.rate_limiter.acquire()
+        self.count_request()
+    
+    async def pace_async(self):
+        """Async version of pace, for requests made by the async session."""
+        await self.rate_limiter.acquire_async()
+        self.count_request()
+    
+    def report_failure(self, error: Exception):
+        """
+        Tell the rate limiter about a failed request.
+        
+        Args:
+            error: Exception raised by the request
+        """
+        metrics.inc('books_eater_errors_total', stage='request', type=type(error).__name__)
+        if is_throttled(error):
+            self.rate_limiter.on_throttle()
+        else:
+            self.rate_limiter.on_error()
+    
+    def search(self, query: str, limit: int) -> List[dict]:
+        """
+        Run a live search, paced by the rate limiter and retried on failure.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of videos
+        
+        Returns:
+            Raw video renderer dictionaries
+        
+        Raises:
+            Exception: The last error once every retry has failed
+        """
+        for attempt in range(self.max_retries + 1):
+            self.pace()
+            try:
+                with metrics.timer('books_eater_request_seconds'):
+                    videos = list(self.session.search(query, limit, pace=self.pace))
+            except Exception as e:
+                self.report_failure(e)
+                if attempt == self.max_retries:
+                    raise
+                continue
+            self.rate_limiter.on_success()
+            return videos
+        return []
+    
+    def channel(self, channel: str, limit: Optional[int] = None) -> List[dict]:
+        """List the videos of a channel, paced by the rate limiter."""
+        self.pace()
+        return list(self.session.channel(channel, limit, pace=self.pace))
+    
+    def playlist(self, playlist_id: str, limit: Optional[int] = None) -> List[dict]:
+        """List the videos of a playlist, paced by the rate limiter."""
+        self.pace()
+        return list(self.session.playlist(playlist_id, limit, pace=self.pace))
+    
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
+
+
+class RecordingBackend(SearchBackend):
+    """
+    Wraps another backend and saves every raw search response to an archive.
+    
+    The archive can later be served by ReplayBackend to re-run matching and
+    classification without touching the network.
+    """
+    
+    def __init__(self, inner: SearchBackend, archive: SearchArchive):
+        """
+        Initialize the recorder.
+        
+        Args:
+            inner: Backend performing the real searches
+            archive: Archive the responses are appended to
+        """
+        self.inner = inner
+        self.archive = archive
+        self.rate_limiter = inner.rate_limiter
+    
+    @property
+    def requests(self) -> int:
+        return self.inner.requests
+    
+    def search(self, query: str, limit: int) -> List[dict]:
+        """Search with the wrapped backend and record the response."""
+        videos = self.inner.search(query, limit)
+        self.archive.put(query, limit, videos)
+        return videos
+    
+    def channel(self, channel: str, limit: Optional[int] = None) -> List[dict]:
+        """List a channel with the wrapped backend (not recorded)."""
+        return self.inner.channel(channel, limit)
+    
+    def playlist(self, playlist_id: str, limit: Optional[int] = None) -> List[dict]:
+        """List a playlist with the wrapped backend (not recorded)."""
+        return self.inner.playlist(playlist_id, limit)
+    
+    def close(self):
+        """Finish the archive and close the wrapped backend."""
+        self.archive.close()
+        self.inner.close()
+
+
+class ReplayBackend(SearchBackend):
+    """
+    Serves searches from a recorded archive, with no network and no sleeps.
+    
+    Queries missing from the archive return no videos (or raise KeyError
+    with ``strict``), so replays are fully deterministic.
+    """
+    
+    def __init__(self, archive: SearchArchive, strict: bool = False):
+        """
+        Initialize the replay backend.
+        
+        Args:
+            archive: Recorded search responses
+            strict: Raise KeyError for queries missing from the archive
+        """
+        self.archive = archive
+        self.strict = strict
+        self.misses = 0
+        self._lock = threading.Lock()
+    
+    def search(self, query: str, limit: int) -> List[dict]:
+        """
+        Return the recorded response of a query.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of videos
+        
+        Returns:
+            Recorded raw renderers (empty if the query was not recorded)
+        
+        Raises:
+            KeyError: If ``strict`` and the query was not recorded
+        """
+        videos = self.archive.get(query, limit)
+        if videos is None:
+            with self._lock:
+                self.misses += 1
+            if self.strict:
+                raise KeyError(query)
+            return []
+        return videos
@@ -1,8 +1,21 @@
 """YouTube scraper client for finding Dominican audiobooks."""
 
-from typing import Optional, List, Dict
-import scrapetube
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Optional, List, Dict, FrozenSet, Tuple
 import re
+import threading
+import time
+
+from .search_backend import InnerTubeBackend, SearchBackend
+from ..models.book import Book, parse_duration
+from ..utils.keyword_classifier import KeywordClassifier
+from ..utils.keyword_rules import KEYWORD_RULES
+from ..utils.matching import BookSignature
+from ..utils.metrics import metrics
+from ..utils.rate_limiter import RateLimiter
+from ..utils.search_cache import SearchCache
+from ..utils.strategy_stats import StrategyStats
+from ..utils.text import normalize_text
 
 
 class YouTubeClient:
@@ -11,22 +24,212 @@ class YouTubeClient:
     Specialized in finding Dominican literature audiobooks.
     """
     
-    def __init__(self, videos_per_search: int = 3):
+    # Query templates tried by search_audiobook, in priority order
+    SEARCH_STRATEGIES = [
+        "{title} {author} audiolibro completo",
+        "{title} {author} audiobook",
+        "{title} {author} libro completo",
+        "{title} audiolibro dominicano",
+        "{author} {title} lectura"
+    ]
+    
+    def __init__(
+        self,
+        videos_per_search: int = 3,
+        cache: Optional[SearchCache] = None,
+        refresh_cache: bool = False,
+        hedge_delay: Optional[float] = None,
+        classifier: Optional[KeywordClassifier] = None,
+        backend: Optional[SearchBackend] = None,
+        strategy_stats: Optional[StrategyStats] = None
+    ):
         """
         Initialize YouTube scraper client.
         
         Args:
             videos_per_search: Number of videos to analyze per search
+            cache: Optional persistent search cache
+            refresh_cache: Ignore cached entries but store fresh results
+            hedge_delay: If set, run the search strategies in parallel,
+                starting each one this many seconds after the previous
+                (0 starts them all at once). None keeps them sequential.
+            classifier: Keyword classifier for video titles
+                (defaults to the built-in keyword rules)
+            backend: Source of raw search results (defaults to live
+                InnerTube searches with the default rate limiter)
+            strategy_stats: Hit statistics used to reorder and skip search
+                strategies per book (None keeps the fixed order)
         """
         self.videos_per_search = videos_per_search
+        self.cache = cache
+        self.refresh_cache = refresh_cache
+        self.hedge_delay = hedge_delay
+        self.search_errors = 0
+        self._requests_lock = threading.Lock()
+        self.backend = backend or InnerTubeBackend()
+        self.classifier = classifier or KeywordClassifier(KEYWORD_RULES)
+        self.strategy_stats = strategy_stats
+        self._signatures: Dict[tuple, BookSignature] = {}
+        # Called with every batch of videos fetched by any query
+        self.on_videos: Optional[Callable[[List[Dict[str, str]]], None]] = None
+    
+    @property
+    def network_requests(self) -> int:
+        """Number of network requests sent by the backend."""
+        return self.backend.requests
+    
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Rate limiter of the backend (None for offline backends)."""
+        return self.backend.rate_limiter
+    
+    def fetch_videos(self, query: str, limit: int) -> List[Dict[str, str]]:
+        """
+        Run a YouTube search, going through the cache when available.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of videos to fetch
+            
+        Returns:
+            List of slim video records: {'id': str, 'title': str, 'duration': str}
+        """
+        cached = self.cached_videos(query, limit)
+        if cached is not None:
+            metrics.inc('books_eater_cache_hits_total')
+            return cached
+        
+        with metrics.timer('books_eater_fetch_seconds', source='network'):
+            videos = self._slim_videos(self.backend.search(query, limit))
+        self.store_videos(query, limit, videos)
+        return videos
+    
+    def cached_videos(self, query: str, limit: int) -> Optional[List[Dict[str, str]]]:
+        """
+        Look up a search in the cache, notifying listeners on a hit.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of videos to fetch
+            
+        Returns:
+            Cached slim video records, or None if they must be fetched
+        """
+        if self.cache is None or self.refresh_cache:
+            return None
+        cached = self.cache.get(query, limit)
+        if cached is not None:
+            self._notify(cached)
+        return cached
+    
+    def store_videos(self, query: str, limit: int, videos: List[Dict[str, str]]):
+        """
+        Cache freshly fetched videos and notify listeners.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of videos requested
+            videos: Slim video records returned by the search
+        """
+        if self.cache is not None:
+            self.cache.put(query, limit, videos)
+        self._notify(videos)
+    
+    def _slim_videos(self, videos) -> List[Dict[str, str]]:
+        """
+        Reduce scrapetube video renderers to slim records.
+        
+        Args:
+            videos: Iterable of scrapetube video dictionaries
+            
+        Returns:
+            List of {'id', 'title', 'duration'} records
+        """
+        slim = []
+        for video in videos:
+            video_id = video.get('videoId')
+            if not video_id:
+                continue
+            slim.append({
+                'id': video_id,
+                'title': video.get('title', {}).get('runs', [{}])[0].get('text', ''),
+                'duration': self._parse_duration(video)
+            })
+        return slim
+    
+    def crawl_channel(self, channel: str, limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        List the videos of a YouTube channel.
+        
+        Args:
+            channel: Channel URL, "@username" or channel id
+            limit: Maximum number of videos (None for all)
+            
+        Returns:
+            List of slim video records
+        """
+        return self._slim_videos(self.backend.channel(channel, limit))
+    
+    def crawl_playlist(self, playlist_id: str, limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        List the videos of a YouTube playlist.
+        
+        Args:
+            playlist_id: Playlist id
+            limit: Maximum number of videos (None for all)
+            
+        Returns:
+            List of slim video records
+        """
+        return self._slim_videos(self.backend.playlist(playlist_id, limit))
+    
+    def close(self):
+        """Close the search backend."""
+        self.backend.close()
+    
+    def _notify(self, videos: List[Dict[str, str]]):
+        """
+        Pass fetched videos to the ``on_videos`` listener, if any.
+        
+        Args:
+            videos: Slim video records
+        """
+        if self.on_videos is not None and videos:
+            try:
+                self.on_videos(videos)
+            except Exception as e:
+                print(f"   Error procesando videos: {e}")
     
-    def search_audiobook(self, title: str, author: str) -> Optional[Dict[str, str]]:
+    def build_result(self, video: Dict[str, str]) -> Optional[Dict[str, str]]:
+        """
+        Turn a video already matched to a book into a search result.
+        
+        Args:
+            video: Slim video record
+            
+        Returns:
+            Video info dictionary, or None if it is not likely an audiobook
+        """
+        title = video['title']
+        flags = self.classifier.analyze(title)
+        if not self._is_likely_audiobook(title, flags):
+            return None
+        
+        return {
+            'url': f"https://www.youtube.com/watch?v={video['id']}",
+            'duration': video['duration'],
+            'type': self._classify_content(title, video['duration'], flags),
+            'title': title
+        }
+    
+    def search_audiobook(self, title: str, author: str, section: Optional[str] = None) -> Optional[Dict[str, str]]:
         """
         Search for an audiobook on YouTube.
         
         Args:
             title: Book title
             author: Author name
+            section: Catalog section of the book, used to rank strategies
             
         Returns:
             Dictionary with video info if found, None otherwise
@@ -39,25 +242,154 @@ class YouTubeClient:
         """
         try:
             # Try different search strategies
-            search_queries = [
-                f"{title} {author} audiolibro completo",
-                f"{title} {author} audiobook",
-                f"{title} {author} libro completo",
-                f"{title} audiolibro dominicano",
-                f"{author} {title} lectura"
-            ]
+            plan = self.search_plan(title, author, section)
+            
+            if self.hedge_delay is not None:
+                return self._search_hedged(plan, title, author, section)
             
-            for query in search_queries:
-                result = self._search_with_query(query, title, author)
+            for template, query in plan:
+                result = self._search_with_query(query, title, author, template, section)
                 if result:
                     return result
             
             return None
             
         except Exception as e:
+            metrics.inc('books_eater_errors_total', stage='search', type=type(e).__name__)
+            return None
+    
+    def search_queries(self, title: str, author: str) -> List[str]:
+        """
+        Build the search queries for a book, in priority order.
+        
+        Args:
+            title: Book title
+            author: Author name
+            
+        Returns:
+            One query per search strategy
+        """
+        return [
+            template.format(title=title, author=author)
+            for template in self.SEARCH_STRATEGIES
+        ]
+    
+    def search_plan(self, title: str, author: str, section: Optional[str] = None) -> List[Tuple[str, str]]:
+        """
+        Choose the strategies to try for a book and build their queries.
+        
+        Without strategy statistics this is every strategy in the fixed
+        priority order; with them, the strategies are ranked by their
+        expected hit rate for the book's author and section, and those
+        that never pay off are skipped.
+        
+        Args:
+            title: Book title
+            author: Author name
+            section: Catalog section of the book
+            
+        Returns:
+            List of (template, query) tuples, in the order to try them
+        """
+        templates = self.SEARCH_STRATEGIES
+        if self.strategy_stats is not None:
+            templates = self.strategy_stats.rank(templates, author, section)
+            for template in self.SEARCH_STRATEGIES:
+                if template not in templates:
+                    metrics.inc('books_eater_strategy_skipped_total', template=template)
+        return [(template, template.format(title=title, author=author)) for template in templates]
+    
+    def _search_hedged(
+        self,
+        plan: List[Tuple[str, str]],
+        title: str,
+        author: str,
+        section: Optional[str] = None
+    ) -> Optional[Dict[str, str]]:
+        """
+        Run the search strategies concurrently, staggered by ``hedge_delay``.
+        
+        The result is the one of the highest-priority query that matches,
+        i.e. the same result the sequential loop returns. As soon as it is
+        known, queries not yet started are cancelled and the rest ignored.
+        Only the queries the sequential loop would have run (those up to
+        the winner) feed the strategy statistics; hedged queries of lower
+        priority would otherwise count as outcomes of a search that never
+        used them.
+        
+        Args:
+            plan: (template, query) tuples in priority order
+            title: Book title
+            author: Author name
+            section: Catalog section of the book
+            
+        Returns:
+            Video info dictionary or None
+        """
+        executor = ThreadPoolExecutor(max_workers=len(plan))
+        futures = []
+        state = {'next': 0}
+        
+        def record(index: int, result: Optional[Dict[str, str]], completed: bool):
+            if completed:
+                self.record_strategy(plan[index][0], author, section, result)
+        
+        try:
+            for i, (template, query) in enumerate(plan):
+                futures.append(executor.submit(self._run_query, query, title, author, template))
+                is_last = i == len(plan) - 1
+                done, result = self._resolve_in_order(
+                    futures, state, None if is_last else self.hedge_delay, record
+                )
+                if done:
+                    return result
             return None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
     
-    def _search_with_query(self, query: str, book_title: str, author: str) -> Optional[Dict[str, str]]:
+    @staticmethod
+    def _resolve_in_order(
+        futures: list,
+        state: dict,
+        timeout: Optional[float],
+        record: Optional[Callable[[int, Optional[Dict[str, str]], bool], None]] = None
+    ):
+        """
+        Consume finished futures in priority order until one has a result.
+        
+        Args:
+            futures: Submitted futures of _run_query, in priority order
+            state: Holds 'next', the index of the first unresolved future
+            timeout: Seconds to wait overall, or None to wait for all
+            record: Called with (index, result, completed) for each future
+                consumed, i.e. each query the sequential loop would have run
+            
+        Returns:
+            Tuple (done, result): done is True when a result was found or
+            every submitted future finished without one.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while state['next'] < len(futures):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                result, completed = futures[state['next']].result(timeout=remaining)
+            except FutureTimeoutError:
+                return False, None
+            if record is not None:
+                record(state['next'], result, completed)
+            if result:
+                return True, result
+            state['next'] += 1
+        return timeout is None, None
+    
+    def _search_with_query(
+        self,
+        query: str,
+        book_title: str,
+        author: str,
+        template: str = "other",
+        section: Optional[str] = None
+    ) -> Optional[Dict[str, str]]:
         """
         Execute a single search query on YouTube.
         
@@ -65,44 +397,131 @@ class YouTubeClient:
             query: Search query
             book_title: Original book title to match
             author: Original author name to match
+            template: Strategy template the query was built from (metrics label)
+            section: Catalog section of the book (strategy statistics)
             
         Returns:
             Video info dictionary or None
         """
+        result, completed = self._run_query(query, book_title, author, template)
+        if completed:
+            self.record_strategy(template, author, section, result)
+        return result
+    
+    def _run_query(
+        self,
+        query: str,
+        book_title: str,
+        author: str,
+        template: str = "other"
+    ) -> Tuple[Optional[Dict[str, str]], bool]:
+        """
+        Fetch and match one query, recording its latency but not its strategy outcome.
+        
+        Args:
+            query: Search query
+            book_title: Original book title to match
+            author: Original author name to match
+            template: Strategy template the query was built from (metrics label)
+            
+        Returns:
+            Tuple of (video info dictionary or None, whether the query
+            completed without an error)
+        """
+        start = time.perf_counter()
+        completed = True
         try:
-            videos = scrapetube.get_search(query, limit=self.videos_per_search, sleep=1)
+            videos = self.fetch_videos(query, self.videos_per_search)
+            result = self.pick_result(videos, book_title, author)
+        except Exception as e:
+            self.count_search_error(e)
+            result = None
+            completed = False
+        self.record_query(template, time.perf_counter() - start, result)
+        return result, completed
+    
+    def count_search_error(self, error: Exception):
+        """
+        Count a failed search for the run report (already reported to the limiter).
+        
+        Args:
+            error: Exception raised by the search
+        """
+        with self._requests_lock:
+            self.search_errors += 1
+        metrics.inc('books_eater_errors_total', stage='query', type=type(error).__name__)
+    
+    def record_strategy(
+        self,
+        template: str,
+        author: str,
+        section: Optional[str],
+        result: Optional[Dict[str, str]]
+    ):
+        """
+        Feed the outcome of a completed query to the strategy statistics.
+        
+        Failed queries are not recorded: they say nothing about the template.
+        
+        Args:
+            template: Strategy template the query was built from
+            author: Author of the searched book
+            section: Catalog section of the book
+            result: Result found by the query, or None
+        """
+        if self.strategy_stats is not None and template in self.SEARCH_STRATEGIES:
+            self.strategy_stats.record(template, author, section, bool(result))
+    
+    @staticmethod
+    def record_query(template: str, seconds: float, result: Optional[Dict[str, str]]):
+        """
+        Record the latency and outcome of one strategy query.
+        
+        Args:
+            template: Strategy template the query was built from
+            seconds: Time the query took, including matching
+            result: Result found by the query, or None
+        """
+        metrics.observe('books_eater_query_seconds', seconds, template=template)
+        metrics.inc('books_eater_strategy_queries_total', template=template)
+        if result:
+            metrics.inc('books_eater_strategy_hits_total', template=template)
+    
+    def pick_result(self, videos: List[Dict[str, str]], book_title: str, author: str) -> Optional[Dict[str, str]]:
+        """
+        Pick the first fetched video that matches the book and is an audiobook.
+        
+        Args:
+            videos: Slim video records returned by a query
+            book_title: Original book title to match
+            author: Original author name to match
             
-            for video in videos:
-                video_id = video.get('videoId')
-                if not video_id:
-                    continue
-                
-                # Get video metadata
-                title = video.get('title', {}).get('runs', [{}])[0].get('text', '')
-                duration = self._parse_duration(video)
-                
+        Returns:
+            Video info dictionary or None
+        """
+        with metrics.timer('books_eater_match_seconds'):
+            signature = self.signature_for(book_title, author)
+            matches = signature.matches_many([video['title'] for video in videos])
+            
+            mismatched = not_audiobook = 0
+            result = None
+            for video, is_match in zip(videos, matches):
                 # CRITICAL: First verify that the video matches the book and author
-                if not self._matches_book(title, book_title, author):
-                    continue
-                
-                # Then check if it's an audiobook
-                if not self._is_likely_audiobook(title):
+                if not is_match:
+                    mismatched += 1
                     continue
                 
-                # Classify content type
-                content_type = self._classify_content(title, duration)
-                
-                return {
-                    'url': f"https://www.youtube.com/watch?v={video_id}",
-                    'duration': duration,
-                    'type': content_type,
-                    'title': title
-                }
-            
-            return None
-            
-        except Exception as e:
-            return None
+                # Then check if it's an audiobook and classify it
+                result = self.build_result(video)
+                if result:
+                    break
+                not_audiobook += 1
+        
+        metrics.inc('books_eater_candidates_total', mismatched, outcome='title_mismatch')
+        metrics.inc('books_eater_candidates_total', not_audiobook, outcome='not_audiobook')
+        if result:
+            metrics.inc('books_eater_candidates_total', outcome='accepted')
+        return result
     
     def _parse_duration(self, video: dict) -> str:
         """
@@ -120,98 +539,76 @@ class YouTubeClient:
         except Exception:
             return 'N/A'
     
-    def _classify_content(self, title: str, duration: str) -> str:
+    def _classify_content(
+        self,
+        title: str,
+        duration: str,
+        flags: Optional[FrozenSet[str]] = None
+    ) -> str:
         """
         Classify the type of audiobook content based on title and duration.
         
         Args:
             title: Video title
             duration: Video duration
+            flags: Keyword rules matched by the title, if already computed
             
         Returns:
             Content type classification
         """
-        title_lower = title.lower()
+        if flags is None:
+            flags = self.classifier.analyze(title)
         
         # Check for complete audiobook indicators
-        if 'completo' in title_lower or 'complete' in title_lower:
-            if 'dramatización' in title_lower or 'dramatizado' in title_lower:
+        if 'complete' in flags:
+            if 'dramatized' in flags:
                 return "Dramatización Completa"
             return "Lectura Completa"
         
         # Check for professional narration
-        if 'audiolibro' in title_lower or 'audiobook' in title_lower:
+        if 'narration' in flags:
             return "Narración Profesional"
         
         # Check for dramatizations
-        if 'dramatización' in title_lower or 'teatro' in title_lower:
+        if 'drama' in flags:
             return "Dramatización"
         
         # Check for fragments
-        if any(word in title_lower for word in ['fragmento', 'capítulo', 'parte', 'extracto']):
+        if 'fragment' in flags:
             return "Fragmentos"
         
         # Check for analysis/review
-        if any(word in title_lower for word in ['análisis', 'reseña', 'resumen', 'comentario']):
+        if 'analysis' in flags:
             return "Análisis/Reseña"
         
         # Default classification based on duration
-        if duration != 'N/A':
-            try:
-                # Parse duration to minutes
-                parts = duration.split(':')
-                if len(parts) == 3:  # H:M:S
-                    minutes = int(parts[0]) * 60 + int(parts[1])
-                elif len(parts) == 2:  # M:S
-                    minutes = int(parts[0])
-                else:
-                    minutes = 0
-                
-                if minutes > 60:  # More than 1 hour
-                    return "Lectura Completa"
-                elif minutes > 15:
-                    return "Lectura Parcial"
-                else:
-                    return "Fragmentos"
-            except Exception:
-                pass
+        seconds = parse_duration(duration)
+        if seconds is not None:
+            if seconds > 3600:  # More than 1 hour
+                return "Lectura Completa"
+            elif seconds > 900:  # More than 15 minutes
+                return "Lectura Parcial"
+            else:
+                return "Fragmentos"
         
         return "Lectura Amateur"
     
-    def _is_likely_audiobook(self, title: str) -> bool:
+    def _is_likely_audiobook(self, title: str, flags: Optional[FrozenSet[str]] = None) -> bool:
         """
         Determine if a video is likely to be an audiobook.
         
         Args:
             title: Video title
+            flags: Keyword rules matched by the title, if already computed
             
         Returns:
             True if likely an audiobook, False otherwise
         """
-        title_lower = title.lower()
-        
-        # Positive indicators
-        positive_keywords = [
-            'audiolibro', 'audiobook', 'libro completo', 'lectura',
-            'narración', 'narrado', 'leído', 'dramatización',
-            'audio libro', 'voz humana', 'leer'
-        ]
-        
-        # Negative indicators (filter these out)
-        negative_keywords = [
-            'resumen', 'summary', 'trailer', 'preview',
-            'música', 'music', 'instrumental', 'karaoke',
-            'video oficial', 'official video', 'lyrics',
-            'tutorial', 'how to', 'como'
-        ]
-        
-        # Check for positive keywords
-        has_positive = any(keyword in title_lower for keyword in positive_keywords)
-        
-        # Check for negative keywords
-        has_negative = any(keyword in title_lower for keyword in negative_keywords)
+        if flags is None:
+            flags = self.classifier.analyze(title)
         
-        return has_positive and not has_negative
+        # Needs a positive indicator and no negative one
+        return 'positive' in flags and 'negative' not in flags
     
     def _normalize_text(self, text: str) -> str:
         """
@@ -223,15 +620,7 @@ class YouTubeClient:
         Returns:
             Normalized text
         """
-        import unicodedata
-        # Remove accents
-        text = ''.join(
-            c for c in unicodedata.normalize('NFD', text)
-            if unicodedata.category(c) != 'Mn'
-        )
-        # Convert to lowercase and remove extra spaces
-        text = ' '.join(text.lower().split())
-        return text
+        return normalize_text(text)
     
     def _matches_book(self, video_title: str, book_title: str, author: str) -> bool:
         """
@@ -245,33 +634,34 @@ class YouTubeClient:
         Returns:
             True if the video matches the book, False otherwise
         """
-        # Normalize all texts for comparison
-        video_normalized = self._normalize_text(video_title)
-        book_normalized = self._normalize_text(book_title)
-        author_normalized = self._normalize_text(author)
-        
-        # Extract author's last name (usually the most distinctive part)
-        author_parts = author_normalized.split()
-        author_lastname = author_parts[-1] if author_parts else author_normalized
-        
-        # Extract main words from book title (ignore common words)
-        common_words = {'el', 'la', 'los', 'las', 'un', 'una', 'de', 'del', 'y', 'o', 'en', 'a', 'para'}
-        book_words = [word for word in book_normalized.split() if word not in common_words and len(word) > 2]
-        
-        # Check if video contains author's last name
-        has_author = author_lastname in video_normalized
+        return self.signature_for(book_title, author).matches(video_title)
+    
+    def signature_for(self, book_title: str, author: str) -> BookSignature:
+        """
+        Get the precomputed matching signature of a book.
         
-        # Check if video contains significant words from book title
-        # At least 50% of the significant words should be present
-        if book_words:
-            matching_words = sum(1 for word in book_words if word in video_normalized)
-            has_title = matching_words >= len(book_words) * 0.5
-        else:
-            # If no significant words, check for exact book title
-            has_title = book_normalized in video_normalized
+        Args:
+            book_title: Book title
+            author: Author name
+            
+        Returns:
+            BookSignature, built on first use and reused afterwards
+        """
+        key = (book_title, author)
+        signature = self._signatures.get(key)
+        if signature is None:
+            signature = self._signatures.setdefault(key, BookSignature(book_title, author))
+        return signature
+    
+    def build_signatures(self, books: List[Book]):
+        """
+        Precompute the matching signatures of a whole catalog.
         
-        # Both author and title must be present
-        return has_author and has_title
+        Args:
+            books: List of Book objects
+        """
+        for book in books:
+            self.signature_for(book.titulo, book.autor)
     
     def search_multiple_strategies(self, title: str, author: str) -> List[Dict[str, str]]:
         """
@@ -295,30 +685,19 @@ class YouTubeClient:
         
         for query in search_queries:
             try:
-                videos = scrapetube.get_search(query, limit=2, sleep=1)
+                videos = self.fetch_videos(query, 2)
+                signature = self.signature_for(title, author)
+                matches = signature.matches_many([video['title'] for video in videos])
                 
-                for video in videos:
-                    video_id = video.get('videoId')
-                    if video_id:
-                        title_video = video.get('title', {}).get('runs', [{}])[0].get('text', '')
-                        duration = self._parse_duration(video)
-                        
-                        # CRITICAL: Verify that the video matches the book and author
-                        if not self._matches_book(title_video, title, author):
-                            continue
-                        
-                        # Then check if it's an audiobook
-                        if not self._is_likely_audiobook(title_video):
-                            continue
-                        
-                        content_type = self._classify_content(title_video, duration)
-                        
-                        results.append({
-                            'url': f"https://www.youtube.com/watch?v={video_id}",
-                            'duration': duration,
-                            'type': content_type,
-                            'title': title_video
-                        })
+                for video, is_match in zip(videos, matches):
+                    # CRITICAL: Verify that the video matches the book and author
+                    if not is_match:
+                        continue
+                    
+                    # Then check if it's an audiobook
+                    result = self.build_result(video)
+                    if result:
+                        results.append(result)
             except Exception:
                 continue
         
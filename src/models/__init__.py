@@ -1,5 +1,6 @@
 """Data models for book information."""
 
 from .book import Book
+from .catalog import BookCatalog
 
-__all__ = ['Book']
+__all__ = ['Book', 'BookCatalog']
@@ -1,13 +1,36 @@
 """Data model for Dominican books and audiobooks."""
 
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+def parse_duration(text: str) -> Optional[int]:
+    """
+    Parse a YouTube length text into seconds.
+    
+    Args:
+        text: Duration as "H:MM:SS", "M:SS" or "SS"
+        
+    Returns:
+        Duration in seconds, or None for "N/A" and unparseable text
+    """
+    parts = text.strip().split(':')
+    if len(parts) > 3 or not all(part.isascii() and part.isdigit() for part in parts):
+        return None
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+
+@dataclass(slots=True)
 class Book:
     """
     Represents a Dominican book with audiobook information.
+    
+    Slotted, so a book carries no per-instance ``__dict__``; large catalogs
+    can be kept column-wise in a ``BookCatalog``.
     """
     numero: int
     titulo: str
@@ -17,6 +40,13 @@ class Book:
     duracion: str = "N/A"
     tipo_contenido: str = "N/A"
     disponibilidad: str = "NO ENCONTRADO"
+    fecha_busqueda: str = "N/A"
+    seccion: str = "N/A"  # Catalog section, e.g. "DRAMA (TEATRO)"
+    duracion_segundos: Optional[int] = None  # duracion parsed once, None if unknown
+    
+    def __post_init__(self):
+        if self.duracion_segundos is None and self.duracion != "N/A":
+            self.duracion_segundos = parse_duration(self.duracion)
     
     def to_dict(self) -> dict:
         """
@@ -33,9 +63,33 @@ class Book:
             'URL YouTube': self.url_youtube,
             'Duración': self.duracion,
             'Tipo Contenido': self.tipo_contenido,
-            'Disponibilidad': self.disponibilidad
+            'Disponibilidad': self.disponibilidad,
+            'Fecha Búsqueda': self.fecha_busqueda
         }
     
+    @staticmethod
+    def from_dict(data: dict) -> 'Book':
+        """
+        Create a Book from an exported row (inverse of ``to_dict``).
+        
+        Args:
+            data: Dictionary with export column names
+            
+        Returns:
+            Book object
+        """
+        return Book(
+            numero=int(data['Número']),
+            titulo=str(data['Título Libro']),
+            autor=str(data['Autor']),
+            año=str(data.get('Año', 'N/A')),
+            url_youtube=str(data.get('URL YouTube', 'NO ENCONTRADO')),
+            duracion=str(data.get('Duración', 'N/A')),
+            tipo_contenido=str(data.get('Tipo Contenido', 'N/A')),
+            disponibilidad=str(data.get('Disponibilidad', 'NO ENCONTRADO')),
+            fecha_busqueda=str(data.get('Fecha Búsqueda', 'N/A'))
+        )
+    
     def mark_as_found(self, url: str, duration: str, content_type: str, partial: bool = False):
         """
         Mark the book as found with details.
@@ -48,6 +102,7 @@ class Book:
         """
         self.url_youtube = url
         self.duracion = duration
+        self.duracion_segundos = parse_duration(duration)
         self.tipo_contenido = content_type
         self.disponibilidad = "PARCIAL" if partial else "ENCONTRADO"
     
@@ -58,13 +113,14 @@ class Book:
         self.mark_as_found(url, duration, content_type, partial=True)
     
     @staticmethod
-    def create_from_text(numero: int, text: str) -> Optional['Book']:
+    def create_from_text(numero: int, text: str, seccion: str = "N/A") -> Optional['Book']:
         """
         Create a Book from a text line in format: "Título | Autor | Año"
         
         Args:
             numero: Sequential number
             text: Text line with book info
+            seccion: Catalog section the line belongs to
             
         Returns:
             Book object or None if parsing fails
@@ -73,9 +129,9 @@ class Book:
             parts = [p.strip() for p in text.split('|')]
             if len(parts) >= 2:
                 titulo = parts[0]
-                autor = parts[1]
+                autor = sys.intern(parts[1])
                 año = parts[2] if len(parts) > 2 else "N/A"
-                return Book(numero=numero, titulo=titulo, autor=autor, año=año)
+                return Book(numero=numero, titulo=titulo, autor=autor, año=año, seccion=seccion)
             return None
         except Exception:
             return None
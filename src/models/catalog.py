@@ -0,0 +1,177 @@
+"""Column-wise storage for large book catalogs."""
+
+from array import array
+from dataclasses import fields
+from typing import Dict, Iterable, Iterator, List, Sequence, Union
+
+from .book import Book
+
+# Book fields, in declaration order
+FIELDS = tuple(field.name for field in fields(Book))
+
+# Fields with few distinct values, stored as codes into a table of values
+ENCODED_FIELDS = ('autor', 'año', 'duracion', 'tipo_contenido', 'disponibilidad', 'fecha_busqueda', 'seccion')
+
+# Export column name of each exported field (fields and to_dict share their order)
+EXPORT_NAMES = dict(zip(FIELDS, Book(numero=0, titulo='', autor='', año='').to_dict()))
+
+
+class BookCatalog:
+    """
+    Books stored as one column per field instead of one object per book.
+    
+    Numbers and durations (in seconds, NaN when unknown) live in typed
+    arrays, titles and URLs in plain lists, and
+    repeated values (author, year, status, content type...) are dictionary
+    encoded: each distinct string is kept once and books hold a 32-bit code.
+    The typed arrays are handed to pandas and Arrow without copying (so
+    the catalog cannot grow while a frame or table built from it is alive);
+    books are rebuilt on demand when iterating or indexing.
+    """
+    
+    def __init__(self, books: Iterable[Book] = ()):
+        """
+        Create a catalog.
+        
+        Args:
+            books: Initial books, in catalog order
+        """
+        self._numero = array('q')
+        self._duracion_segundos = array('d')
+        self._titulo: List[str] = []
+        self._url_youtube: List[str] = []
+        self._codes: Dict[str, array] = {name: array('i') for name in ENCODED_FIELDS}
+        self._values: Dict[str, List[str]] = {name: [] for name in ENCODED_FIELDS}
+        self._index: Dict[str, Dict[str, int]] = {name: {} for name in ENCODED_FIELDS}
+        self.extend(books)
+    
+    def _encode(self, name: str, value: str) -> int:
+        index = self._index[name]
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(self._values[name])
+            self._values[name].append(value)
+        return code
+    
+    def append(self, book: Book):
+        """
+        Add a book at the end of the catalog.
+        
+        Args:
+            book: Book to store (later changes to it are not reflected)
+        """
+        self._numero.append(book.numero)
+        seconds = book.duracion_segundos
+        self._duracion_segundos.append(float('nan') if seconds is None else seconds)
+        self._titulo.append(book.titulo)
+        self._url_youtube.append(book.url_youtube)
+        for name in ENCODED_FIELDS:
+            self._codes[name].append(self._encode(name, getattr(book, name)))
+    
+    def extend(self, books: Iterable[Book]):
+        """
+        Add several books at the end of the catalog.
+        
+        Args:
+            books: Books to store
+        """
+        for book in books:
+            self.append(book)
+    
+    def __len__(self) -> int:
+        return len(self._numero)
+    
+    def __getitem__(self, index: int) -> Book:
+        values = {name: self._values[name][self._codes[name][index]] for name in ENCODED_FIELDS}
+        seconds = self._duracion_segundos[index]
+        return Book(
+            numero=self._numero[index],
+            titulo=self._titulo[index],
+            url_youtube=self._url_youtube[index],
+            duracion_segundos=None if seconds != seconds else int(seconds),
+            **values
+        )
+    
+    def __iter__(self) -> Iterator[Book]:
+        for index in range(len(self)):
+            yield self[index]
+    
+    def column(self, name: str) -> Sequence[Union[int, str]]:
+        """
+        Get the values of one field for every book.
+        
+        Args:
+            name: Book field name (e.g. 'autor')
+        
+        Returns:
+            The stored array or list for direct columns, a decoded list for
+            encoded ones
+        """
+        if name in self._codes:
+            values = self._values[name]
+            return [values[code] for code in self._codes[name]]
+        return getattr(self, f'_{name}')
+    
+    def to_pandas(self, export: bool = True):
+        """
+        Build a DataFrame of the catalog.
+        
+        The numbers and durations are wrapped without copying (unknown
+        durations are NaN), and encoded fields become
+        categorical columns built from their codes, without decoding a
+        string per book.
+        
+        Args:
+            export: Use the export columns of ``Book.to_dict`` (otherwise
+                every field, with its attribute name)
+        
+        Returns:
+            pandas DataFrame
+        """
+        import numpy as np
+        import pandas as pd
+        
+        names = EXPORT_NAMES if export else {name: name for name in FIELDS}
+        data = {}
+        for name, column in names.items():
+            if name in self._codes:
+                codes = np.frombuffer(self._codes[name], dtype=np.int32)
+                data[column] = pd.Categorical.from_codes(codes, categories=self._values[name], validate=False)
+            elif name == 'numero':
+                data[column] = np.frombuffer(self._numero, dtype=np.int64)
+            elif name == 'duracion_segundos':
+                data[column] = np.frombuffer(self._duracion_segundos, dtype=np.float64)
+            else:
+                data[column] = getattr(self, f'_{name}')
+        return pd.DataFrame(data, copy=False)
+    
+    def to_arrow(self):
+        """
+        Build a pyarrow Table of the catalog, with every field.
+        
+        Numbers, durations and codes share their buffers with the catalog;
+        encoded fields become dictionary arrays.
+        
+        Returns:
+            pyarrow Table
+        
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("Arrow export needs pyarrow: pip install pyarrow") from None
+        
+        columns = {}
+        for name in FIELDS:
+            if name in self._codes:
+                codes = pa.Array.from_buffers(pa.int32(), len(self), [None, pa.py_buffer(self._codes[name])])
+                columns[name] = pa.DictionaryArray.from_arrays(codes, pa.array(self._values[name], pa.string()))
+            elif name == 'numero':
+                columns[name] = pa.Array.from_buffers(pa.int64(), len(self), [None, pa.py_buffer(self._numero)])
+            elif name == 'duracion_segundos':
+                columns[name] = pa.Array.from_buffers(pa.float64(), len(self), [None, pa.py_buffer(self._duracion_segundos)])
+            else:
+                columns[name] = pa.array(getattr(self, f'_{name}'), pa.string())
+        return pa.table(columns)
@@ -1,5 +1,7 @@
 """Business logic services."""
 
 from .audiobook_service import AudiobookService
+from .query_planner import QueryPlanner
+from .async_audiobook_service import AsyncAudiobookService
 
-__all__ = ['AudiobookService']
+__all__ = ['AudiobookService', 'QueryPlanner', 'AsyncAudiobookService']
@@ -0,0 +1,177 @@
+"""Audiobook search pipeline running on a single asyncio event loop."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from src.clients.async_youtube_client import AsyncYouTubeClient
+from src.models.book import Book
+from src.services.audiobook_service import AudiobookService
+from src.services.query_planner import QueryPlanner
+from src.utils.journal import RunJournal
+from src.utils.metrics import metrics
+from src.utils.negative_cache import NegativeCache
+from src.utils.result_sink import ResultSink
+from src.utils.video_index import VideoIndex
+
+
+class AsyncAudiobookService(AudiobookService):
+    """
+    AudiobookService whose per-book searches are coroutines.
+    
+    Hundreds of books can be in flight at once on one event loop; the
+    shared rate limiter still decides how fast requests actually leave.
+    Journal, incremental reuse, local index, prefill and statistics are
+    inherited unchanged.
+    """
+    
+    def __init__(
+        self,
+        async_client: AsyncYouTubeClient,
+        journal: Optional[RunJournal] = None,
+        planner: Optional[QueryPlanner] = None,
+        video_index: Optional[VideoIndex] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        sink: Optional[ResultSink] = None,
+        dedup_threshold: Optional[float] = None
+    ):
+        """
+        Initialize the service.
+        
+        Args:
+            async_client: Async YouTube client (wrapping the sync client)
+            journal: Optional journal recording each processed book
+            planner: Optional author-level query planner
+            video_index: Optional local index of crawled channel videos
+            negative_cache: Optional record of confirmed misses
+            sink: Optional streaming output receiving every finished book
+            dedup_threshold: Similarity from which two catalog rows are
+                searched as one work (None to search every row)
+        """
+        super().__init__(async_client.client, journal, planner, video_index, negative_cache, sink, dedup_threshold)
+        self.async_client = async_client
+    
+    async def process_book_async(self, book: Book, verbose: bool = False) -> Tuple[Book, bool]:
+        """
+        Process a single book search without blocking the event loop.
+        
+        Args:
+            book: Book object to search for
+            verbose: Whether to print per-book search messages
+        
+        Returns:
+            Tuple of (updated Book object, success boolean)
+        """
+        start = time.perf_counter()
+        result = self._take_prefilled(book)
+        if result:
+            self._remember_outcome(book, result)
+        else:
+            confirmed_at = self._known_miss(book, verbose)
+            if confirmed_at is not None:
+                return self._skip_known_miss(book, confirmed_at, start)
+            
+            errors_before = self.youtube_client.search_errors
+            result = await self.async_client.search_audiobook(book.titulo, book.autor, book.seccion)
+            self._remember_outcome(book, result, errors_before)
+        updated_book, success = self._apply_result(book, result, verbose)
+        self._observe_book(updated_book, start)
+        return updated_book, success
+    
+    async def process_multiple_books_async(
+        self,
+        books: List[Book],
+        show_progress: bool = True,
+        max_concurrency: int = 100,
+        resume: bool = False,
+        previous_results: Optional[Dict[str, Book]] = None,
+        max_age_days: float = 30
+    ) -> Tuple[List[Book], Dict[str, int]]:
+        """
+        Process multiple books with up to ``max_concurrency`` searches in flight.
+        
+        Results are still collected in catalog order, and at most
+        ``2 * max_concurrency`` books are scheduled ahead of the one being
+        collected.
+        
+        Args:
+            books: List of Book objects
+            show_progress: Whether to show progress messages
+            max_concurrency: Number of books searched concurrently
+            resume: Skip books already recorded in the journal
+            previous_results: Results of a previous run keyed by book key
+            max_age_days: Age after which a previous result is searched again
+        
+        Returns:
+            Tuple of (updated books list, statistics dictionary)
+        """
+        stats = {
+            'total': len(books),
+            'found': 0,
+            'partial': 0,
+            'not_found': 0
+        }
+        
+        works = self._deduplicate(books, show_progress)
+        self.youtube_client.build_signatures(works)
+        requests_before = self.youtube_client.network_requests
+        
+        pending = self._prepare(works, stats, show_progress, resume, previous_results, max_age_days)
+        
+        if self.planner is not None:
+            # The planner issues only a handful of queries; keep it off the loop
+            planned = await asyncio.to_thread(self.planner.run, self._unresolved(pending), show_progress)
+            self._add_planned(planned)
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(book: Book) -> Tuple[Book, bool]:
+            async with semaphore:
+                return await self.process_book_async(book)
+        
+        window = max_concurrency * 2
+        scheduled = deque()
+        processed = 0
+        try:
+            for idx, book in enumerate(pending, 1):
+                scheduled.append((f"[{idx}/{len(pending)}]", book, asyncio.ensure_future(bounded(book))))
+                while len(scheduled) >= window:
+                    await self._collect_async(scheduled.popleft(), stats, show_progress)
+                    processed += 1
+            
+            while scheduled:
+                await self._collect_async(scheduled.popleft(), stats, show_progress)
+                processed += 1
+        
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            for _, _, task in scheduled:
+                task.cancel()
+            print("\n\nProceso interrumpido por el usuario")
+            print(f"Libros procesados hasta ahora: {processed}")
+        
+        self._emit_unsearched(books)
+        self._count_duplicates(stats)
+        self._add_request_stats(stats, requests_before)
+        return books, stats
+    
+    async def _collect_async(self, item, stats: Dict[str, int], show_progress: bool):
+        """
+        Wait for one scheduled search and record its outcome.
+        
+        Args:
+            item: Tuple of (progress label, Book, Task)
+            stats: Statistics dictionary to update
+            show_progress: Whether to show progress messages
+        """
+        label, book, task = item
+        try:
+            updated_book, success = await task
+            self._record(updated_book, stats)
+            if show_progress:
+                print(f"{label} {book.titulo} - {book.autor}: {updated_book.disponibilidad}")
+        except Exception as e:
+            print(f"{label} {book.titulo} - Error inesperado: {e}")
+            metrics.inc('books_eater_errors_total', stage='book', type=type(e).__name__)
+            stats['not_found'] += 1
+            self._emit(book)
@@ -1,9 +1,24 @@
 """Business logic for processing audiobook searches."""
 
-from typing import List, Tuple, Dict
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Tuple, Dict, Optional, Set
 
 from src.clients.youtube_client import YouTubeClient
 from src.models.book import Book
+from src.utils.analytics import print_report
+from src.utils.dedup import find_duplicates
+from src.utils.journal import RunJournal
+from src.utils.matching import CatalogIndex
+from src.utils.metrics import metrics
+from src.utils.negative_cache import NegativeCache
+from src.utils.result_sink import ResultSink
+from src.utils.video_index import VideoIndex
+from src.utils.text import book_key
+from src.services.query_planner import QueryPlanner
 
 
 class AudiobookService:
@@ -11,28 +26,163 @@ class AudiobookService:
     Service for processing audiobook search queries.
     """
     
-    def __init__(self, youtube_client: YouTubeClient):
+    def __init__(
+        self,
+        youtube_client: YouTubeClient,
+        journal: Optional[RunJournal] = None,
+        planner: Optional[QueryPlanner] = None,
+        video_index: Optional[VideoIndex] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        sink: Optional[ResultSink] = None,
+        dedup_threshold: Optional[float] = None
+    ):
         """
         Initialize the service.
         
         Args:
             youtube_client: YouTube client instance
+            journal: Optional journal recording each processed book
+            planner: Optional author-level query planner run before
+                the per-book searches
+            video_index: Optional local index of crawled channel videos,
+                matched offline before any live search
+            negative_cache: Optional record of confirmed misses; books in it
+                are not searched again until their re-check is due
+            sink: Optional streaming output receiving every finished book
+            dedup_threshold: Similarity from which two catalog rows are
+                searched as one work (None to search every row)
         """
         self.youtube_client = youtube_client
+        self.journal = journal
+        self.planner = planner
+        self.video_index = video_index
+        self.negative_cache = negative_cache
+        self.sink = sink
+        self.dedup_threshold = dedup_threshold
+        
+        # Duplicate rows waiting for their representative, and those filled
+        self._duplicates: Dict[str, List[Book]] = {}
+        self._fanned_out: List[Book] = []
+        
+        # Books already written to the sink (by id), to complete it after Ctrl-C
+        self._emitted: Set[int] = set()
+        
+        # Results found for catalog books by other books' queries
+        self._catalog_index = CatalogIndex()
+        self._prefilled: Dict[str, Dict[str, str]] = {}
+        self._prefilled_used = 0
+        self._known_misses = 0
+        self._prefill_lock = threading.Lock()
+        self.youtube_client.on_videos = self._match_catalog
     
-    def process_book(self, book: Book) -> Tuple[Book, bool]:
+    def process_book(self, book: Book, verbose: bool = True) -> Tuple[Book, bool]:
         """
         Process a single book search and update with YouTube info.
         
         Args:
             book: Book object to search for
+            verbose: Whether to print per-book search messages
             
         Returns:
             Tuple of (updated Book object, success boolean)
         """
-        print(f"   Buscando: {book.titulo} - {book.autor}")
+        if verbose:
+            print(f"   Buscando: {book.titulo} - {book.autor}")
 
-        result = self.youtube_client.search_audiobook(book.titulo, book.autor)
+        start = time.perf_counter()
+        result = self._take_prefilled(book)
+        if result:
+            if verbose:
+                print(f"      Ya encontrado por otra búsqueda")
+            self._remember_outcome(book, result)
+        else:
+            confirmed_at = self._known_miss(book, verbose)
+            if confirmed_at is not None:
+                return self._skip_known_miss(book, confirmed_at, start)
+            
+            errors_before = self.youtube_client.search_errors
+            result = self.youtube_client.search_audiobook(book.titulo, book.autor, book.seccion)
+            self._remember_outcome(book, result, errors_before)
+        updated_book, success = self._apply_result(book, result, verbose)
+        self._observe_book(updated_book, start)
+        return updated_book, success
+    
+    def _known_miss(self, book: Book, verbose: bool) -> Optional[float]:
+        """
+        Look a book up in the negative cache.
+        
+        Args:
+            book: Book about to be searched
+            verbose: Whether to print a message when it is skipped
+            
+        Returns:
+            Timestamp its miss was confirmed, or None if it must be searched
+        """
+        if self.negative_cache is None:
+            return None
+        confirmed_at = self.negative_cache.known_miss(book.titulo, book.autor)
+        if confirmed_at is not None:
+            with self._prefill_lock:
+                self._known_misses += 1
+            metrics.inc('books_eater_negative_cache_hits_total')
+            if verbose:
+                print(f"      No encontrado en una búsqueda reciente, se omite hasta su próxima revisión")
+        return confirmed_at
+    
+    def _skip_known_miss(self, book: Book, confirmed_at: float, start: float) -> Tuple[Book, bool]:
+        """
+        Leave a known miss as NO ENCONTRADO, dated when the miss was confirmed.
+        
+        Args:
+            book: Book being processed
+            confirmed_at: Timestamp of the last full search that missed it
+            start: perf_counter value when processing started
+            
+        Returns:
+            Tuple of (Book, False)
+        """
+        book.fecha_busqueda = datetime.fromtimestamp(confirmed_at).isoformat(timespec='seconds')
+        self._observe_book(book, start)
+        return book, False
+    
+    def _remember_outcome(self, book: Book, result: Optional[Dict[str, str]], errors_before: Optional[int] = None):
+        """
+        Update the negative cache with the outcome of a book's search.
+        
+        A miss is only recorded when no search error was counted while the
+        book was searched; with concurrent workers this also skips misses
+        that overlapped another book's error, which errs on searching again.
+        
+        Args:
+            book: Book that was searched
+            result: Result found, or None
+            errors_before: Client search error count before the search
+        """
+        if self.negative_cache is None:
+            return
+        if result:
+            self.negative_cache.record_found(book.titulo, book.autor)
+        elif self.youtube_client.search_errors == errors_before:
+            self.negative_cache.record_miss(book.titulo, book.autor)
+    
+    @staticmethod
+    def _observe_book(book: Book, start: float):
+        """Record the time taken by a book, labelled with its outcome."""
+        metrics.observe('books_eater_book_seconds', time.perf_counter() - start, outcome=book.disponibilidad)
+    
+    def _apply_result(self, book: Book, result: Optional[Dict[str, str]], verbose: bool) -> Tuple[Book, bool]:
+        """
+        Update a searched book with its search result.
+        
+        Args:
+            book: Book that was searched
+            result: Video info dictionary, or None if nothing was found
+            verbose: Whether to print the outcome
+            
+        Returns:
+            Tuple of (updated Book object, success boolean)
+        """
+        book.fecha_busqueda = datetime.now().isoformat(timespec='seconds')
         
         if result:
             # Determine if it's complete or partial
@@ -44,31 +194,49 @@ class AudiobookService:
                     duration=result['duration'],
                     content_type=result['type']
                 )
-                print(f"      Parcial encontrado: {result['type']} ({result['duration']})")
+                if verbose:
+                    print(f"      Parcial encontrado: {result['type']} ({result['duration']})")
             else:
                 book.mark_as_found(
                     url=result['url'],
                     duration=result['duration'],
                     content_type=result['type']
                 )
-                print(f"      Encontrado: {result['type']} ({result['duration']})")
+                if verbose:
+                    print(f"      Encontrado: {result['type']} ({result['duration']})")
 
             return book, True
         else:
-            print(f"      No encontrado")
+            if verbose:
+                print(f"      No encontrado")
             return book, False
     
     def process_multiple_books(
         self,
         books: List[Book],
-        show_progress: bool = True
+        show_progress: bool = True,
+        max_workers: int = 1,
+        resume: bool = False,
+        previous_results: Optional[Dict[str, Book]] = None,
+        max_age_days: float = 30
     ) -> Tuple[List[Book], Dict[str, int]]:
         """
         Process multiple books.
         
+        With ``max_workers`` greater than 1 the searches run on a bounded
+        thread pool; results are still collected in catalog order. When a
+        journal is configured every finished book is appended to it, and
+        ``resume`` restores journaled books instead of searching them again.
+        With ``previous_results`` (incremental mode) only new, missing,
+        partial or stale books are searched.
+        
         Args:
             books: List of Book objects
             show_progress: Whether to show progress messages
+            max_workers: Number of books searched concurrently
+            resume: Skip books already recorded in the journal
+            previous_results: Results of a previous run keyed by book key
+            max_age_days: Age after which a previous result is searched again
             
         Returns:
             Tuple of (updated books list, statistics dictionary)
@@ -80,19 +248,29 @@ class AudiobookService:
             'not_found': 0
         }
         
-        for idx, book in enumerate(books, 1):
+        works = self._deduplicate(books, show_progress)
+        self.youtube_client.build_signatures(works)
+        requests_before = self.youtube_client.network_requests
+        
+        pending = self._prepare(works, stats, show_progress, resume, previous_results, max_age_days)
+        
+        if self.planner is not None:
+            self._add_planned(self.planner.run(self._unresolved(pending), show_progress))
+        
+        if max_workers > 1:
+            self._process_concurrently(pending, stats, show_progress, max_workers)
+            self._emit_unsearched(books)
+            self._count_duplicates(stats)
+            self._add_request_stats(stats, requests_before)
+            return books, stats
+        
+        for idx, book in enumerate(pending, 1):
             try:
                 if show_progress:
-                    print(f"\n[{idx}/{stats['total']}] Procesando...")
+                    print(f"\n[{idx}/{len(pending)}] Procesando...")
                 
                 updated_book, success = self.process_book(book)
-                
-                if updated_book.disponibilidad == "ENCONTRADO":
-                    stats['found'] += 1
-                elif updated_book.disponibilidad == "PARCIAL":
-                    stats['partial'] += 1
-                else:
-                    stats['not_found'] += 1
+                self._record(updated_book, stats)
                     
             except KeyboardInterrupt:
                 print("\n\nProceso interrumpido por el usuario")
@@ -100,26 +278,529 @@ class AudiobookService:
                 break
             except Exception as e:
                 print(f"   Error inesperado: {e}")
+                metrics.inc('books_eater_errors_total', stage='book', type=type(e).__name__)
                 stats['not_found'] += 1
+                self._emit(book)
                 continue
         
+        self._emit_unsearched(books)
+        self._count_duplicates(stats)
+        self._add_request_stats(stats, requests_before)
         return books, stats
     
-    def print_statistics(self, stats: Dict[str, int]):
+    def _deduplicate(self, books: List[Book], show_progress: bool) -> List[Book]:
+        """
+        Keep one row per work; the other rows get its result when it finishes.
+        
+        Args:
+            books: List of Book objects
+            show_progress: Whether to show progress messages
+            
+        Returns:
+            One representative book per work, in catalog order
+        """
+        self._duplicates = {}
+        self._fanned_out = []
+        self._emitted = set()
+        if self.dedup_threshold is None:
+            return books
+        
+        works, self._duplicates = find_duplicates(books, self.dedup_threshold)
+        if show_progress and len(works) < len(books):
+            print(f"Duplicados: {len(books) - len(works)} filas del catálogo repiten otra obra, "
+                  f"se buscarán {len(works)} obras")
+        return works
+    
+    def _count_duplicates(self, stats: Dict[str, int]):
+        """
+        Count the duplicate rows filled from their representative's result.
+        
+        Args:
+            stats: Statistics dictionary to update
+        """
+        for duplicate in self._fanned_out:
+            self._count_result(duplicate, stats)
+        stats['duplicates'] = len(self._fanned_out)
+    
+    def _prepare(
+        self,
+        books: List[Book],
+        stats: Dict[str, int],
+        show_progress: bool,
+        resume: bool,
+        previous_results: Optional[Dict[str, Book]],
+        max_age_days: float
+    ) -> List[Book]:
+        """
+        Resolve every book that needs no live search of its own.
+        
+        Restores journaled and reusable previous results, indexes the rest
+        of the catalog and matches it against the local video index.
+        
+        Args:
+            books: List of Book objects
+            stats: Statistics dictionary to update
+            show_progress: Whether to show progress messages
+            resume: Skip books already recorded in the journal
+            previous_results: Results of a previous run keyed by book key
+            max_age_days: Age after which a previous result is searched again
+            
+        Returns:
+            Books that still need to be processed
+        """
+        pending = self._restore_from_journal(books, stats, resume)
+        if previous_results is not None:
+            pending = self._reuse_previous_results(pending, stats, previous_results, max_age_days)
+        self._index_catalog(pending)
+        
+        if self.video_index is not None:
+            self._match_video_index(pending, show_progress)
+        return pending
+    
+    def _unresolved(self, books: List[Book]) -> List[Book]:
+        """
+        Get the books without a result found by another query yet.
+        
+        Args:
+            books: Books still to be processed
+            
+        Returns:
+            Books that still need a search
+        """
+        return [book for book in books if book_key(book.titulo, book.autor) not in self._prefilled]
+    
+    def _add_planned(self, planned: Dict[str, Dict[str, str]]):
+        """
+        Keep the results found by author-level queries.
+        
+        Args:
+            planned: Results keyed by book key
+        """
+        with self._prefill_lock:
+            for key, result in planned.items():
+                self._prefilled.setdefault(key, result)
+    
+    def _add_request_stats(self, stats: Dict[str, int], requests_before: int):
+        """
+        Add search-cost metrics for the run to the statistics.
+        
+        Args:
+            stats: Statistics dictionary to update
+            requests_before: Client network request count at the start of the run
+        """
+        stats['prefilled'] = self._prefilled_used
+        stats['known_misses'] = self._known_misses
+        stats['requests'] = self.youtube_client.network_requests - requests_before
+        stats['requests_per_book'] = stats['requests'] / stats['total'] if stats['total'] else 0.0
+        found = stats['found'] + stats['partial']
+        stats['requests_per_found'] = stats['requests'] / found if found else 0.0
+        stats['search_errors'] = self.youtube_client.search_errors
+        stats['strategies_skipped'] = sum(
+            metrics.counter('books_eater_strategy_skipped_total', template=template)
+            for template in self.youtube_client.SEARCH_STRATEGIES
+        )
+        if self.youtube_client.rate_limiter is not None:
+            stats['rate_limiter'] = self.youtube_client.rate_limiter.snapshot()
+            metrics.set('books_eater_rate_limit_wait_seconds', stats['rate_limiter']['waited_seconds'])
+            metrics.set('books_eater_rate_limit_rate', stats['rate_limiter']['rate'])
+        stats['strategies'] = self.strategy_hit_rates()
+    
+    def strategy_hit_rates(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get how often each search strategy found its book.
+        
+        Returns:
+            Dictionary mapping strategy template to queries, hits and hit_rate
+        """
+        rates = {}
+        for template in self.youtube_client.SEARCH_STRATEGIES:
+            queries = metrics.counter('books_eater_strategy_queries_total', template=template)
+            hits = metrics.counter('books_eater_strategy_hits_total', template=template)
+            rates[template] = {
+                'queries': queries,
+                'hits': hits,
+                'hit_rate': hits / queries if queries else 0.0,
+            }
+        return rates
+    
+    @staticmethod
+    def export_metrics(stats: Dict[str, int], json_file: str, prom_file: str):
+        """
+        Write the run's metrics as a JSON summary and a Prometheus text file.
+        
+        Args:
+            stats: Statistics returned by process_multiple_books (or merged
+                from the shards of a run)
+            json_file: Path of the JSON run summary
+            prom_file: Path of the Prometheus text file
+        """
+        metrics.write_json(json_file, {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'stats': stats,
+            'strategies': stats.get('strategies', {}),
+        })
+        metrics.write_prometheus(prom_file)
+    
+    def _index_catalog(self, books: List[Book]):
+        """
+        Index the books still to be searched so any fetched video can fill them.
+        
+        Args:
+            books: Books that still need to be searched
+        """
+        with self._prefill_lock:
+            self._catalog_index = CatalogIndex()
+            self._prefilled = {}
+            self._prefilled_used = 0
+            self._known_misses = 0
+            for book in books:
+                self._catalog_index.add(
+                    book_key(book.titulo, book.autor),
+                    self.youtube_client.signature_for(book.titulo, book.autor)
+                )
+    
+    def _match_video_index(self, books: List[Book], show_progress: bool):
+        """
+        Resolve books offline from the local index of crawled videos.
+        
+        Args:
+            books: Books still to be searched
+            show_progress: Whether to show progress messages
+        """
+        resolved = 0
+        for book in books:
+            signature = self.youtube_client.signature_for(book.titulo, book.autor)
+            for video in self.video_index.find(signature):
+                result = self.youtube_client.build_result(video)
+                if result:
+                    with self._prefill_lock:
+                        self._prefilled.setdefault(book_key(book.titulo, book.autor), result)
+                    resolved += 1
+                    break
+        
+        if show_progress:
+            print(f"Índice local de canales: {resolved}/{len(books)} libros resueltos sin conexión")
+    
+    def _match_catalog(self, videos: List[Dict[str, str]]):
+        """
+        Match fetched videos against every indexed book.
+        
+        The first audiobook result found for a book is kept, so that book's
+        own search can be skipped later.
+        
+        Args:
+            videos: Slim video records returned by any query
+        """
+        for video in videos:
+            for key in self._catalog_index.match(video['title']):
+                if key in self._prefilled:
+                    continue
+                result = self.youtube_client.build_result(video)
+                if result is None:
+                    break
+                with self._prefill_lock:
+                    self._prefilled.setdefault(key, result)
+    
+    def _take_prefilled(self, book: Book) -> Optional[Dict[str, str]]:
+        """
+        Claim a result already found for a book by another query.
+        
+        Args:
+            book: Book about to be searched
+            
+        Returns:
+            Video info dictionary or None
+        """
+        with self._prefill_lock:
+            result = self._prefilled.pop(book_key(book.titulo, book.autor), None)
+            if result is not None:
+                self._prefilled_used += 1
+            return result
+    
+    def _restore_from_journal(
+        self,
+        books: List[Book],
+        stats: Dict[str, int],
+        resume: bool
+    ) -> List[Book]:
+        """
+        Restore journaled books when resuming, or start a fresh journal.
+        
+        Args:
+            books: List of Book objects
+            stats: Statistics dictionary to update with restored books
+            resume: Whether to resume from the existing journal
+            
+        Returns:
+            Books that still need to be searched
+        """
+        if self.journal is None:
+            return books
+        
+        if not resume:
+            self.journal.reset()
+            return books
+        
+        records = self.journal.load()
+        pending = []
+        for book in books:
+            record = records.get(book_key(book.titulo, book.autor))
+            if record is None:
+                pending.append(book)
+                continue
+            RunJournal.restore(book, record)
+            self._count_result(book, stats)
+            self._emit(book)
+        
+        print(f"Reanudando: {len(books) - len(pending)} libros recuperados del journal, "
+              f"{len(pending)} pendientes")
+        return pending
+    
+    def _reuse_previous_results(
+        self,
+        books: List[Book],
+        stats: Dict[str, int],
+        previous_results: Dict[str, Book],
+        max_age_days: float
+    ) -> List[Book]:
+        """
+        Copy still-valid results from a previous run onto the catalog.
+        
+        A previous result is reused when it is ENCONTRADO with a YouTube URL
+        and was searched less than ``max_age_days`` ago.
+        
+        Args:
+            books: List of Book objects
+            stats: Statistics dictionary to update with reused books
+            previous_results: Results of a previous run keyed by book key
+            max_age_days: Maximum age of a reusable result
+            
+        Returns:
+            Books that still need to be searched
+        """
+        cutoff = datetime.now() - timedelta(days=max_age_days)
+        pending = []
+        
+        for book in books:
+            previous = previous_results.get(book_key(book.titulo, book.autor))
+            if previous is None or not self._is_reusable(previous, cutoff):
+                pending.append(book)
+                continue
+            
+            book.url_youtube = previous.url_youtube
+            book.duracion = previous.duracion
+            book.duracion_segundos = previous.duracion_segundos
+            book.tipo_contenido = previous.tipo_contenido
+            book.disponibilidad = previous.disponibilidad
+            book.fecha_busqueda = previous.fecha_busqueda
+            self._count_result(book, stats)
+            self._emit(book)
+        
+        print(f"Modo incremental: {len(books) - len(pending)} libros reutilizados, "
+              f"{len(pending)} por buscar")
+        return pending
+    
+    @staticmethod
+    def _is_reusable(previous: Book, cutoff: datetime) -> bool:
+        """
+        Check whether a previous result is complete and recent enough.
+        
+        Args:
+            previous: Book from a previous run
+            cutoff: Oldest acceptable search date
+            
+        Returns:
+            True if the result can be reused without searching
+        """
+        if previous.disponibilidad != "ENCONTRADO":
+            return False
+        if not previous.url_youtube.startswith("https://www.youtube.com/watch?v="):
+            return False
+        try:
+            return datetime.fromisoformat(previous.fecha_busqueda) >= cutoff
+        except ValueError:
+            return False
+    
+    def _process_concurrently(
+        self,
+        books: List[Book],
+        stats: Dict[str, int],
+        show_progress: bool,
+        max_workers: int
+    ):
+        """
+        Search books on a thread pool, consuming results in catalog order.
+        
+        At most ``2 * max_workers`` searches are submitted ahead of the
+        book currently being collected, so pending work stays bounded.
+        
+        Args:
+            books: List of Book objects
+            stats: Statistics dictionary to update
+            show_progress: Whether to show progress messages
+            max_workers: Number of worker threads
+        """
+        window = max_workers * 2
+        pending = deque()
+        processed = 0
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        
+        try:
+            for idx, book in enumerate(books, 1):
+                label = f"[{idx}/{len(books)}]"
+                pending.append((label, book, executor.submit(self.process_book, book, False)))
+                while len(pending) >= window:
+                    self._collect(pending.popleft(), stats, show_progress)
+                    processed += 1
+            
+            while pending:
+                self._collect(pending.popleft(), stats, show_progress)
+                processed += 1
+                
+        except KeyboardInterrupt:
+            for _, _, future in pending:
+                future.cancel()
+            print("\n\nProceso interrumpido por el usuario")
+            print(f"Libros procesados hasta ahora: {processed}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _collect(self, item, stats: Dict[str, int], show_progress: bool):
+        """
+        Wait for one submitted search and record its outcome.
+        
+        Args:
+            item: Tuple of (progress label, Book, Future)
+            stats: Statistics dictionary to update
+            show_progress: Whether to show progress messages
+        """
+        label, book, future = item
+        try:
+            updated_book, success = future.result()
+            self._record(updated_book, stats)
+            if show_progress:
+                print(f"{label} {book.titulo} - {book.autor}: {updated_book.disponibilidad}")
+        except Exception as e:
+            print(f"{label} {book.titulo} - Error inesperado: {e}")
+            metrics.inc('books_eater_errors_total', stage='book', type=type(e).__name__)
+            stats['not_found'] += 1
+            self._emit(book)
+    
+    def _record(self, book: Book, stats: Dict[str, int]):
+        """
+        Count a freshly processed book and append it to the journal and sink.
+        
+        Args:
+            book: Processed Book object
+            stats: Statistics dictionary to update
+        """
+        self._count_result(book, stats)
+        if self.journal is not None:
+            self.journal.append(book)
+        self._emit(book)
+    
+    def _emit(self, book: Book):
+        """
+        Pass a finished book to the streaming sink, if any.
+        
+        Args:
+            book: Book with its final result
+        """
+        if self.sink is not None:
+            self.sink.write(book)
+            self._emitted.add(id(book))
+        
+        # Rows naming the same work share its result
+        for duplicate in self._duplicates.pop(book_key(book.titulo, book.autor), ()):
+            for field in RunJournal.RESULT_FIELDS + ('duracion_segundos',):
+                setattr(duplicate, field, getattr(book, field))
+            self._fanned_out.append(duplicate)
+            if self.sink is not None:
+                self.sink.write(duplicate)
+                self._emitted.add(id(duplicate))
+    
+    def _emit_unsearched(self, books: List[Book]):
+        """
+        Write the books left unsearched by Ctrl-C to the sink.
+        
+        They keep their NO ENCONTRADO defaults, so the streamed rows cover
+        the whole catalog like the returned list and the report built from
+        it. They are not journaled, so a resumed run still searches them.
+        
+        Args:
+            books: Every book of the run, in catalog order
+        """
+        if self.sink is None:
+            return
+        for book in books:
+            if id(book) not in self._emitted:
+                self.sink.write(book)
+                self._emitted.add(id(book))
+    
+    @staticmethod
+    def _count_result(book: Book, stats: Dict[str, int]):
+        """
+        Update statistics with a processed book's availability.
+        
+        Args:
+            book: Processed Book object
+            stats: Statistics dictionary to update
+        """
+        if book.disponibilidad == "ENCONTRADO":
+            stats['found'] += 1
+        elif book.disponibilidad == "PARCIAL":
+            stats['partial'] += 1
+        else:
+            stats['not_found'] += 1
+    
+    @staticmethod
+    def print_statistics(stats: Dict[str, int], report: Optional[Dict] = None):
         """
         Print search statistics.
         
         Args:
             stats: Statistics dictionary
+            report: Run report (``analytics.build_report``) whose highlights
+                are printed too
         """
         print(f"\n{'='*60}")
         print("Resultados de la búsqueda:")
         print(f"{'='*60}")
         print(f"   Total procesado: {stats['total']}")
+        if not stats['total']:
+            # e.g. a shard that received no books of the catalog
+            print(f"{'='*60}\n")
+            return
         print(f"   Encontrados: {stats['found']} ({stats['found']/stats['total']*100:.1f}%)")
         print(f"   Parciales: {stats['partial']} ({stats['partial']/stats['total']*100:.1f}%)")
         print(f"   No encontrados: {stats['not_found']} ({stats['not_found']/stats['total']*100:.1f}%)")
 
         success_rate = (stats['found'] + stats['partial']) / stats['total'] * 100
         print(f"\n   Tasa de éxito: {success_rate:.1f}%")
+        if stats.get('prefilled'):
+            print(f"   Búsquedas por libro evitadas: {stats['prefilled']}")
+        if stats.get('duplicates'):
+            print(f"   Búsquedas ahorradas por duplicados: {stats['duplicates']}")
+        if stats.get('known_misses'):
+            print(f"   No encontrados conocidos sin volver a buscar: {stats['known_misses']}")
+        if 'requests' in stats:
+            print(f"   Peticiones de red: {stats['requests']} "
+                  f"({stats['requests_per_book']:.2f} por libro, "
+                  f"{stats['requests_per_found']:.2f} por libro encontrado)")
+        if stats.get('strategies_skipped'):
+            print(f"   Estrategias omitidas por bajo rendimiento: {stats['strategies_skipped']:.0f}")
+        if 'rate_limiter' in stats:
+            limiter = stats['rate_limiter']
+            print(f"   Ritmo final: {limiter['rate']:.2f} peticiones/s "
+                  f"(bloqueos: {limiter['throttles']}, errores: {limiter['errors']}, "
+                  f"espera total: {limiter['waited_seconds']:.1f}s)")
+        if stats.get('search_errors'):
+            print(f"   Búsquedas fallidas: {stats['search_errors']}")
+        for template, rate in stats.get('strategies', {}).items():
+            if rate['queries']:
+                print(f"   Estrategia '{template}': {rate['hits']:.0f}/{rate['queries']:.0f} "
+                      f"aciertos ({rate['hit_rate']*100:.1f}%)")
+        if report is not None:
+            print()
+            print_report(report)
         print(f"{'='*60}\n")
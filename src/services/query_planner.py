@@ -0,0 +1,101 @@
+"""Author-level query planning to reduce the number of searches."""
+
+from typing import Dict, List
+
+from src.clients.youtube_client import YouTubeClient
+from src.models.book import Book
+from src.utils.text import book_key, normalize_text
+
+
+class QueryPlanner:
+    """
+    Sends one broad query per author and matches the results locally
+    against all of that author's books.
+    
+    Books resolved this way skip their per-book search strategies; the
+    rest fall back to ``YouTubeClient.search_audiobook``.
+    """
+    
+    def __init__(
+        self,
+        youtube_client: YouTubeClient,
+        template: str = "{author} audiolibro",
+        limit: int = 30,
+        min_books: int = 2
+    ):
+        """
+        Initialize the planner.
+        
+        Args:
+            youtube_client: YouTube client instance
+            template: Author query template
+            limit: Number of videos fetched per author query
+            min_books: Minimum pending books for an author to get a broad query
+        """
+        self.youtube_client = youtube_client
+        self.template = template
+        self.limit = limit
+        self.min_books = min_books
+    
+    def plan(self, books: List[Book]) -> Dict[str, List[Book]]:
+        """
+        Group books by author, keeping authors worth a broad query.
+        
+        Args:
+            books: Books still to be searched
+            
+        Returns:
+            Dictionary mapping author name to their books, in catalog order
+        """
+        groups: Dict[str, List[Book]] = {}
+        for book in books:
+            groups.setdefault(normalize_text(book.autor), []).append(book)
+        
+        return {
+            group[0].autor: group
+            for group in groups.values()
+            if len(group) >= self.min_books
+        }
+    
+    def run(self, books: List[Book], show_progress: bool = True) -> Dict[str, Dict[str, str]]:
+        """
+        Run the author queries and match their videos to the author's books.
+        
+        Args:
+            books: Books still to be searched
+            show_progress: Whether to show progress messages
+            
+        Returns:
+            Dictionary mapping book key to the video info found for it
+        """
+        plan = self.plan(books)
+        if show_progress and plan:
+            print(f"Consultas por autor: {len(plan)} autores, "
+                  f"{sum(len(group) for group in plan.values())} libros")
+        
+        results: Dict[str, Dict[str, str]] = {}
+        for author, group in plan.items():
+            try:
+                videos = self.youtube_client.fetch_videos(self.template.format(author=author), self.limit)
+            except Exception as e:
+                print(f"   Error en consulta de autor {author}: {e}")
+                continue
+            
+            titles = [video['title'] for video in videos]
+            resolved = 0
+            for book in group:
+                key = book_key(book.titulo, book.autor)
+                if key in results:
+                    continue
+                signature = self.youtube_client.signature_for(book.titulo, book.autor)
+                for video, is_match in zip(videos, signature.matches_many(titles)):
+                    result = self.youtube_client.build_result(video) if is_match else None
+                    if result:
+                        results[key] = result
+                        resolved += 1
+                        break
+            
+            if show_progress:
+                print(f"   {author}: {resolved}/{len(group)} libros resueltos")
+        
+        return results
@@ -2,6 +2,16 @@
 
 from .config import config
 from .file_handler import FileHandler
+from .catalog_loader import CatalogCache
 from .dominican_books import DOMINICAN_BOOKS
+from .search_cache import SearchCache
+from .journal import RunJournal
+from .video_index import VideoIndex
+from .rate_limiter import RateLimiter
+from .search_archive import SearchArchive
+from .metrics import Metrics, metrics
+from .strategy_stats import StrategyStats
+from .negative_cache import NegativeCache
+from .result_sink import ResultSink
 
-__all__ = ['config', 'FileHandler', 'DOMINICAN_BOOKS']
+__all__ = ['config', 'FileHandler', 'CatalogCache', 'DOMINICAN_BOOKS', 'SearchCache', 'RunJournal', 'VideoIndex', 'RateLimiter', 'SearchArchive', 'Metrics', 'metrics', 'StrategyStats', 'NegativeCache', 'ResultSink']
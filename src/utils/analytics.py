@@ -0,0 +1,168 @@
+"""Run report computed column-wise over the whole result set."""
+
+import json
+import os
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..models.book import Book
+from ..models.catalog import BookCatalog
+
+# Duration ranges of found videos, in seconds
+DURATION_BINS = [0, 15 * 60, 3600, 3 * 3600, 6 * 3600, np.inf]
+DURATION_LABELS = ['< 15 min', '15-60 min', '1-3 h', '3-6 h', '> 6 h']
+
+# Report groupings: report key -> (book field, Resumen sheet column title)
+GROUPINGS = {
+    'by_section': ('seccion', 'Sección'),
+    'by_content_type': ('tipo_contenido', 'Tipo Contenido'),
+    'by_author': ('autor', 'Autor'),
+}
+
+
+def build_report(books: Union[BookCatalog, Iterable[Book]]) -> Dict:
+    """
+    Summarize a run's results.
+    
+    Every figure is computed with vectorized pandas operations over the
+    catalog's columns, so the cost stays small for very large result sets.
+    
+    Args:
+        books: Processed books (a BookCatalog is used as is)
+    
+    Returns:
+        Report with overall counts, audio hours, the duration distribution
+        of found videos and per-section, per-content-type and per-author
+        hit rates
+    """
+    catalog = books if isinstance(books, BookCatalog) else BookCatalog(books)
+    frame = catalog.to_pandas(export=False)
+    
+    status = frame['disponibilidad']
+    frame['found'] = status == "ENCONTRADO"
+    frame['partial'] = status == "PARCIAL"
+    hits = frame['found'] | frame['partial']
+    # Only durations of accepted videos count as available audio
+    seconds = frame['duracion_segundos'].where(hits)
+    frame['hours'] = seconds / 3600
+    
+    total = len(frame)
+    found = int(frame['found'].sum())
+    partial = int(frame['partial'].sum())
+    report = {
+        'books': total,
+        'found': found,
+        'partial': partial,
+        'not_found': total - found - partial,
+        'hit_rate': round((found + partial) / total, 4) if total else 0.0,
+        'audio_hours': round(float(frame['hours'].sum()), 2),
+        'durations': _durations(seconds),
+    }
+    for key, (field, _) in GROUPINGS.items():
+        report[key] = _group(frame, field)
+    return report
+
+
+def _durations(seconds: pd.Series) -> Dict:
+    """Distribution of the known durations, in minutes."""
+    seconds = seconds.dropna()
+    minutes = seconds / 60
+    bins = pd.cut(seconds, DURATION_BINS, labels=DURATION_LABELS, right=False)
+    counts = bins.value_counts(sort=False)
+    return {
+        'count': int(len(minutes)),
+        'mean_minutes': round(float(minutes.mean()), 1) if len(minutes) else 0.0,
+        'p50_minutes': round(float(minutes.quantile(0.5)), 1) if len(minutes) else 0.0,
+        'p90_minutes': round(float(minutes.quantile(0.9)), 1) if len(minutes) else 0.0,
+        'max_minutes': round(float(minutes.max()), 1) if len(minutes) else 0.0,
+        'bins': {label: int(counts[label]) for label in DURATION_LABELS},
+    }
+
+
+def _group(frame: pd.DataFrame, field: str) -> List[Dict]:
+    """Books, hits and audio hours per value of a field, most books first."""
+    grouped = frame.groupby(field, observed=True, sort=False).agg(
+        books=('numero', 'size'),
+        found=('found', 'sum'),
+        partial=('partial', 'sum'),
+        hours=('hours', 'sum'),
+    )
+    grouped['hit_rate'] = ((grouped['found'] + grouped['partial']) / grouped['books']).round(4)
+    grouped['hours'] = grouped['hours'].round(2)
+    grouped = grouped.sort_values(['books', 'hit_rate'], ascending=False, kind='stable')
+    return [
+        {'name': str(name), 'books': int(books), 'found': int(found), 'partial': int(partial),
+         'hit_rate': float(hit_rate), 'hours': float(hours)}
+        for name, books, found, partial, hours, hit_rate in grouped.itertuples()
+    ]
+
+
+def write_report(report: Dict, filename: str):
+    """
+    Write the report as JSON.
+    
+    Args:
+        report: Report from ``build_report``
+        filename: Output path
+    """
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def summary_rows(report: Dict) -> Iterator[Tuple[bool, list]]:
+    """
+    Lay out the report as the rows of the Excel "Resumen" sheet.
+    
+    Args:
+        report: Report from ``build_report``
+    
+    Yields:
+        Tuples of (is a header row, cell values)
+    """
+    yield True, ['Resumen', 'Valor']
+    yield False, ['Libros', report['books']]
+    yield False, ['Encontrados', report['found']]
+    yield False, ['Parciales', report['partial']]
+    yield False, ['No encontrados', report['not_found']]
+    yield False, ['Tasa de éxito (%)', round(report['hit_rate'] * 100, 1)]
+    yield False, ['Horas de audio', report['audio_hours']]
+    yield False, []
+    
+    durations = report['durations']
+    yield True, ['Duración', 'Libros']
+    for label, count in durations['bins'].items():
+        yield False, [label, count]
+    yield False, ['Media (min)', durations['mean_minutes']]
+    yield False, ['Mediana (min)', durations['p50_minutes']]
+    yield False, ['Percentil 90 (min)', durations['p90_minutes']]
+    
+    for key, (_, title) in GROUPINGS.items():
+        yield False, []
+        yield True, [title, 'Libros', 'Encontrados', 'Parciales', 'Tasa de éxito (%)', 'Horas']
+        for row in report[key]:
+            yield False, [row['name'], row['books'], row['found'], row['partial'],
+                          round(row['hit_rate'] * 100, 1), row['hours']]
+
+
+def print_report(report: Dict):
+    """
+    Print the highlights of the report.
+    
+    Args:
+        report: Report from ``build_report``
+    """
+    durations = report['durations']
+    print(f"   Horas de audio encontradas: {report['audio_hours']:.1f} "
+          f"(mediana {durations['p50_minutes']:.0f} min por video)")
+    for key, title in (('by_section', 'sección'), ('by_content_type', 'tipo de contenido')):
+        rows = [row for row in report[key] if row['name'] != "N/A"][:5]
+        if rows:
+            print(f"   Por {title}:")
+            for row in rows:
+                print(f"      {row['name']}: {row['found'] + row['partial']}/{row['books']} "
+                      f"({row['hit_rate'] * 100:.0f}%), {row['hours']:.1f} h")
@@ -0,0 +1,242 @@
+"""Streaming catalog readers for text, CSV, JSON Lines and Parquet files."""
+
+import csv
+import hashlib
+import json
+import os
+import pickle
+import re
+import sys
+import tempfile
+from typing import Dict, Iterable, Iterator, Optional
+
+from ..models.book import Book
+from ..models.catalog import FIELDS, BookCatalog
+from .text import normalize_text
+
+# Section headers in the books file, e.g. "# 1) DRAMA (TEATRO)"
+SECTION_HEADER = re.compile(r'^#\s*\d+\)\s*(.+?)\s*$')
+
+# Accepted column names of tabular catalogs, normalized, per Book field
+COLUMN_ALIASES = {
+    'titulo': ('titulo', 'titulo libro', 'title'),
+    'autor': ('autor', 'author'),
+    'año': ('ano', 'year'),
+    'seccion': ('seccion', 'genero', 'section', 'genre'),
+}
+
+# Bump when parsing changes, so cached catalogs are parsed again
+CACHE_FORMAT = 2
+
+
+def iter_text_books(lines: Iterable[str]) -> Iterator[Book]:
+    """
+    Parse books from lines in the "Título | Autor | Año" format.
+    
+    Books are numbered from 1 in order, skipping comments and blank lines,
+    and take the section of the last "# N) SECCIÓN" header above them.
+    
+    Args:
+        lines: Lines of the books file
+    
+    Yields:
+        Book objects
+    """
+    numero = 0
+    section = "N/A"
+    for line in lines:
+        line = line.strip()
+        
+        header = SECTION_HEADER.match(line)
+        if header:
+            section = sys.intern(header.group(1))
+            continue
+        
+        # Skip empty lines and comments
+        if not line or line.startswith('#'):
+            continue
+        
+        book = Book.create_from_text(numero + 1, line, section)
+        if book:
+            numero += 1
+            yield book
+
+
+def iter_record_books(records: Iterable[Dict[str, object]]) -> Iterator[Book]:
+    """
+    Build books from tabular records (CSV rows, JSON objects, Parquet rows).
+    
+    Columns are matched by name through ``COLUMN_ALIASES`` (accents and case
+    are ignored, so exported "Título Libro" columns work too). Records
+    without a title or an author are skipped; books are numbered from 1.
+    
+    Args:
+        records: Dictionaries mapping column name to value
+    
+    Yields:
+        Book objects
+    """
+    columns: Dict[str, str] = {}
+    numero = 0
+    for record in records:
+        if not columns:
+            names = {normalize_text(str(name)): name for name in record}
+            for field, aliases in COLUMN_ALIASES.items():
+                for alias in aliases:
+                    if alias in names:
+                        columns[field] = names[alias]
+                        break
+        
+        values = {}
+        for field, column in columns.items():
+            value = record.get(column)
+            value = '' if value is None else ' '.join(str(value).split())
+            if value:
+                values[field] = value
+        if 'titulo' not in values or 'autor' not in values:
+            continue
+        
+        numero += 1
+        yield Book(
+            numero=numero,
+            titulo=values['titulo'],
+            autor=sys.intern(values['autor']),
+            año=values.get('año', "N/A"),
+            seccion=sys.intern(values.get('seccion', "N/A"))
+        )
+
+
+def iter_books(filename: str) -> Iterator[Book]:
+    """
+    Stream the books of a catalog file, one at a time.
+    
+    The format is taken from the extension: .csv, .jsonl/.ndjson, .parquet,
+    and the "Título | Autor | Año" text format for anything else.
+    
+    Args:
+        filename: Path to the catalog file
+    
+    Yields:
+        Book objects, numbered from 1 in file order
+    
+    Raises:
+        ImportError: For Parquet files when pyarrow is not installed
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == '.parquet':
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet catalogs need pyarrow: pip install pyarrow") from None
+        parquet = pq.ParquetFile(filename)
+        yield from iter_record_books(
+            record for batch in parquet.iter_batches() for record in batch.to_pylist()
+        )
+        return
+    
+    # utf-8-sig drops the BOM that Excel writes at the start of "CSV UTF-8" files
+    with open(filename, 'r', encoding='utf-8-sig', newline='') as f:
+        if extension == '.csv':
+            yield from iter_record_books(csv.DictReader(f))
+        elif extension in ('.jsonl', '.ndjson'):
+            yield from iter_record_books(json.loads(line) for line in f if line.strip())
+        else:
+            yield from iter_text_books(f)
+
+
+def file_digest(filename: str) -> str:
+    """
+    Hash a file's contents.
+    
+    Args:
+        filename: Path to the file
+    
+    Returns:
+        Hex SHA-1 digest
+    """
+    digest = hashlib.sha1()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CatalogCache:
+    """
+    Parsed catalogs stored as pickled ``BookCatalog`` files keyed by the
+    hash of the source file.
+    
+    An unchanged catalog is loaded without parsing it again; any edit
+    changes the hash, so a stale entry is never used. Only the most recently
+    used ``max_entries`` catalogs are kept.
+    """
+    
+    def __init__(self, directory: str, max_entries: int = 8):
+        """
+        Initialize the cache.
+        
+        Args:
+            directory: Directory holding the cached catalogs
+            max_entries: Cached catalogs kept
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+        self.hit = False
+    
+    def _path(self, digest: str) -> str:
+        version = f"{CACHE_FORMAT}-{len(FIELDS)}"
+        return os.path.join(self.directory, f"{digest}-v{version}.pickle")
+    
+    def load(self, filename: str) -> Optional[BookCatalog]:
+        """
+        Get the parsed catalog of a file, parsing it only on a cache miss.
+        
+        Args:
+            filename: Path to the catalog file
+        
+        Returns:
+            BookCatalog (empty if the file holds no books, which is not
+            cached), or None if the file does not exist
+        
+        Raises:
+            ImportError: For Parquet files when pyarrow is not installed
+        """
+        if not os.path.exists(filename):
+            return None
+        
+        path = self._path(file_digest(filename))
+        self.hit = False
+        try:
+            with open(path, 'rb') as f:
+                catalog = pickle.load(f)
+            os.utime(path)
+            self.hit = True
+            return catalog
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Caché de catálogo ilegible, se vuelve a leer {filename}: {e}")
+        
+        catalog = BookCatalog(iter_books(filename))
+        if catalog:
+            self._store(path, catalog)
+        return catalog
+    
+    def _store(self, path: str, catalog: BookCatalog):
+        """Write a catalog atomically and drop the least recently used ones."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(catalog, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, path)
+        
+        try:
+            entries = sorted(
+                (os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith('.pickle')),
+                key=os.path.getmtime,
+                reverse=True
+            )
+            for stale in entries[self.max_entries:]:
+                os.remove(stale)
+        except OSError:
+            pass  # another process (e.g. a local shard) pruned it first
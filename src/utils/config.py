@@ -2,6 +2,7 @@
 
 import os
 from pathlib import Path
+from typing import List, Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -16,15 +17,55 @@ class Config:
     # YouTube search settings
     SEARCH_TIMEOUT: int = 30
     VIDEOS_PER_SEARCH: int = 3
+    AUTHOR_QUERY_TEMPLATE: str = "{author} audiolibro"
+    AUTHOR_QUERY_LIMIT: int = 30  # Videos fetched per author-level query
+    AUTHOR_QUERY_MIN_BOOKS: int = 2  # Pending books needed for an author-level query
+    HEDGE_DELAY: Optional[float] = None  # Seconds between parallel strategies (None = sequential)
+    STRATEGY_MIN_QUERIES: int = 20  # Queries in a section before a strategy can be skipped
+    STRATEGY_SKIP_BELOW: float = 0.02  # Expected hit rate under which a strategy is skipped
+    DEDUP_SIMILARITY: float = 0.9  # Title/author similarity from which catalog rows are one work
     
     # File paths
     PROJECT_ROOT: Path = Path(__file__).parent.parent.parent
     BOOKS_FILE: str = "books_list.txt"
     OUTPUT_FILE: str = "dominican_audiobooks.xlsx"
-    OUTPUT_CSV: str = "dominican_audiobooks.csv"
+    OUTPUT_CSV: str = "dominican_audiobooks.csv"  # Written book by book during the run
+    OUTPUT_JSONL: Optional[str] = None  # Optional JSON Lines copy of the streamed results
+    RESULTS_FLUSH_EVERY: int = 20  # Books between flushes of the streamed results
+    REPORT_JSON_FILE: str = "run_report.json"  # Hit rates and audio hours per section/type/author
+    METRICS_JSON_FILE: str = "run_metrics.json"  # Per-run latency/hit-rate summary
+    METRICS_PROM_FILE: str = "run_metrics.prom"  # Same metrics in Prometheus text format
+    SHARD_DIR: str = "shards"  # Partial results of "--shard i/N" runs
+    KEYWORD_RULES_FILE: str = "keyword_rules.json"  # Optional overrides for the keyword tables
+    CACHE_DIR: str = ".cache"
+    SEARCH_CACHE_FILE: str = os.path.join(CACHE_DIR, "search_cache.sqlite")
+    JOURNAL_FILE: str = os.path.join(CACHE_DIR, "run_journal.jsonl")
+    CATALOG_CACHE_DIR: str = os.path.join(CACHE_DIR, "catalogs")  # Parsed catalogs keyed by file hash
+    VIDEO_INDEX_FILE: str = os.path.join(CACHE_DIR, "video_index.sqlite")
+    SEARCH_ARCHIVE_FILE: str = os.path.join(CACHE_DIR, "search_archive.jsonl.gz")
+    STRATEGY_STATS_FILE: str = os.path.join(CACHE_DIR, "strategy_stats.sqlite")
+    NEGATIVE_CACHE_FILE: str = os.path.join(CACHE_DIR, "negative_cache.sqlite")
+    NEGATIVE_CACHE_SCHEDULE_DAYS: List[float] = [1, 3, 7, 14, 30]  # Re-check after the 1st, 2nd... miss
+    
+    # Audiobook channels and playlists crawled by "main.py crawl"
+    CRAWL_CHANNELS: List[str] = []  # Channel URLs, "@username" or channel ids
+    CRAWL_PLAYLISTS: List[str] = []  # Playlist ids
+    CRAWL_LIMIT: Optional[int] = None  # Videos per channel/playlist (None = all)
+    
+    # Search cache settings
+    SEARCH_CACHE_TTL_HOURS: float = float(os.getenv("BOOKS_EATER_CACHE_TTL_HOURS", "72"))
+    SEARCH_CACHE_MAX_ENTRIES: int = 50000
     
     # Processing settings
-    SLEEP_BETWEEN_SEARCHES: int = 2  # Seconds to wait between searches
+    SLEEP_BETWEEN_SEARCHES: int = 2  # Initial seconds between searches (the rate limiter adapts it)
+    RATE_LIMIT_MIN: float = 0.1  # Lowest search rate in requests per second
+    RATE_LIMIT_MAX: float = 5.0  # Highest search rate in requests per second
+    SEARCH_MAX_RETRIES: int = 2  # Retries of a search after throttling or errors
+    HTTP_POOL_SIZE: int = 16  # Keep-alive connections shared by all workers
+    HTTP_TIMEOUT: float = 15.0  # Seconds before an HTTP request is abandoned
+    INCREMENTAL_MAX_AGE_DAYS: float = 30  # Re-search found books older than this
+    MAX_WORKERS: int = int(os.getenv("BOOKS_EATER_WORKERS", "1"))  # Books searched concurrently
+    ASYNC_CONCURRENCY: int = 100  # Books in flight with --async
     
     @classmethod
     def validate(cls) -> bool:
@@ -0,0 +1,27 @@
+"""SQLite connections shared by the on-disk caches."""
+
+import sqlite3
+
+# Seconds a connection waits for another process's write lock
+BUSY_TIMEOUT = 30.0
+
+
+def connect(filename: str) -> sqlite3.Connection:
+    """
+    Open a cache database that several processes can use at once.
+    
+    Local shard processes share the search cache, the negative cache and
+    the strategy statistics. The database uses write-ahead logging, so
+    readers never block the writer, and a connection waits up to
+    ``BUSY_TIMEOUT`` seconds for a lock instead of failing with
+    "database is locked".
+    
+    Args:
+        filename: Path to the SQLite file
+    
+    Returns:
+        Connection usable from any thread (callers serialize access)
+    """
+    conn = sqlite3.connect(filename, timeout=BUSY_TIMEOUT, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    return conn
@@ -0,0 +1,140 @@
+"""Detection of catalog rows that name the same work."""
+
+import re
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..models.book import Book
+from .matching import COMMON_WORDS, tokenize
+from .text import book_key, normalize_text
+
+# Number tokens: digits, Roman numerals and Spanish numerals/ordinals
+_NUMBER = re.compile(r'\d+|(?=[ivxlcdm])m{0,3}(?:cm|cd|d?c{0,3})(?:xc|xl|l?x{0,3})(?:ix|iv|v?i{0,3})')
+NUMBER_WORDS = frozenset({
+    'uno', 'dos', 'tres', 'cuatro', 'cinco', 'seis', 'siete', 'ocho', 'nueve', 'diez',
+    'primer', 'primero', 'primera', 'segundo', 'segunda', 'tercer', 'tercero', 'tercera',
+    'cuarto', 'cuarta', 'quinto', 'quinta', 'sexto', 'sexta', 'septimo', 'septima',
+    'octavo', 'octava', 'noveno', 'novena', 'decimo', 'decima',
+})
+
+# Titles with fewer significant words only match exactly ("La noche" and
+# "La noches", "Cuento de Navidad" and "Cuentos de Navidad" are different works)
+MIN_FUZZY_TITLE_WORDS = 3
+
+
+def title_key(titulo: str) -> str:
+    """
+    Normalize a title for duplicate detection.
+    
+    Accents, case, punctuation and articles/prepositions are dropped, so
+    "El Masacre se pasa a pie" and "Masacre se pasa a pie." share a key.
+    
+    Args:
+        titulo: Book title
+    
+    Returns:
+        Space-separated significant words (the normalized title if none)
+    """
+    words = [word for word in tokenize(titulo) if word not in COMMON_WORDS]
+    return ' '.join(words) or normalize_text(titulo)
+
+
+def author_key(autor: str) -> str:
+    """
+    Normalize an author name for duplicate detection.
+    
+    Args:
+        autor: Author name
+    
+    Returns:
+        Space-separated name words without accents or punctuation
+    """
+    return ' '.join(tokenize(autor)) or normalize_text(autor)
+
+
+def _numbers(key: str) -> List[str]:
+    """Number tokens of a key, in order (volumes, years, parts)."""
+    return [word for word in key.split() if word in NUMBER_WORDS or _NUMBER.fullmatch(word)]
+
+
+def _closest(text: str, candidates: Sequence[Tuple[str, Book]], threshold: float) -> Optional[Book]:
+    """
+    Find the candidate whose key is most similar to ``text``.
+    
+    Keys with different number tokens (volumes as "2", "II" or "segundo",
+    years in titles) never match.
+    
+    Args:
+        text: Key of the book being checked
+        candidates: (key, representative book) pairs to compare with
+        threshold: Minimum similarity ratio between 0 and 1
+    
+    Returns:
+        Best representative at or above the threshold, or None
+    """
+    if not candidates:
+        return None
+    best, best_ratio = None, threshold
+    numbers = _numbers(text)
+    matcher = SequenceMatcher(None, '', text, autojunk=False)
+    for candidate, book in candidates:
+        matcher.set_seq1(candidate)
+        if (
+            matcher.real_quick_ratio() >= best_ratio
+            and matcher.quick_ratio() >= best_ratio
+            and _numbers(candidate) == numbers
+        ):
+            ratio = matcher.ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = book, ratio
+    return best
+
+
+def find_duplicates(books: Iterable[Book], threshold: float = 0.9) -> Tuple[List[Book], Dict[str, List[Book]]]:
+    """
+    Group catalog rows that are the same work.
+    
+    Rows with equal title and author keys are duplicates. With a threshold
+    below 1, a row is also a duplicate when one key is equal and the other
+    is at least ``threshold`` similar (a typo or variant spelling of the
+    title, or of the author's name). Short titles and titles with different
+    number tokens are only compared exactly. The first row of each work, in
+    catalog order, represents it.
+    
+    Args:
+        books: Catalog rows
+        threshold: Minimum similarity ratio for near-duplicates (1 for
+            exact keys only)
+    
+    Returns:
+        Tuple of (representative books in catalog order, duplicates keyed
+        by the ``book_key`` of their representative)
+    """
+    unique: List[Book] = []
+    duplicates: Dict[str, List[Book]] = {}
+    exact: Dict[Tuple[str, str], Book] = {}
+    by_author: Dict[str, List[Tuple[str, Book]]] = {}
+    by_title: Dict[str, List[Tuple[str, Book]]] = {}
+    
+    for book in books:
+        title, author = title_key(book.titulo), author_key(book.autor)
+        fuzzy_title = len(title.split()) >= MIN_FUZZY_TITLE_WORDS
+        representative = exact.get((title, author))
+        if representative is None and threshold < 1:
+            representative = (
+                (_closest(title, by_author.get(author, ()), threshold) if fuzzy_title else None)
+                or _closest(author, by_title.get(title, ()), threshold)
+            )
+            if representative is not None:
+                exact[(title, author)] = representative
+        
+        if representative is None:
+            exact[(title, author)] = book
+            if fuzzy_title:
+                by_author.setdefault(author, []).append((title, book))
+            by_title.setdefault(title, []).append((author, book))
+            unique.append(book)
+        else:
+            duplicates.setdefault(book_key(representative.titulo, representative.autor), []).append(book)
+    
+    return unique, duplicates
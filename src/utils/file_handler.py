@@ -1,11 +1,50 @@
 """File handling utilities for reading and writing data."""
 
+import csv
 import os
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
 import pandas as pd
-from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+from openpyxl.utils import get_column_letter
 
 from ..models.book import Book
+from ..models.catalog import BookCatalog
+from .analytics import summary_rows
+from .catalog_loader import iter_books
+from .text import book_key
+
+# Export columns, in the order of Book.to_dict
+EXPORT_COLUMNS = list(Book(numero=0, titulo='', autor='', año='').to_dict())
+
+# Excel column widths, in export column order
+EXCEL_COLUMN_WIDTHS = [
+    10,  # Número
+    40,  # Título Libro
+    30,  # Autor
+    10,  # Año
+    60,  # URL YouTube
+    15,  # Duración
+    25,  # Tipo Contenido
+    15,  # Disponibilidad
+    20,  # Fecha Búsqueda
+]
+
+# Column widths of the "Resumen" sheet
+SUMMARY_COLUMN_WIDTHS = [40, 12, 14, 12, 18, 12]
+
+
+# Shared cell styles of the Excel export: name -> (fill color, font options)
+EXCEL_STYLES = {
+    'header': ('366092', {'bold': True, 'color': 'FFFFFF'}),
+    'centered': (None, {}),
+    'found': ('C6EFCE', {'color': '006100'}),
+    'partial': ('FFEB9C', {'color': '9C5700'}),
+    'not_found': ('FFC7CE', {'color': '9C0006'}),
+}
+AVAILABILITY_STYLES = {'ENCONTRADO': 'found', 'PARCIAL': 'partial'}
 
 
 class FileHandler:
@@ -16,9 +55,11 @@ class FileHandler:
     @staticmethod
     def load_books_from_file(filename: str) -> Optional[List[Book]]:
         """
-        Load book list from a text file.
+        Load book list from a catalog file.
         
-        Format: Título | Autor | Año
+        Format: Título | Autor | Año, or a CSV/JSON Lines/Parquet file
+        (see ``catalog_loader.iter_books``). Books are numbered from 1 and
+        take the section of the last "# N) SECCIÓN" header above them.
         
         Args:
             filename: Path to the books file
@@ -30,19 +71,7 @@ class FileHandler:
             if not os.path.exists(filename):
                 return None
             
-            books = []
-            with open(filename, 'r', encoding='utf-8') as f:
-                for idx, line in enumerate(f, 1):
-                    line = line.strip()
-                    
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    book = Book.create_from_text(idx, line)
-                    if book:
-                        books.append(book)
-            
+            books = list(iter_books(filename))
             return books if books else None
             
         except Exception as e:
@@ -50,80 +79,104 @@ class FileHandler:
             return None
     
     @staticmethod
-    def save_to_excel(books: List[Book], filename: str) -> bool:
+    def load_previous_results(filename: str) -> Dict[str, Book]:
+        """
+        Load the results of a previous run from its CSV or Excel output.
+        
+        Rows without a 'Fecha Búsqueda' value (files written before that
+        column existed) are dated with the file's modification time.
+        
+        Args:
+            filename: Path to a previous CSV/xlsx output
+            
+        Returns:
+            Dictionary mapping normalized title+author key to Book
+        """
+        try:
+            if not os.path.exists(filename):
+                return {}
+            
+            if filename.endswith('.xlsx'):
+                df = pd.read_excel(filename, dtype=str)
+            else:
+                df = pd.read_csv(filename, dtype=str, encoding='utf-8')
+            df = df.fillna('N/A')
+            
+            file_date = datetime.fromtimestamp(os.path.getmtime(filename)).isoformat(timespec='seconds')
+            if 'Fecha Búsqueda' not in df.columns:
+                df['Fecha Búsqueda'] = file_date
+            df.loc[df['Fecha Búsqueda'] == 'N/A', 'Fecha Búsqueda'] = file_date
+            
+            results = {}
+            for row in df.to_dict('records'):
+                book = Book.from_dict(row)
+                results[book_key(book.titulo, book.autor)] = book
+            return results
+            
+        except Exception as e:
+            print(f"Error leyendo resultados previos {filename}: {e}")
+            return {}
+    
+    @staticmethod
+    def save_to_excel(books: List[Book], filename: str, summary: Optional[Dict] = None) -> bool:
         """
         Save books to Excel file with formatting.
         
         Args:
             books: List of Book objects
             filename: Output filename
+            summary: Run report (``analytics.build_report``) to add as a
+                "Resumen" sheet
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Convert books to dictionaries
-            data = [book.to_dict() for book in books]
-            
-            # Create DataFrame
-            df = pd.DataFrame(data)
-            
-            # Write to Excel with formatting
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Audiolibros Dominicanos')
-                
-                worksheet = writer.sheets['Audiolibros Dominicanos']
-                
-                # Set column widths
-                column_widths = {
-                    'A': 10,  # Número
-                    'B': 40,  # Título Libro
-                    'C': 30,  # Autor
-                    'D': 10,  # Año
-                    'E': 60,  # URL YouTube
-                    'F': 15,  # Duración
-                    'G': 25,  # Tipo Contenido
-                    'H': 15,  # Disponibilidad
-                }
-                
-                for col, width in column_widths.items():
-                    worksheet.column_dimensions[col].width = width
-                
-                # Format header row
-                header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-                header_font = Font(bold=True, color='FFFFFF')
-                
-                for cell in worksheet[1]:
-                    cell.fill = header_fill
-                    cell.font = header_font
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-                
-                # Format data rows
-                for row in range(2, len(books) + 2):
-                    # Align cells
-                    worksheet.cell(row=row, column=1).alignment = Alignment(horizontal='center')  # Número
-                    worksheet.cell(row=row, column=4).alignment = Alignment(horizontal='center')  # Año
-                    worksheet.cell(row=row, column=6).alignment = Alignment(horizontal='center')  # Duración
-                    worksheet.cell(row=row, column=8).alignment = Alignment(horizontal='center')  # Disponibilidad
-                    
-                    # Color code availability
-                    disponibilidad = worksheet.cell(row=row, column=8).value
-                    if disponibilidad == "ENCONTRADO":
-                        worksheet.cell(row=row, column=8).fill = PatternFill(
-                            start_color='C6EFCE', end_color='C6EFCE', fill_type='solid'
-                        )
-                        worksheet.cell(row=row, column=8).font = Font(color='006100')
-                    elif disponibilidad == "PARCIAL":
-                        worksheet.cell(row=row, column=8).fill = PatternFill(
-                            start_color='FFEB9C', end_color='FFEB9C', fill_type='solid'
-                        )
-                        worksheet.cell(row=row, column=8).font = Font(color='9C5700')
-                    else:  # NO ENCONTRADO
-                        worksheet.cell(row=row, column=8).fill = PatternFill(
-                            start_color='FFC7CE', end_color='FFC7CE', fill_type='solid'
-                        )
-                        worksheet.cell(row=row, column=8).font = Font(color='9C0006')
+            FileHandler._write_excel((list(book.to_dict().values()) for book in books), filename, summary)
+            print(f"Excel guardado exitosamente: {filename}")
+            return True
             
+        except Exception as e:
+            print(f"Error guardando Excel: {e}")
+            return False
+    
+    @staticmethod
+    def save_stream_to_excel(csv_file: str, filename: str, summary: Optional[Dict] = None) -> bool:
+        """
+        Build the Excel file from the CSV streamed by a ResultSink.
+        
+        The stream is in completion order. When it is already sorted by
+        Número (a plain run) its rows go straight to the sheet; otherwise
+        (resumed or incremental runs) they are sorted in memory first.
+        
+        Args:
+            csv_file: CSV written by the result sink
+            filename: Output filename
+            summary: Run report to add as a "Resumen" sheet
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            def read_rows():
+                with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+                    reader = csv.reader(f)
+                    next(reader, None)  # header
+                    for row in reader:
+                        if row:
+                            row[0] = int(row[0])
+                            yield row
+            
+            last = None
+            in_order = True
+            for row in read_rows():
+                if last is not None and row[0] < last:
+                    in_order = False
+                    break
+                last = row[0]
+            
+            rows = read_rows() if in_order else sorted(read_rows(), key=lambda row: row[0])
+            FileHandler._write_excel(rows, filename, summary)
             print(f"Excel guardado exitosamente: {filename}")
             return True
             
@@ -131,6 +184,58 @@ class FileHandler:
             print(f"Error guardando Excel: {e}")
             return False
     
+    @staticmethod
+    def _write_excel(rows: Iterable[list], filename: str, summary: Optional[Dict] = None):
+        """
+        Stream export rows to a formatted Excel sheet.
+        
+        Uses openpyxl's write-only mode, so rows are written as they come
+        and never held as cells in memory. Cells share a few named styles
+        instead of getting their own Alignment/Font/PatternFill objects.
+        
+        Args:
+            rows: Rows with the values of the export columns, in order
+            filename: Output filename
+            summary: Run report to add as a "Resumen" sheet
+        """
+        workbook = Workbook(write_only=True)
+        for name, (fill, font) in EXCEL_STYLES.items():
+            style = NamedStyle(name=name, font=Font(**font), alignment=Alignment(horizontal='center', vertical='center'))
+            if fill:
+                style.fill = PatternFill(start_color=fill, end_color=fill, fill_type='solid')
+            workbook.add_named_style(style)
+        worksheet = workbook.create_sheet('Audiolibros Dominicanos')
+        
+        # Set column widths
+        for index, width in enumerate(EXCEL_COLUMN_WIDTHS, 1):
+            worksheet.column_dimensions[get_column_letter(index)].width = width
+        
+        def styled(value, style: str) -> WriteOnlyCell:
+            cell = WriteOnlyCell(worksheet, value)
+            cell.style = style
+            return cell
+        
+        worksheet.append([styled(name, 'header') for name in EXPORT_COLUMNS])
+        
+        # Número, Año, Duración centered; Disponibilidad colored by value
+        for row in rows:
+            row = list(row)
+            for column in (0, 3, 5):
+                row[column] = styled(row[column], 'centered')
+            row[7] = styled(row[7], AVAILABILITY_STYLES.get(row[7], 'not_found'))
+            worksheet.append(row)
+        
+        if summary is not None:
+            sheet = workbook.create_sheet('Resumen')
+            for index, width in enumerate(SUMMARY_COLUMN_WIDTHS, 1):
+                sheet.column_dimensions[get_column_letter(index)].width = width
+            for header, values in summary_rows(summary):
+                if header:
+                    values = [styled(value, 'header') for value in values]
+                sheet.append(values)
+        
+        workbook.save(filename)
+    
     @staticmethod
     def save_to_csv(books: List[Book], filename: str) -> bool:
         """
@@ -144,9 +249,7 @@ class FileHandler:
             True if successful, False otherwise
         """
         try:
-            data = [book.to_dict() for book in books]
-            df = pd.DataFrame(data)
-            df.to_csv(filename, index=False, encoding='utf-8')
+            BookCatalog(books).to_pandas().to_csv(filename, index=False, encoding='utf-8')
             
             print(f"CSV guardado exitosamente: {filename}")
             return True
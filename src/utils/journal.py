@@ -0,0 +1,95 @@
+"""Append-only journal of processed books for checkpoint/resume."""
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict
+from typing import Dict
+
+from ..models.book import Book, parse_duration
+from .text import book_key
+
+
+class RunJournal:
+    """
+    JSON Lines journal with one record per processed book.
+    
+    Each record is written and flushed as soon as a book finishes, so an
+    interrupted run can be resumed without searching those books again.
+    """
+    
+    # Book fields restored from a journal record
+    RESULT_FIELDS = ('url_youtube', 'duracion', 'tipo_contenido', 'disponibilidad', 'fecha_busqueda')
+    
+    def __init__(self, filename: str):
+        """
+        Initialize the journal.
+        
+        Args:
+            filename: Path to the JSON Lines file
+        """
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.filename = filename
+        self._lock = threading.Lock()
+    
+    def append(self, book: Book):
+        """
+        Append a processed book to the journal.
+        
+        Args:
+            book: Processed Book object
+        """
+        record = asdict(book)
+        record['key'] = book_key(book.titulo, book.autor)
+        record['timestamp'] = time.time()
+        line = json.dumps(record, ensure_ascii=False)
+        
+        with self._lock:
+            with open(self.filename, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+    
+    def load(self) -> Dict[str, dict]:
+        """
+        Read every complete record from the journal.
+        
+        A truncated last line (e.g. from a crash mid-write) is ignored.
+        
+        Returns:
+            Dictionary mapping book key to its latest record
+        """
+        records = {}
+        if not os.path.exists(self.filename):
+            return records
+        
+        with open(self.filename, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                records[record['key']] = record
+        return records
+    
+    @classmethod
+    def restore(cls, book: Book, record: dict):
+        """
+        Copy the search results from a journal record onto a book.
+        
+        Args:
+            book: Book object to update
+            record: Journal record for the same book
+        """
+        for field in cls.RESULT_FIELDS:
+            setattr(book, field, record[field])
+        book.duracion_segundos = parse_duration(book.duracion)
+    
+    def reset(self):
+        """Discard the journal to start a fresh run."""
+        with self._lock:
+            if os.path.exists(self.filename):
+                os.remove(self.filename)
@@ -0,0 +1,131 @@
+"""Keyword matcher for video titles."""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Set
+
+
+def fold_text(text: str) -> str:
+    """
+    Lowercase text, drop accents and collapse whitespace.
+    
+    Args:
+        text: Text to fold
+    
+    Returns:
+        Folded ASCII text (characters without an ASCII base are removed)
+    """
+    folded = text.lower()
+    if not folded.isascii():
+        folded = unicodedata.normalize('NFKD', folded).encode('ascii', 'ignore').decode('ascii')
+    if '  ' in folded or not folded.isprintable():
+        folded = ' '.join(folded.split())
+    return folded
+
+
+def keyword_pattern(keywords: List[str]) -> str:
+    """
+    Build one regular expression matching any of the keywords.
+    
+    The keywords are merged into a prefix trie, so the engine follows a
+    single branch per character instead of trying every keyword in turn.
+    Optional groups are greedy, so the longest keyword starting at a
+    position is matched.
+    
+    Args:
+        keywords: Non-empty keywords
+    
+    Returns:
+        Regular expression source
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def branch(node: Dict[str, dict]) -> str:
+        alternatives = [re.escape(char) + branch(child) for char, child in sorted(node.items()) if char]
+        if not alternatives:
+            return ''
+        body = alternatives[0] if len(alternatives) == 1 else '(?:' + '|'.join(alternatives) + ')'
+        return f'(?:{body})?' if '' in node else body
+    
+    return branch(trie)
+
+
+class KeywordClassifier:
+    """
+    Matches every keyword rule against a title in a single pass.
+    
+    Titles and keywords are folded the same way (lowercase, no accents,
+    single spaces), so matching is case- and accent-insensitive; each rule
+    matches when one of its keywords is a substring of the folded title.
+    All keywords are compiled into one trie regex. After each match the
+    scan resumes one character after its start, so overlapping keywords
+    are found too, and keywords that are prefixes of the matched one are
+    credited through a precomputed table. Recently analyzed titles are
+    memoized, since the same video usually comes back from several queries.
+    """
+    
+    def __init__(self, rules: Dict[str, List[str]], cache_size: int = 65536):
+        """
+        Compile the keyword rules.
+        
+        Args:
+            rules: Dictionary of rule name to keyword list
+            cache_size: Number of analyzed titles to memoize
+        """
+        keyword_rules: Dict[str, Set[str]] = {}
+        for name, keywords in rules.items():
+            for keyword in map(fold_text, keywords):
+                if keyword:
+                    keyword_rules.setdefault(keyword, set()).add(name)
+        
+        # Rules credited by a match: those of the keyword and of its prefixes
+        self._rules_of: Dict[str, FrozenSet[str]] = {
+            keyword: frozenset().union(*(
+                names for prefix, names in keyword_rules.items() if keyword.startswith(prefix)
+            ))
+            for keyword in keyword_rules
+        }
+        self._search = re.compile(keyword_pattern(list(keyword_rules))).search if keyword_rules else None
+        self.analyze = lru_cache(maxsize=cache_size)(self._analyze)
+    
+    def _analyze(self, title: str) -> FrozenSet[str]:
+        """
+        Find which rules match a title (uncached).
+        
+        Args:
+            title: Video title
+        
+        Returns:
+            Set of matching rule names
+        """
+        search = self._search
+        if search is None:
+            return frozenset()
+        text = fold_text(title)
+        match = search(text)
+        if match is None:
+            return frozenset()
+        flags: Set[str] = set()
+        while match is not None:
+            flags |= self._rules_of[match.group()]
+            match = search(text, match.start() + 1)
+        return frozenset(flags)
+    
+    def analyze_many(self, titles: List[str]) -> List[FrozenSet[str]]:
+        """
+        Find the matching rules for a batch of titles.
+        
+        Args:
+            titles: Video titles
+        
+        Returns:
+            List of rule name sets, one per title
+        """
+        analyze = self.analyze
+        return [analyze(title) for title in titles]
@@ -0,0 +1,50 @@
+"""Keyword tables used to recognize and classify audiobook videos."""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+# Rule name -> keywords. Matching is case- and accent-insensitive and
+# keywords match anywhere inside the video title.
+KEYWORD_RULES: Dict[str, List[str]] = {
+    # Indicators that a video is an audiobook
+    'positive': [
+        'audiolibro', 'audiobook', 'libro completo', 'lectura',
+        'narración', 'narrado', 'leído', 'dramatización',
+        'audio libro', 'voz humana', 'leer'
+    ],
+    # Indicators that a video is not an audiobook (filter these out)
+    'negative': [
+        'resumen', 'summary', 'trailer', 'preview',
+        'música', 'music', 'instrumental', 'karaoke',
+        'video oficial', 'official video', 'lyrics',
+        'tutorial', 'how to', 'como'
+    ],
+    # Content type indicators, checked in this order by the classifier
+    'complete': ['completo', 'complete'],
+    'dramatized': ['dramatización', 'dramatizado'],
+    'narration': ['audiolibro', 'audiobook'],
+    'drama': ['dramatización', 'teatro'],
+    'fragment': ['fragmento', 'capítulo', 'parte', 'extracto'],
+    'analysis': ['análisis', 'reseña', 'resumen', 'comentario'],
+}
+
+
+def load_keyword_rules(filename: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    Get the keyword rules, optionally overridden from a JSON file.
+    
+    The file maps rule names to keyword lists; rules present in the file
+    replace the built-in ones and the rest keep their defaults.
+    
+    Args:
+        filename: Optional path to a JSON rules file
+    
+    Returns:
+        Dictionary of rule name to keyword list
+    """
+    rules = {name: list(keywords) for name, keywords in KEYWORD_RULES.items()}
+    if filename and os.path.exists(filename):
+        with open(filename, 'r', encoding='utf-8') as f:
+            rules.update(json.load(f))
+    return rules
@@ -0,0 +1,178 @@
+"""Precomputed book signatures and catalog index for matching video titles to books."""
+
+import re
+from typing import Dict, FrozenSet, List, Tuple
+
+from .text import normalize_text
+
+# Words ignored when comparing titles
+COMMON_WORDS = frozenset({'el', 'la', 'los', 'las', 'un', 'una', 'de', 'del', 'y', 'o', 'en', 'a', 'para'})
+
+# Fraction of significant title words a video title must contain
+TITLE_MATCH_THRESHOLD = 0.5
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into normalized word tokens.
+    
+    Args:
+        text: Text to tokenize
+    
+    Returns:
+        List of lowercase, accent-free word tokens
+    """
+    return _TOKEN_PATTERN.findall(normalize_text(text))
+
+
+class BookSignature:
+    """
+    Normalized matching data for one book, built once and reused for
+    every candidate video.
+    """
+    
+    __slots__ = ('title', 'author', 'title_normalized', 'author_surname', 'title_tokens', 'title_token_set')
+    
+    def __init__(self, title: str, author: str):
+        """
+        Precompute the normalized forms of a book's title and author.
+        
+        Args:
+            title: Book title
+            author: Author name
+        """
+        self.title = title
+        self.author = author
+        self.title_normalized = normalize_text(title)
+        
+        # Author's last name (usually the most distinctive part)
+        author_tokens = tokenize(author)
+        self.author_surname = author_tokens[-1] if author_tokens else normalize_text(author)
+        
+        # Significant words from the title (ignore common and short words)
+        self.title_tokens: Tuple[str, ...] = tuple(
+            word for word in tokenize(title)
+            if word not in COMMON_WORDS and len(word) > 2
+        )
+        self.title_token_set: FrozenSet[str] = frozenset(self.title_tokens)
+    
+    def score(self, video_title: str) -> float:
+        """
+        Score how well a video title matches this book.
+        
+        Args:
+            video_title: Title of the YouTube video
+        
+        Returns:
+            0.0 if the author's last name is missing, otherwise the fraction
+            of significant title words present in the video title
+        """
+        return self.score_tokens(video_title, set(tokenize(video_title)))
+    
+    def score_tokens(self, video_title: str, video_tokens: set) -> float:
+        """
+        Score a video title whose tokens are already known.
+        
+        Args:
+            video_title: Title of the YouTube video
+            video_tokens: Set of the video title's tokens
+        
+        Returns:
+            Match score between 0.0 and 1.0
+        """
+        if self.author_surname not in video_tokens:
+            return 0.0
+        if self.title_token_set:
+            return len(self.title_token_set & video_tokens) / len(self.title_token_set)
+        # No significant words: require the exact title
+        return 1.0 if self.title_normalized in normalize_text(video_title) else 0.0
+    
+    def matches(self, video_title: str) -> bool:
+        """
+        Check whether a video title mentions both this book and its author.
+        
+        Args:
+            video_title: Title of the YouTube video
+        
+        Returns:
+            True if the video matches the book
+        """
+        return self.score(video_title) >= TITLE_MATCH_THRESHOLD
+    
+    def score_many(self, video_titles: List[str]) -> List[float]:
+        """
+        Score a batch of video titles against this book.
+        
+        Args:
+            video_titles: Titles of the YouTube videos
+        
+        Returns:
+            List of scores, one per title
+        """
+        return [self.score_tokens(title, set(tokenize(title))) for title in video_titles]
+    
+    def matches_many(self, video_titles: List[str]) -> List[bool]:
+        """
+        Check a batch of video titles against this book.
+        
+        Args:
+            video_titles: Titles of the YouTube videos
+        
+        Returns:
+            List of booleans, one per title
+        """
+        return [score >= TITLE_MATCH_THRESHOLD for score in self.score_many(video_titles)]
+
+
+class CatalogIndex:
+    """
+    Inverted index from author surname token to catalog books.
+    
+    Lets any video title be checked against the whole catalog by looking
+    up only the books whose author surname appears in the title, instead
+    of scanning every book.
+    """
+    
+    def __init__(self):
+        """Initialize an empty index."""
+        self._postings: Dict[str, Dict[str, BookSignature]] = {}
+        self._size = 0
+    
+    def add(self, key: str, signature: BookSignature):
+        """
+        Index a book under its author surname.
+        
+        Args:
+            key: Book identity key
+            signature: Book's matching signature
+        """
+        books = self._postings.setdefault(signature.author_surname, {})
+        if key not in books:
+            books[key] = signature
+            self._size += 1
+    
+    def match(self, video_title: str) -> List[str]:
+        """
+        Find every indexed book a video title matches.
+        
+        Args:
+            video_title: Title of the YouTube video
+            
+        Returns:
+            Keys of the matching books
+        """
+        tokens = set(tokenize(video_title))
+        matched = []
+        for token in tokens:
+            books = self._postings.get(token)
+            if not books:
+                continue
+            for key, signature in list(books.items()):
+                if signature.score_tokens(video_title, tokens) >= TITLE_MATCH_THRESHOLD:
+                    matched.append(key)
+        return matched
+    
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,251 @@
+"""In-process counters and histograms with JSON and Prometheus export."""
+
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Histogram bucket upper bounds in seconds (Prometheus defaults plus long tails)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values."""
+    
+    __slots__ = ('buckets', 'counts', 'count', 'sum', 'min', 'max')
+    
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Initialize an empty histogram.
+        
+        Args:
+            buckets: Sorted bucket upper bounds
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+    
+    def observe(self, value: float):
+        """Record one value."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+    
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket holding it.
+        
+        Args:
+            q: Quantile between 0 and 1
+        
+        Returns:
+            Estimated value (the observed maximum for the +Inf bucket)
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+    
+    def summary(self) -> Dict[str, float]:
+        """Count, sum, mean, extremes and estimated percentiles."""
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else 0.0,
+            'min': round(self.min, 6) if self.count else 0.0,
+            'max': round(self.max, 6),
+            'p50': round(self.quantile(0.5), 6),
+            'p95': round(self.quantile(0.95), 6),
+        }
+
+
+class Metrics:
+    """
+    Thread-safe registry of labelled counters, gauges and histograms.
+    
+    Metric names follow Prometheus conventions (``*_total`` for counters,
+    ``*_seconds`` for timings); labels are passed as keyword arguments.
+    """
+    
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._help: Dict[str, str] = {}
+    
+    @staticmethod
+    def _key(labels: Dict[str, object]) -> LabelKey:
+        return tuple(sorted((name, str(value)) for name, value in labels.items()))
+    
+    def describe(self, name: str, text: str):
+        """Set the help text exported for a metric."""
+        self._help[name] = text
+    
+    def inc(self, name: str, value: float = 1, **labels):
+        """Add to a counter."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+    
+    def set(self, name: str, value: float, **labels):
+        """Set a gauge."""
+        with self._lock:
+            self._gauges.setdefault(name, {})[self._key(labels)] = value
+    
+    def observe(self, name: str, value: float, **labels):
+        """Record a value in a histogram."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(value)
+    
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """Time the enclosed block into a histogram."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+    
+    def counter(self, name: str, **labels) -> float:
+        """Current value of a counter (0 if never incremented)."""
+        with self._lock:
+            return self._counters.get(name, {}).get(self._key(labels), 0)
+    
+    def reset(self):
+        """Drop every recorded value."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+    
+    @staticmethod
+    def _label_dict(key: LabelKey) -> Dict[str, str]:
+        return dict(key)
+    
+    def snapshot(self) -> Dict[str, Dict[str, List[dict]]]:
+        """
+        Get every metric as plain data.
+        
+        Returns:
+            {'counters': ..., 'gauges': ..., 'histograms': ...}, each mapping
+            metric name to a list of {'labels': {...}, value fields}
+        """
+        with self._lock:
+            return {
+                'counters': {
+                    name: [{'labels': self._label_dict(key), 'value': value} for key, value in series.items()]
+                    for name, series in self._counters.items()
+                },
+                'gauges': {
+                    name: [{'labels': self._label_dict(key), 'value': value} for key, value in series.items()]
+                    for name, series in self._gauges.items()
+                },
+                'histograms': {
+                    name: [{'labels': self._label_dict(key), **histogram.summary()} for key, histogram in series.items()]
+                    for name, series in self._histograms.items()
+                },
+            }
+    
+    def write_json(self, filename: str, extra: Optional[dict] = None):
+        """
+        Write a JSON run summary.
+        
+        Args:
+            filename: Output path
+            extra: Additional top-level sections (e.g. run statistics)
+        """
+        summary = dict(extra or {})
+        summary['metrics'] = self.snapshot()
+        self._ensure_dir(filename)
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+    
+    def write_prometheus(self, filename: str):
+        """
+        Write every metric in the Prometheus text exposition format.
+        
+        Args:
+            filename: Output path (e.g. for the node_exporter textfile collector)
+        """
+        lines = []
+        with self._lock:
+            for kind, metrics in (('counter', self._counters), ('gauge', self._gauges)):
+                for name, series in sorted(metrics.items()):
+                    self._header(lines, name, kind)
+                    for key, value in series.items():
+                        lines.append(f"{name}{self._format_labels(key)} {value:g}")
+            for name, series in sorted(self._histograms.items()):
+                self._header(lines, name, 'histogram')
+                for key, histogram in series.items():
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + (float('inf'),), histogram.counts):
+                        cumulative += count
+                        le = '+Inf' if bound == float('inf') else f"{bound:g}"
+                        lines.append(f"{name}_bucket{self._format_labels(key + (('le', le),))} {cumulative}")
+                    lines.append(f"{name}_sum{self._format_labels(key)} {histogram.sum:.6f}")
+                    lines.append(f"{name}_count{self._format_labels(key)} {histogram.count}")
+        self._ensure_dir(filename)
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+    
+    def _header(self, lines: List[str], name: str, kind: str):
+        if name in self._help:
+            lines.append(f"# HELP {name} {self._help[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+    
+    @staticmethod
+    def _format_labels(key: LabelKey) -> str:
+        if not key:
+            return ''
+        escaped = (
+            f'{name}="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+            for name, value in key
+        )
+        return '{' + ','.join(escaped) + '}'
+    
+    @staticmethod
+    def _ensure_dir(filename: str):
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+
+# Process-wide registry, shared like ``config``
+metrics = Metrics()
+metrics.describe('books_eater_query_seconds', 'Time per search query (cache or network), by strategy template')
+metrics.describe('books_eater_fetch_seconds', 'Time per network search, including retries and rate-limit waits')
+metrics.describe('books_eater_request_seconds', 'Time per network request attempt')
+metrics.describe('books_eater_cache_hits_total', 'Queries answered by the search cache')
+metrics.describe('books_eater_negative_cache_hits_total', 'Books skipped as confirmed misses not yet due for a re-check')
+metrics.describe('books_eater_match_seconds', 'Time spent matching and classifying the videos of a query')
+metrics.describe('books_eater_book_seconds', 'Time to process one book')
+metrics.describe('books_eater_candidates_total', 'Candidate videos by outcome')
+metrics.describe('books_eater_strategy_queries_total', 'Queries run per strategy template')
+metrics.describe('books_eater_strategy_hits_total', 'Queries that found the book, per strategy template')
+metrics.describe('books_eater_strategy_skipped_total', 'Strategy queries skipped for their low expected hit rate')
+metrics.describe('books_eater_errors_total', 'Errors by stage and exception type')
+metrics.describe('books_eater_rate_limit_wait_seconds', 'Total time workers waited for the rate limiter')
+metrics.describe('books_eater_rate_limit_rate', 'Request rate the limiter settled on, in requests per second')
@@ -0,0 +1,134 @@
+"""Persistent record of books confirmed missing from YouTube."""
+
+import os
+import threading
+import time
+from typing import Optional, Sequence
+
+from .database import connect
+from .text import book_key
+
+DAY_SECONDS = 24 * 3600
+
+
+class NegativeCache:
+    """
+    SQLite-backed list of NO ENCONTRADO books and when to search them again.
+    
+    Each confirmed miss pushes the next check further out along
+    ``schedule_days`` (1 day, 3 days, 1 week...); the last interval repeats.
+    Finding the book removes it, and ``force_recheck`` makes it due now.
+    """
+    
+    def __init__(self, filename: str, schedule_days: Sequence[float] = (1, 3, 7, 14, 30)):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            filename: Path to the SQLite file
+            schedule_days: Days until the next check after the 1st, 2nd, ...
+                consecutive miss
+        """
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.filename = filename
+        self.schedule_days = tuple(schedule_days)
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._conn = connect(filename)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS misses ("
+            " key TEXT PRIMARY KEY,"
+            " misses INTEGER NOT NULL,"
+            " confirmed_at REAL NOT NULL,"
+            " next_check REAL NOT NULL)"
+        )
+        self._conn.commit()
+    
+    def known_miss(self, titulo: str, autor: str) -> Optional[float]:
+        """
+        Check whether a book is a confirmed miss not yet due for a re-check.
+        
+        Args:
+            titulo: Book title
+            autor: Author name
+        
+        Returns:
+            Timestamp the miss was last confirmed, or None if the book must
+            be searched
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT confirmed_at, next_check FROM misses WHERE key = ?", (book_key(titulo, autor),)
+            ).fetchone()
+            if row is None or row[1] <= time.time():
+                return None
+            self.hits += 1
+        return row[0]
+    
+    def record_miss(self, titulo: str, autor: str):
+        """
+        Record that a full search did not find a book and schedule the next one.
+        
+        Args:
+            titulo: Book title
+            autor: Author name
+        """
+        key = book_key(titulo, autor)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT misses FROM misses WHERE key = ?", (key,)).fetchone()
+            misses = (row[0] if row else 0) + 1
+            days = self.schedule_days[min(misses, len(self.schedule_days)) - 1]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO misses (key, misses, confirmed_at, next_check) VALUES (?, ?, ?, ?)",
+                (key, misses, now, now + days * DAY_SECONDS)
+            )
+            self._conn.commit()
+    
+    def record_found(self, titulo: str, autor: str):
+        """
+        Forget a book once it has been found.
+        
+        Args:
+            titulo: Book title
+            autor: Author name
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM misses WHERE key = ?", (book_key(titulo, autor),))
+            self._conn.commit()
+    
+    def force_recheck(self, titulo: Optional[str] = None, autor: Optional[str] = None) -> int:
+        """
+        Make known misses due for a search on the next run.
+        
+        The miss count is kept, so a book that is still missing resumes
+        its schedule where it was.
+        
+        Args:
+            titulo: Book title (None for every known miss)
+            autor: Author name
+        
+        Returns:
+            Number of books made due
+        """
+        with self._lock:
+            if titulo is None:
+                cursor = self._conn.execute("UPDATE misses SET next_check = 0")
+            else:
+                cursor = self._conn.execute(
+                    "UPDATE misses SET next_check = 0 WHERE key = ?", (book_key(titulo, autor),)
+                )
+            self._conn.commit()
+        return cursor.rowcount
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM misses").fetchone()[0]
+    
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,140 @@
+"""Adaptive token-bucket rate limiter shared by all search workers."""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Dict
+
+
+class RateLimiter:
+    """
+    Token bucket whose rate adapts to how YouTube responds.
+    
+    Every healthy response raises the rate a little (additive increase);
+    a throttling signal halves it (multiplicative decrease). Throttling and
+    errors also pause all callers with an exponential, jittered backoff.
+    """
+    
+    def __init__(
+        self,
+        rate: float = 0.5,
+        min_rate: float = 0.1,
+        max_rate: float = 5.0,
+        burst: float = 1.0,
+        increase_step: float = 0.05,
+        base_backoff: float = 2.0,
+        max_backoff: float = 120.0
+    ):
+        """
+        Initialize the limiter.
+        
+        Args:
+            rate: Initial requests per second
+            min_rate: Lowest rate after backing off
+            max_rate: Highest rate reached while healthy
+            burst: Maximum number of tokens stored
+            increase_step: Requests per second added after each success
+            base_backoff: Seconds of the first backoff pause
+            max_backoff: Longest backoff pause in seconds
+        """
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase_step = increase_step
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        
+        self.requests = 0
+        self.throttles = 0
+        self.errors = 0
+        self.consecutive_failures = 0
+        self.waited_seconds = 0.0
+        
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._backoff_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        """Add the tokens accumulated since the last update (lock held)."""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+    
+    def _try_acquire(self) -> float:
+        """
+        Take a token if one is available.
+        
+        Returns:
+            0 if a token was taken, otherwise the seconds to wait before retrying
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now >= self._backoff_until and self._tokens >= 1:
+                self._tokens -= 1
+                self.requests += 1
+                return 0.0
+            wait = max(self._backoff_until - now, (1 - self._tokens) / self.rate)
+            self.waited_seconds += wait
+            return wait
+    
+    def acquire(self):
+        """Block until a request may be sent."""
+        wait = self._try_acquire()
+        while wait:
+            time.sleep(wait)
+            wait = self._try_acquire()
+    
+    async def acquire_async(self):
+        """Wait, without blocking the event loop, until a request may be sent."""
+        wait = self._try_acquire()
+        while wait:
+            await asyncio.sleep(wait)
+            wait = self._try_acquire()
+    
+    def on_success(self):
+        """Record a healthy response and speed up slightly."""
+        with self._lock:
+            self.consecutive_failures = 0
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+    
+    def on_throttle(self):
+        """Record a throttling signal: halve the rate and back off."""
+        with self._lock:
+            self.throttles += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._start_backoff()
+    
+    def on_error(self):
+        """Record a failed request and back off without changing the rate."""
+        with self._lock:
+            self.errors += 1
+            self._start_backoff()
+    
+    def _start_backoff(self):
+        """Pause all callers for an exponential, jittered delay (lock held)."""
+        self.consecutive_failures += 1
+        delay = min(self.max_backoff, self.base_backoff * 2 ** (self.consecutive_failures - 1))
+        delay *= random.uniform(0.5, 1.5)
+        self._backoff_until = max(self._backoff_until, time.monotonic() + delay)
+        self._tokens = 0
+    
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Get the limiter's current state for reporting.
+        
+        Returns:
+            Dictionary with rate, counters and remaining backoff
+        """
+        with self._lock:
+            return {
+                'rate': round(self.rate, 3),
+                'requests': self.requests,
+                'throttles': self.throttles,
+                'errors': self.errors,
+                'consecutive_failures': self.consecutive_failures,
+                'backoff_remaining': round(max(0.0, self._backoff_until - time.monotonic()), 3),
+                'waited_seconds': round(self.waited_seconds, 3),
+            }
@@ -0,0 +1,82 @@
+"""Streaming output of processed books to CSV and JSON Lines files."""
+
+import csv
+import json
+import os
+import threading
+from typing import Optional
+
+from ..models.book import Book
+from .file_handler import EXPORT_COLUMNS
+
+
+class ResultSink:
+    """
+    Appends each finished book to the output files as soon as it completes.
+    
+    Rows are written in completion order and flushed every ``flush_every``
+    books, so partial results can be read while a run is still going and
+    memory does not grow with the catalog. The CSV has the same columns as
+    ``FileHandler.save_to_csv``.
+    """
+    
+    def __init__(self, csv_file: Optional[str] = None, jsonl_file: Optional[str] = None, flush_every: int = 20):
+        """
+        Create the output files (replacing existing ones).
+        
+        Args:
+            csv_file: CSV output path (None to skip)
+            jsonl_file: JSON Lines output path, one export row per line (None to skip)
+            flush_every: Books written between flushes
+        """
+        self.csv_file = csv_file
+        self.jsonl_file = jsonl_file
+        self.flush_every = flush_every
+        self.written = 0
+        self._lock = threading.Lock()
+        self._csv = self._open(csv_file)
+        self._jsonl = self._open(jsonl_file)
+        self._writer = None
+        if self._csv is not None:
+            self._writer = csv.DictWriter(self._csv, fieldnames=EXPORT_COLUMNS)
+            self._writer.writeheader()
+            self._csv.flush()
+    
+    @staticmethod
+    def _open(filename: Optional[str]):
+        if filename is None:
+            return None
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return open(filename, 'w', encoding='utf-8', newline='')
+    
+    def write(self, book: Book):
+        """
+        Append a finished book.
+        
+        Args:
+            book: Processed Book object
+        """
+        row = book.to_dict()
+        with self._lock:
+            if self._writer is not None:
+                self._writer.writerow(row)
+            if self._jsonl is not None:
+                self._jsonl.write(json.dumps(row, ensure_ascii=False) + '\n')
+            self.written += 1
+            if self.written % self.flush_every == 0:
+                self._flush()
+    
+    def _flush(self):
+        for f in (self._csv, self._jsonl):
+            if f is not None:
+                f.flush()
+    
+    def close(self):
+        """Flush and close the output files."""
+        with self._lock:
+            for f in (self._csv, self._jsonl):
+                if f is not None:
+                    f.close()
+            self._csv = self._jsonl = self._writer = None
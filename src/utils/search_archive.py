@@ -0,0 +1,114 @@
+"""Compressed on-disk archive of raw YouTube search responses."""
+
+import gzip
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+
+class SearchArchive:
+    """
+    Gzipped JSON Lines file of raw video renderers, one line per query.
+    
+    Each line holds ``{"query", "limit", "videos"}``. Each recording run
+    appends one gzip member, so an archive can grow over several runs;
+    when a query appears more than once the last line wins. Call close()
+    after recording to finish the member.
+    """
+    
+    def __init__(self, filename: str):
+        """
+        Open an archive (the file is created on the first recording).
+        
+        Args:
+            filename: Path to the .jsonl.gz file
+        """
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, dict]] = None
+        self._writer = None
+    
+    @staticmethod
+    def make_key(query: str) -> str:
+        """
+        Build the lookup key for a query.
+        
+        Args:
+            query: Search query
+        
+        Returns:
+            Case-folded, single-spaced query
+        """
+        return ' '.join(query.casefold().split())
+    
+    def _load(self) -> Dict[str, dict]:
+        """Read every recorded query (once)."""
+        if self._entries is None:
+            entries = {}
+            if os.path.exists(self.filename):
+                with gzip.open(self.filename, 'rt', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        entry = json.loads(line)
+                        entries[self.make_key(entry['query'])] = entry
+            self._entries = entries
+        return self._entries
+    
+    def get(self, query: str, limit: int) -> Optional[List[dict]]:
+        """
+        Look up a recorded search.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of videos requested
+        
+        Returns:
+            Up to ``limit`` raw renderers, or None if the query was not
+            recorded with at least that limit
+        """
+        with self._lock:
+            entry = self._load().get(self.make_key(query))
+        if entry is None:
+            return None
+        if entry['limit'] is not None and (limit is None or entry['limit'] < limit):
+            # Recorded with a smaller limit: the extra videos are unknown
+            if len(entry['videos']) < entry['limit']:
+                return entry['videos']
+            return None
+        return entry['videos'] if limit is None else entry['videos'][:limit]
+    
+    def put(self, query: str, limit: int, videos: List[dict]):
+        """
+        Append a search response to the archive.
+        
+        Args:
+            query: Search query
+            limit: Maximum number of videos requested
+            videos: Raw renderers returned by YouTube
+        """
+        entry = {'query': query, 'limit': limit, 'videos': videos}
+        line = json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n'
+        directory = os.path.dirname(self.filename)
+        with self._lock:
+            # Load before writing: an unfinished member cannot be read back
+            entries = self._load()
+            if self._writer is None:
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._writer = gzip.open(self.filename, 'at', encoding='utf-8')
+            self._writer.write(line)
+            entries[self.make_key(query)] = entry
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+    
+    def close(self):
+        """Finish the gzip member being recorded."""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
@@ -0,0 +1,147 @@
+"""Persistent on-disk cache for YouTube search results."""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .database import connect
+
+
+class SearchCache:
+    """
+    SQLite-backed cache of slim video records keyed by query and limit.
+
+    Entries expire after ``ttl_seconds`` and the table is capped at
+    ``max_entries`` rows, evicting the least recently used ones first.
+    """
+
+    def __init__(self, filename: str, ttl_seconds: float = 72 * 3600, max_entries: int = 50000):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            filename: Path to the SQLite file
+            ttl_seconds: Seconds an entry stays valid
+            max_entries: Maximum number of cached queries
+        """
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.filename = filename
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = connect(filename)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS searches ("
+            " key TEXT PRIMARY KEY,"
+            " videos TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_searches_accessed ON searches (accessed_at)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(query: str, limit: int) -> str:
+        """
+        Build the cache key for a query.
+
+        Args:
+            query: Search query
+            limit: Maximum number of videos requested
+
+        Returns:
+            Normalized key (case-folded, single-spaced query plus limit)
+        """
+        return f"{' '.join(query.casefold().split())}|{limit}"
+
+    def get(self, query: str, limit: int) -> Optional[List[Dict[str, str]]]:
+        """
+        Look up a cached search.
+
+        Args:
+            query: Search query
+            limit: Maximum number of videos requested
+
+        Returns:
+            List of slim video records, or None if missing or expired
+        """
+        key = self.make_key(query, limit)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT videos, created_at FROM searches WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE searches SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, query: str, limit: int, videos: List[Dict[str, str]]):
+        """
+        Store a search result, evicting old entries if over capacity.
+
+        Args:
+            query: Search query
+            limit: Maximum number of videos requested
+            videos: Slim video records to cache
+        """
+        key = self.make_key(query, limit)
+        now = time.time()
+        payload = json.dumps(videos, ensure_ascii=False, separators=(',', ':'))
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM searches WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO searches (key, videos, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, now, now)
+            )
+            if not exists:
+                # Counted in the database: other processes may share the file
+                size = self._count()
+                if size > self.max_entries:
+                    self._evict(size - self.max_entries)
+            self._conn.commit()
+
+    def _evict(self, count: int):
+        """
+        Drop expired entries, then the least recently used ones.
+
+        Args:
+            count: Minimum number of entries to remove
+        """
+        cursor = self._conn.execute(
+            "DELETE FROM searches WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+        )
+        remaining = count - cursor.rowcount
+        if remaining > 0:
+            self._conn.execute(
+                "DELETE FROM searches WHERE key IN ("
+                " SELECT key FROM searches ORDER BY accessed_at LIMIT ?)",
+                (remaining,)
+            )
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM searches").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
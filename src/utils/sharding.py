@@ -0,0 +1,273 @@
+"""Deterministic catalog sharding and merging of per-shard results."""
+
+import csv
+import hashlib
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Tuple
+
+from ..models.book import Book
+from .metrics import Metrics
+from .text import book_key
+
+SHARD_FILE = re.compile(r'^shard-(\d+)-of-(\d+)\.csv$')
+
+# Every file a shard run leaves in the shard directory
+SHARD_ARTIFACT = re.compile(r'^shard-\d+-of-\d+\.(csv|json|jsonl|log|metrics\.json|prom)$')
+
+# Statistics that add up across shards (ratios are recomputed)
+SUMMED_STATS = ('requests', 'prefilled', 'duplicates', 'known_misses', 'search_errors', 'strategies_skipped')
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification.
+    
+    Args:
+        text: Shard as "i/N", with i from 1 to N
+    
+    Returns:
+        Tuple of (index, count)
+    
+    Raises:
+        ValueError: If the specification is malformed or out of range
+    """
+    match = re.fullmatch(r'\s*(\d+)\s*/\s*(\d+)\s*', text)
+    if not match:
+        raise ValueError(f"Shard inválido '{text}', use i/N (por ejemplo 1/4)")
+    index, count = int(match.group(1)), int(match.group(2))
+    if not 1 <= index <= count:
+        raise ValueError(f"Shard inválido '{text}': i debe estar entre 1 y {count}")
+    return index, count
+
+
+def shard_of(titulo: str, autor: str, count: int) -> int:
+    """
+    Get the shard a book belongs to.
+    
+    Uses a hash of the normalized title and author, so every process and
+    machine puts a book in the same shard regardless of catalog order.
+    
+    Args:
+        titulo: Book title
+        autor: Author name
+        count: Number of shards
+    
+    Returns:
+        Shard index from 1 to ``count``
+    """
+    digest = hashlib.sha1(book_key(titulo, autor).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % count + 1
+
+
+def select_shard(books: Iterable[Book], index: int, count: int) -> List[Book]:
+    """
+    Keep the books of one shard, in catalog order.
+    
+    Args:
+        books: Full catalog (a list, BookCatalog or any iterable)
+        index: Shard index from 1 to ``count``
+        count: Number of shards
+    
+    Returns:
+        Books belonging to the shard
+    """
+    return [book for book in books if shard_of(book.titulo, book.autor, count) == index]
+
+
+def shard_paths(directory: str, index: int, count: int) -> Tuple[str, str]:
+    """
+    Get the partial results and statistics files of a shard.
+    
+    Args:
+        directory: Directory holding the shard files
+        index: Shard index
+        count: Number of shards
+    
+    Returns:
+        Tuple of (CSV path, statistics JSON path)
+    """
+    base = os.path.join(directory, f"shard-{index}-of-{count}")
+    return f"{base}.csv", f"{base}.json"
+
+
+def shard_metrics_path(directory: str, index: int, count: int) -> str:
+    """
+    Get the metrics summary file of a shard.
+    
+    Args:
+        directory: Directory holding the shard files
+        index: Shard index
+        count: Number of shards
+    
+    Returns:
+        Metrics JSON path (the Prometheus file shares its base name)
+    """
+    return os.path.join(directory, f"shard-{index}-of-{count}.metrics.json")
+
+
+def remove_shard_files(directory: str) -> int:
+    """
+    Delete the files of previous shard runs, whatever their shard count.
+    
+    Args:
+        directory: Directory holding the shard files
+    
+    Returns:
+        Number of files removed
+    """
+    removed = 0
+    if os.path.isdir(directory):
+        for name in os.listdir(directory):
+            if SHARD_ARTIFACT.match(name):
+                os.remove(os.path.join(directory, name))
+                removed += 1
+    return removed
+
+
+def merge_shard_counters(directory: str, count: int, registry: Metrics):
+    """
+    Add the counters exported by every shard of a run to a registry.
+    
+    Timing histograms are summarized per shard and cannot be combined;
+    they stay in the shard metrics files.
+    
+    Args:
+        directory: Directory holding the shard files
+        count: Number of shards of the run
+        registry: Metrics registry receiving the summed counters
+    """
+    for index in range(1, count + 1):
+        metrics_file = shard_metrics_path(directory, index, count)
+        if not os.path.exists(metrics_file):
+            continue
+        with open(metrics_file, encoding='utf-8') as f:
+            counters = json.load(f).get('metrics', {}).get('counters', {})
+        for name, series in counters.items():
+            for point in series:
+                registry.inc(name, point['value'], **point['labels'])
+
+
+def save_shard_stats(stats: Dict, directory: str, index: int, count: int) -> str:
+    """
+    Write a shard's statistics next to its streamed results.
+    
+    Args:
+        stats: Statistics returned by the service
+        directory: Directory holding the shard files
+        index: Shard index
+        count: Number of shards
+    
+    Returns:
+        Statistics JSON path
+    """
+    os.makedirs(directory, exist_ok=True)
+    stats_file = shard_paths(directory, index, count)[1]
+    with open(stats_file, 'w', encoding='utf-8') as f:
+        json.dump(stats, f, ensure_ascii=False, indent=2)
+    return stats_file
+
+
+def find_shards(directory: str) -> Dict[int, List[int]]:
+    """
+    List the shard files present in a directory.
+    
+    Args:
+        directory: Directory holding the shard files
+    
+    Returns:
+        Dictionary mapping shard count to the sorted indexes found
+    """
+    found: Dict[int, List[int]] = {}
+    if os.path.isdir(directory):
+        for name in os.listdir(directory):
+            match = SHARD_FILE.match(name)
+            if match:
+                found.setdefault(int(match.group(2)), []).append(int(match.group(1)))
+    return {count: sorted(indexes) for count, indexes in found.items()}
+
+
+def read_shard_results(csv_file: str) -> List[Book]:
+    """
+    Read the books of a shard's streamed results.
+    
+    Every row is kept, including duplicate catalog rows that received the
+    result of the same search.
+    
+    Args:
+        csv_file: CSV written by the shard's result sink
+    
+    Returns:
+        Books in file order
+    """
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        return [Book.from_dict(row) for row in csv.DictReader(f)]
+
+
+def merge_shards(directory: str, count: int) -> Tuple[List[Book], Dict]:
+    """
+    Combine the partial results of every shard of a run.
+    
+    Books keep their catalog numbers and are returned in catalog order;
+    counts are recomputed from the merged books and request statistics
+    are added up.
+    
+    Args:
+        directory: Directory holding the shard files
+        count: Number of shards of the run
+    
+    Returns:
+        Tuple of (merged books, merged statistics)
+    
+    Raises:
+        FileNotFoundError: If a shard's results are missing
+    """
+    books: List[Book] = []
+    shard_stats = []
+    for index in range(1, count + 1):
+        csv_file, stats_file = shard_paths(directory, index, count)
+        if not os.path.exists(csv_file):
+            raise FileNotFoundError(f"Falta el shard {index}/{count}: {csv_file}")
+        books.extend(read_shard_results(csv_file))
+        if os.path.exists(stats_file):
+            with open(stats_file, encoding='utf-8') as f:
+                shard_stats.append(json.load(f))
+    books.sort(key=lambda book: book.numero)
+    return books, merge_stats(books, shard_stats)
+
+
+def merge_stats(books: List[Book], shard_stats: List[Dict]) -> Dict:
+    """
+    Build the statistics of a merged run.
+    
+    Args:
+        books: Merged books
+        shard_stats: Statistics of each shard
+    
+    Returns:
+        Statistics dictionary in the service's format
+    """
+    stats = {
+        'total': len(books),
+        'found': sum(book.disponibilidad == "ENCONTRADO" for book in books),
+        'partial': sum(book.disponibilidad == "PARCIAL" for book in books),
+        'not_found': sum(book.disponibilidad not in ("ENCONTRADO", "PARCIAL") for book in books),
+        'shards': len(shard_stats),
+    }
+    for name in SUMMED_STATS:
+        stats[name] = sum(shard.get(name, 0) for shard in shard_stats)
+    found = stats['found'] + stats['partial']
+    stats['requests_per_book'] = stats['requests'] / stats['total'] if stats['total'] else 0.0
+    stats['requests_per_found'] = stats['requests'] / found if found else 0.0
+    
+    strategies: Dict[str, Dict[str, float]] = {}
+    for shard in shard_stats:
+        for template, rate in shard.get('strategies', {}).items():
+            total = strategies.setdefault(template, {'queries': 0, 'hits': 0})
+            total['queries'] += rate['queries']
+            total['hits'] += rate['hits']
+    for rate in strategies.values():
+        rate['hit_rate'] = rate['hits'] / rate['queries'] if rate['queries'] else 0.0
+    stats['strategies'] = strategies
+    return stats
@@ -0,0 +1,160 @@
+"""Persistent hit statistics of the search strategies."""
+
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .database import connect
+from .text import normalize_text
+
+
+class StrategyStats:
+    """
+    SQLite-backed counts of queries and hits per search template.
+    
+    Counts are kept globally, per catalog section and per author, and
+    combined into a smoothed hit probability for each template: the global
+    rate is the prior for the section rate, which is the prior for the
+    author rate. Templates are then tried in order of that probability, and
+    skipped once they have had a fair number of queries without paying off.
+    
+    Outcomes are added to the database as increments, so several processes
+    (e.g. local shards) can share one file; each keeps its own in-memory
+    counts from when it opened the file plus its own outcomes.
+    """
+    
+    def __init__(
+        self,
+        filename: str,
+        prior_weight: float = 5.0,
+        min_queries: int = 20,
+        skip_below: float = 0.02
+    ):
+        """
+        Open (or create) the statistics database.
+        
+        Args:
+            filename: Path to the SQLite file
+            prior_weight: Pseudo-queries given to the broader scope's rate
+                when estimating a narrower one
+            min_queries: Queries a template needs in a book's section (or
+                globally, for books without one) before it can be skipped
+            skip_below: Estimated hit probability under which it is skipped
+        """
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.filename = filename
+        self.prior_weight = prior_weight
+        self.min_queries = min_queries
+        self.skip_below = skip_below
+        self._lock = threading.Lock()
+        self._conn = connect(filename)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS strategy_stats ("
+            " scope TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " template TEXT NOT NULL,"
+            " queries INTEGER NOT NULL,"
+            " hits INTEGER NOT NULL,"
+            " PRIMARY KEY (scope, key, template))"
+        )
+        self._conn.commit()
+        
+        # (scope, key, template) -> [queries, hits]
+        self._counts: Dict[Tuple[str, str, str], List[int]] = {}
+        for scope, key, template, queries, hits in self._conn.execute(
+            "SELECT scope, key, template, queries, hits FROM strategy_stats"
+        ):
+            self._counts[(scope, key, template)] = [queries, hits]
+    
+    @staticmethod
+    def _scope_keys(author: str, section: Optional[str]) -> List[Tuple[str, str]]:
+        """Scope/key pairs a book's outcomes are counted under."""
+        keys = [('global', '')]
+        if section and section != "N/A":
+            keys.append(('section', normalize_text(section)))
+        if author:
+            keys.append(('author', normalize_text(author)))
+        return keys
+    
+    def record(self, template: str, author: str, section: Optional[str], hit: bool):
+        """
+        Count one query of a template and whether it found the book.
+        
+        Args:
+            template: Strategy template the query was built from
+            author: Author of the searched book
+            section: Catalog section of the book (None or "N/A" if unknown)
+            hit: Whether the query found the book
+        """
+        with self._lock:
+            for scope, key in self._scope_keys(author, section):
+                counts = self._counts.setdefault((scope, key, template), [0, 0])
+                counts[0] += 1
+                counts[1] += int(hit)
+                self._conn.execute(
+                    "INSERT INTO strategy_stats (scope, key, template, queries, hits) VALUES (?, ?, ?, 1, ?) "
+                    "ON CONFLICT (scope, key, template) DO UPDATE SET "
+                    "queries = queries + 1, hits = hits + excluded.hits",
+                    (scope, key, template, int(hit))
+                )
+            self._conn.commit()
+    
+    def estimate(self, template: str, author: str, section: Optional[str]) -> Tuple[float, int]:
+        """
+        Estimate the probability that a template finds a book.
+        
+        Args:
+            template: Strategy template
+            author: Author of the book
+            section: Catalog section of the book
+        
+        Returns:
+            Tuple of (smoothed hit probability, queries seen in the book's
+            section, or globally for books without a section)
+        """
+        probability = 0.5
+        evidence = 0
+        with self._lock:
+            for scope, key in self._scope_keys(author, section):
+                queries, hits = self._counts.get((scope, key, template), (0, 0))
+                weight = 2.0 if scope == 'global' else self.prior_weight
+                probability = (hits + weight * probability) / (queries + weight)
+                if scope != 'author':
+                    evidence = queries
+        return probability, evidence
+    
+    def rank(self, templates: List[str], author: str, section: Optional[str]) -> List[str]:
+        """
+        Order templates by expected hit probability for a book.
+        
+        Ties keep the given order. Templates with enough evidence and an
+        estimate below ``skip_below`` are left out, but at least the best
+        template is always returned.
+        
+        Args:
+            templates: Templates in their default priority order
+            author: Author of the book
+            section: Catalog section of the book
+        
+        Returns:
+            Templates to try, most promising first
+        """
+        scored = []
+        for position, template in enumerate(templates):
+            probability, evidence = self.estimate(template, author, section)
+            scored.append((-probability, position, template, evidence))
+        scored.sort()
+        
+        ranked = [
+            template for negative, _, template, evidence in scored
+            if evidence < self.min_queries or -negative >= self.skip_below
+        ]
+        return ranked or [scored[0][2]]
+    
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
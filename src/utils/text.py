@@ -0,0 +1,46 @@
+"""Text normalization helpers shared by matching and bookkeeping."""
+
+import unicodedata
+
+
+class _MarkStripper(dict):
+    """Translation table that deletes combining marks, filled on demand."""
+    
+    def __missing__(self, codepoint: int):
+        value = None if unicodedata.category(chr(codepoint)) == 'Mn' else codepoint
+        self[codepoint] = value
+        return value
+
+
+_STRIP_MARKS = _MarkStripper()
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for comparison by removing accents and extra whitespace.
+    
+    Args:
+        text: Text to normalize
+    
+    Returns:
+        Lowercase text without accents and with single spaces
+    """
+    # Remove accents
+    if not text.isascii():
+        text = unicodedata.normalize('NFD', text).translate(_STRIP_MARKS)
+    # Convert to lowercase and remove extra spaces
+    return ' '.join(text.lower().split())
+
+
+def book_key(titulo: str, autor: str) -> str:
+    """
+    Build a stable identity key for a book from its title and author.
+    
+    Args:
+        titulo: Book title
+        autor: Author name
+    
+    Returns:
+        Normalized "title|author" key
+    """
+    return f"{normalize_text(titulo)}|{normalize_text(autor)}"
@@ -0,0 +1,109 @@
+"""Persistent local index of videos crawled from audiobook channels."""
+
+import os
+import threading
+import time
+from typing import Dict, List
+
+from .database import connect
+from .matching import TITLE_MATCH_THRESHOLD, BookSignature, tokenize
+
+
+class VideoIndex:
+    """
+    SQLite store of crawled videos (id, title, duration) with an in-memory
+    token index for offline matching against the catalog.
+    """
+    
+    def __init__(self, filename: str):
+        """
+        Open (or create) the index database.
+        
+        Args:
+            filename: Path to the SQLite file
+        """
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._conn = connect(filename)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS videos ("
+            " id TEXT PRIMARY KEY,"
+            " title TEXT NOT NULL,"
+            " duration TEXT NOT NULL,"
+            " source TEXT NOT NULL,"
+            " crawled_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._videos: List[Dict[str, str]] = []
+        self._video_tokens: List[set] = []
+        self._tokens: Dict[str, List[int]] = {}
+        self._loaded = False
+    
+    def add_many(self, videos: List[Dict[str, str]], source: str) -> int:
+        """
+        Store crawled videos, replacing existing entries with the same id.
+        
+        Args:
+            videos: Slim video records
+            source: Channel or playlist they came from
+        
+        Returns:
+            Number of videos stored
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO videos (id, title, duration, source, crawled_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(video['id'], video['title'], video['duration'], source, now) for video in videos]
+            )
+            self._conn.commit()
+            self._loaded = False
+        return len(videos)
+    
+    def _load(self):
+        """Load all videos and build the token -> videos index."""
+        with self._lock:
+            if self._loaded:
+                return
+            rows = self._conn.execute("SELECT id, title, duration FROM videos ORDER BY rowid").fetchall()
+            self._videos = [{'id': row[0], 'title': row[1], 'duration': row[2]} for row in rows]
+            self._video_tokens = [set(tokenize(video['title'])) for video in self._videos]
+            self._tokens = {}
+            for position, tokens in enumerate(self._video_tokens):
+                for token in tokens:
+                    self._tokens.setdefault(token, []).append(position)
+            self._loaded = True
+    
+    def find(self, signature: BookSignature) -> List[Dict[str, str]]:
+        """
+        Find indexed videos whose title matches a book.
+        
+        Only videos containing the author's surname are examined.
+        
+        Args:
+            signature: Book's matching signature
+        
+        Returns:
+            Matching slim video records, in crawl order
+        """
+        self._load()
+        return [
+            self._videos[position]
+            for position in self._tokens.get(signature.author_surname, [])
+            if signature.score_tokens(self._videos[position]['title'], self._video_tokens[position])
+            >= TITLE_MATCH_THRESHOLD
+        ]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
+    
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,42 @@
+"""Shared fixtures: runs happen in a temporary directory against the recorded archive."""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.utils import config  # noqa: E402
+
+FIXTURE_ARCHIVE = os.path.join(ROOT, 'tests', 'fixtures', 'search_archive.jsonl.gz')
+
+# Books whose queries are recorded in the fixture archive
+FIXTURE_CATALOG = """\
+# 1) NOVELA
+Over | Ramón Marrero Aristy | 1939
+La Danza de Mingo | Haffe Serulle | 1977
+# 2) CUENTO
+Cuentos Escritos en el Exilio | Juan Bosch | 1962
+"""
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in an empty directory, replaying the fixture archive."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, 'SEARCH_ARCHIVE_FILE', FIXTURE_ARCHIVE)
+    return tmp_path
+
+
+@pytest.fixture
+def run_main(workdir, monkeypatch):
+    """Call main.main() with the given command line arguments."""
+    import main
+
+    def run(*argv):
+        monkeypatch.setattr(sys, 'argv', ['main.py', *argv])
+        main.main()
+
+    return run
@@ -0,0 +1,40 @@
+"""Ctrl-C during the async pipeline keeps the partial results."""
+
+import argparse
+import asyncio
+import os
+import signal
+
+import main
+
+
+class InterruptedClient:
+    """Async client whose session is still closing when Ctrl-C arrives."""
+    
+    def __init__(self):
+        self.closed = False
+    
+    async def close(self):
+        os.kill(os.getpid(), signal.SIGINT)
+        try:
+            await asyncio.sleep(5)
+        finally:
+            self.closed = True
+
+
+class PartialService:
+    """Returns the books processed so far, as AsyncAudiobookService does on Ctrl-C."""
+    
+    def __init__(self):
+        self.async_client = InterruptedClient()
+    
+    async def process_multiple_books_async(self, books, **options):
+        return books[:1], {'total': len(books)}
+
+
+def test_async_interrupt_keeps_partial_results():
+    service = PartialService()
+    args = argparse.Namespace(concurrency=4, resume=False, max_age=None)
+    books, stats = main.run_async(service, ['a', 'b'], args, None)
+    assert (books, stats) == (['a'], {'total': 2})
+    assert service.async_client.closed
@@ -0,0 +1,20 @@
+"""Catalog files that yield no books fall back to the predefined dataset."""
+
+from src.utils import CatalogCache, DOMINICAN_BOOKS
+
+
+def test_empty_catalog_is_not_cached(tmp_path):
+    empty = tmp_path / 'empty.csv'
+    empty.write_text("Nombre,Comentario\nx,y\n", encoding='utf-8')
+    cache = CatalogCache(str(tmp_path / 'catalogs'))
+    assert len(cache.load(str(empty))) == 0
+    assert not (tmp_path / 'catalogs').exists()
+    assert cache.load(str(tmp_path / 'missing.csv')) is None
+
+
+def test_empty_catalog_runs_the_predefined_dataset(workdir, run_main, capsys):
+    (workdir / 'empty.txt').write_text("# solo comentarios\n", encoding='utf-8')
+    run_main('--replay', '--books', 'empty.txt', '--shard', '1/50')
+    output = capsys.readouterr().out
+    assert "Advertencia: no se encontraron libros en 'empty.txt'" in output
+    assert f"{len(DOMINICAN_BOOKS)} libros en el dataset" in output
@@ -0,0 +1,50 @@
+"""Hedged searches feed the strategy statistics like the sequential loop."""
+
+import time
+
+from src.clients import ReplayBackend, YouTubeClient
+from src.utils import SearchArchive
+
+from conftest import FIXTURE_ARCHIVE
+
+
+class RecordedStats:
+    """Strategy statistics that keep the fixed order and log every outcome."""
+    
+    def __init__(self):
+        self.outcomes = []
+    
+    def rank(self, templates, author, section):
+        return list(templates)
+    
+    def record(self, template, author, section, hit):
+        self.outcomes.append((template, hit))
+
+
+class SlowReplay(ReplayBackend):
+    """Replay that answers later queries first, so every hedged query finishes."""
+    
+    def search(self, query, limit):
+        time.sleep(0.05 if 'audiobook' in query else 0.01)
+        return super().search(query, limit)
+
+
+def search_outcomes(hedge_delay):
+    stats = RecordedStats()
+    client = YouTubeClient(
+        videos_per_search=3,
+        backend=SlowReplay(SearchArchive(FIXTURE_ARCHIVE)),
+        hedge_delay=hedge_delay,
+        strategy_stats=stats
+    )
+    result = client.search_audiobook("Over", "Ramón Marrero Aristy")
+    time.sleep(0.2)  # let ignored hedged queries finish
+    return result, stats.outcomes
+
+
+def test_hedged_losers_are_not_recorded():
+    sequential, expected = search_outcomes(None)
+    hedged, outcomes = search_outcomes(0.0)
+    assert hedged == sequential
+    assert outcomes == expected
+    assert expected[-1][1] is True
@@ -0,0 +1,48 @@
+"""Ctrl-C in the middle of a run still streams a row for every book."""
+
+import csv
+
+from src.clients import ReplayBackend, YouTubeClient
+from src.models import Book
+from src.services import AudiobookService
+from src.utils import ResultSink, RunJournal, SearchArchive
+
+from conftest import FIXTURE_ARCHIVE
+
+
+class InterruptingBackend(ReplayBackend):
+    """Replays the fixture and raises Ctrl-C on the first query naming ``stop``."""
+    
+    def __init__(self, stop):
+        super().__init__(SearchArchive(FIXTURE_ARCHIVE), strict=True)
+        self.stop = stop
+    
+    def search(self, query, limit):
+        if self.stop in query:
+            raise KeyboardInterrupt
+        return super().search(query, limit)
+
+
+def test_interrupted_run_streams_unsearched_books(tmp_path):
+    books = [
+        Book(numero=1, titulo="Over", autor="Ramón Marrero Aristy", año="1939"),
+        Book(numero=2, titulo="La Danza de Mingo", autor="Haffe Serulle", año="1977"),
+        Book(numero=3, titulo="Cuentos Escritos en el Exilio", autor="Juan Bosch", año="1962"),
+    ]
+    csv_file = tmp_path / 'results.csv'
+    journal = RunJournal(str(tmp_path / 'journal.jsonl'))
+    service = AudiobookService(
+        YouTubeClient(videos_per_search=3, backend=InterruptingBackend("Mingo")),
+        journal=journal,
+        sink=ResultSink(str(csv_file)),
+    )
+    books, stats = service.process_multiple_books(books, show_progress=False)
+    service.sink.close()
+    
+    with open(csv_file, encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['Título Libro'] for row in rows] == [book.titulo for book in books]
+    assert [row['Disponibilidad'] for row in rows] == ["ENCONTRADO", "NO ENCONTRADO", "NO ENCONTRADO"]
+    assert stats['total'] == len(rows)
+    # Only the searched book is journaled; a resumed run searches the rest
+    assert len(journal.load()) == 1
@@ -0,0 +1,37 @@
+"""Single-pass keyword matching of video titles."""
+
+from itertools import product
+
+from src.utils.keyword_classifier import KeywordClassifier, fold_text
+from src.utils.keyword_rules import KEYWORD_RULES
+
+
+def substring_flags(rules, title):
+    """Reference semantics: a rule matches when any keyword is a substring."""
+    text = fold_text(title)
+    return frozenset(name for name, keywords in rules.items() if any(fold_text(k) in text for k in keywords))
+
+
+def test_accents_and_case_are_ignored():
+    classifier = KeywordClassifier(KEYWORD_RULES)
+    assert classifier.analyze("Over - AUDIOLIBRO Completo (Narracion)") == {'positive', 'narration', 'complete'}
+    assert classifier.analyze("Música para leer") == {'positive', 'negative'}
+    assert classifier.analyze("Vlog de viaje") == frozenset()
+
+
+def test_overlapping_and_nested_keywords():
+    rules = {'long': ['libro completo'], 'short': ['completo'], 'prefix': ['libro'], 'overlap': ['ompletos']}
+    classifier = KeywordClassifier(rules, cache_size=0)
+    assert classifier.analyze("el libro completos") == {'long', 'short', 'prefix', 'overlap'}
+
+
+def test_matches_substring_checks_on_every_keyword_pair():
+    classifier = KeywordClassifier(KEYWORD_RULES, cache_size=0)
+    keywords = [keyword for keywords in KEYWORD_RULES.values() for keyword in keywords]
+    for first, second in product(keywords, repeat=2):
+        for title in (first + second, f"{first} {second}", first[:-2] + second):
+            assert classifier.analyze(title) == substring_flags(KEYWORD_RULES, title), title
+
+
+def test_empty_rules():
+    assert KeywordClassifier({'positive': []}).analyze("audiolibro") == frozenset()
@@ -0,0 +1,66 @@
+"""Confirmed misses are skipped until their re-check is due."""
+
+from src.clients import ReplayBackend, YouTubeClient
+from src.models import Book
+from src.services import AudiobookService
+from src.utils import NegativeCache, SearchArchive
+from src.utils import negative_cache as negative_cache_module
+
+from conftest import FIXTURE_ARCHIVE
+
+DAY = 24 * 3600
+
+
+class CountingReplay(ReplayBackend):
+    def __init__(self, archive):
+        super().__init__(archive, strict=True)
+        self.queries = 0
+    
+    def search(self, query, limit):
+        self.queries += 1
+        return super().search(query, limit)
+
+
+def test_recheck_schedule(tmp_path, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(negative_cache_module.time, 'time', lambda: now[0])
+    cache = NegativeCache(str(tmp_path / 'misses.sqlite'), schedule_days=(1, 3))
+    
+    due_after = []
+    for _ in range(3):
+        cache.record_miss("La Danza de Mingo", "Haffe Serulle")
+        start = now[0]
+        while cache.known_miss("La Danza de Mingo", "Haffe Serulle") is not None:
+            now[0] += DAY / 4
+        due_after.append((now[0] - start) / DAY)
+    # The last interval repeats
+    assert due_after == [1, 3, 3]
+    
+    cache.record_miss("Over", "Ramón Marrero Aristy")
+    assert cache.force_recheck("Over", "Ramon Marrero Aristy") == 1
+    assert cache.known_miss("Over", "Ramón Marrero Aristy") is None
+    
+    cache.record_found("La Danza de Mingo", "Haffe Serulle")
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_known_miss_is_not_searched_again(tmp_path):
+    cache = NegativeCache(str(tmp_path / 'misses.sqlite'))
+    
+    def run():
+        backend = CountingReplay(SearchArchive(FIXTURE_ARCHIVE))
+        client = YouTubeClient(videos_per_search=3, backend=backend)
+        service = AudiobookService(client, negative_cache=cache)
+        book = Book(numero=3, titulo="La Danza de Mingo", autor="Haffe Serulle", año="1977")
+        books, stats = service.process_multiple_books([book], show_progress=False)
+        return books[0], stats, backend.queries
+    
+    first, _, first_requests = run()
+    second, stats, second_requests = run()
+    
+    assert first.disponibilidad == second.disponibilidad == "NO ENCONTRADO"
+    assert first_requests > 0
+    assert second_requests == 0
+    assert stats['known_misses'] == 1
+    cache.close()
@@ -0,0 +1,113 @@
+"""Replay a recorded search archive through the audiobook service."""
+
+import csv
+import os
+
+from src.clients import RecordingBackend, ReplayBackend, YouTubeClient
+from src.models import Book
+from src.services import AudiobookService
+from src.utils import ResultSink, SearchArchive
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'search_archive.jsonl.gz')
+
+
+def replay(books):
+    """Process books against the fixture archive, failing on unrecorded queries."""
+    backend = ReplayBackend(SearchArchive(FIXTURE), strict=True)
+    client = YouTubeClient(videos_per_search=3, backend=backend)
+    service = AudiobookService(client, dedup_threshold=0.9)
+    books, stats = service.process_multiple_books(books, show_progress=False)
+    assert backend.misses == 0
+    return books, stats
+
+
+def test_replay_classifies_recorded_results():
+    books, stats = replay([
+        Book(numero=1, titulo="Over", autor="Ramón Marrero Aristy", año="1939"),
+        Book(numero=2, titulo="Cuentos Escritos en el Exilio", autor="Juan Bosch", año="1962"),
+        Book(numero=3, titulo="La Danza de Mingo", autor="Haffe Serulle", año="1977"),
+    ])
+    over, cuentos, mingo = sorted(books, key=lambda book: book.numero)
+
+    assert over.disponibilidad == "ENCONTRADO"
+    assert over.url_youtube == "https://www.youtube.com/watch?v=oVeRaUdIo01"
+    assert over.tipo_contenido == "Lectura Completa"
+    assert over.duracion_segundos == 6 * 3600 + 12 * 60 + 45
+
+    assert cuentos.disponibilidad == "PARCIAL"
+    assert cuentos.url_youtube == "https://www.youtube.com/watch?v=bOsChFrAg02"
+
+    assert mingo.disponibilidad == "NO ENCONTRADO"
+    assert (stats['found'], stats['partial'], stats['not_found']) == (1, 1, 1)
+
+
+def test_replay_fans_result_out_to_duplicate_rows():
+    books, stats = replay([
+        Book(numero=1, titulo="Over", autor="Ramón Marrero Aristy", año="1939"),
+        Book(numero=2, titulo="Over.", autor="Ramon Marrero Aristy", año="1939"),
+    ])
+
+    assert len(books) == 2
+    assert {book.url_youtube for book in books} == {"https://www.youtube.com/watch?v=oVeRaUdIo01"}
+    assert stats['duplicates'] == 1
+
+
+class FixtureNetwork(ReplayBackend):
+    """Stands in for the live backend, answering from the fixture archive."""
+    
+    rate_limiter = None
+
+
+def test_recorded_archive_replays_the_same_results(tmp_path):
+    def books():
+        return [
+            Book(numero=1, titulo="Over", autor="Ramón Marrero Aristy", año="1939"),
+            Book(numero=2, titulo="La Danza de Mingo", autor="Haffe Serulle", año="1977"),
+        ]
+    
+    archive = str(tmp_path / 'archive.jsonl.gz')
+    recorder = RecordingBackend(FixtureNetwork(SearchArchive(FIXTURE)), SearchArchive(archive))
+    recorded, _ = AudiobookService(YouTubeClient(videos_per_search=3, backend=recorder)).process_multiple_books(
+        books(), show_progress=False
+    )
+    recorder.close()
+    
+    backend = ReplayBackend(SearchArchive(archive), strict=True)
+    replayed, _ = AudiobookService(YouTubeClient(videos_per_search=3, backend=backend)).process_multiple_books(
+        books(), show_progress=False
+    )
+    assert backend.misses == 0
+    assert recorded[0].disponibilidad == "ENCONTRADO"
+    assert [book.url_youtube for book in replayed] == [book.url_youtube for book in recorded]
+
+
+def test_strict_replay_counts_unrecorded_queries():
+    backend = ReplayBackend(SearchArchive(FIXTURE), strict=True)
+    service = AudiobookService(YouTubeClient(videos_per_search=3, backend=backend))
+    books, stats = service.process_multiple_books(
+        [Book(numero=1, titulo="Libro Inexistente", autor="Nadie", año="2000")], show_progress=False
+    )
+    assert books[0].disponibilidad == "NO ENCONTRADO"
+    assert backend.misses == stats['search_errors'] > 0
+
+
+def test_duplicate_rows_are_streamed_and_counted(tmp_path):
+    csv_file = tmp_path / 'results.csv'
+    backend = ReplayBackend(SearchArchive(FIXTURE), strict=True)
+    service = AudiobookService(
+        YouTubeClient(videos_per_search=3, backend=backend),
+        sink=ResultSink(str(csv_file)),
+        dedup_threshold=0.9
+    )
+    books, stats = service.process_multiple_books([
+        Book(numero=1, titulo="Over", autor="Ramón Marrero Aristy", año="1939"),
+        Book(numero=2, titulo="La Danza de Mingo", autor="Haffe Serulle", año="1977"),
+        Book(numero=3, titulo="Over", autor="Ramon Marrero Aristy", año="1939"),
+    ], show_progress=False)
+    service.sink.close()
+    
+    with open(csv_file, encoding='utf-8', newline='') as f:
+        rows = {row['Número']: row for row in csv.DictReader(f)}
+    assert sorted(rows) == ['1', '2', '3']
+    assert rows['3']['URL YouTube'] == rows['1']['URL YouTube'] == "https://www.youtube.com/watch?v=oVeRaUdIo01"
+    assert (stats['found'], stats['not_found'], stats['duplicates']) == (2, 1, 1)
@@ -0,0 +1,67 @@
+"""Resumed and incremental runs reuse earlier results instead of searching."""
+
+from datetime import datetime, timedelta
+
+from src.clients import ReplayBackend, YouTubeClient
+from src.models import Book
+from src.services import AudiobookService
+from src.utils import RunJournal, SearchArchive
+from src.utils.text import book_key
+
+from conftest import FIXTURE_ARCHIVE
+
+
+def catalog():
+    return [
+        Book(numero=1, titulo="Over", autor="Ramón Marrero Aristy", año="1939"),
+        Book(numero=2, titulo="Cuentos Escritos en el Exilio", autor="Juan Bosch", año="1962"),
+        Book(numero=3, titulo="La Danza de Mingo", autor="Haffe Serulle", año="1977"),
+    ]
+
+
+def service(archive, **options):
+    backend = ReplayBackend(SearchArchive(archive), strict=True)
+    return AudiobookService(YouTubeClient(videos_per_search=3, backend=backend), **options), backend
+
+
+def test_resume_restores_journaled_books(tmp_path):
+    journal_file = str(tmp_path / 'journal.jsonl')
+    first, _ = service(FIXTURE_ARCHIVE, journal=RunJournal(journal_file))
+    searched, _ = first.process_multiple_books(catalog(), show_progress=False)
+    
+    # An empty archive: any search of the resumed run would be a miss
+    resumed, backend = service(str(tmp_path / 'empty.jsonl.gz'), journal=RunJournal(journal_file))
+    restored, stats = resumed.process_multiple_books(catalog(), show_progress=False, resume=True)
+    
+    assert backend.misses == 0
+    assert [book.to_dict() for book in restored] == [book.to_dict() for book in searched]
+    assert (stats['found'], stats['partial'], stats['not_found']) == (1, 1, 1)
+
+
+def test_incremental_searches_only_stale_or_missing_books(tmp_path):
+    fresh = datetime.now().isoformat(timespec='seconds')
+    stale = (datetime.now() - timedelta(days=60)).isoformat(timespec='seconds')
+    previous = {
+        book_key("Over", "Ramón Marrero Aristy"): Book(
+            numero=1, titulo="Over", autor="Ramón Marrero Aristy", año="1939",
+            url_youtube="https://www.youtube.com/watch?v=previous001", disponibilidad="ENCONTRADO",
+            fecha_busqueda=fresh
+        ),
+        book_key("Cuentos Escritos en el Exilio", "Juan Bosch"): Book(
+            numero=2, titulo="Cuentos Escritos en el Exilio", autor="Juan Bosch", año="1962",
+            url_youtube="https://www.youtube.com/watch?v=previous002", disponibilidad="ENCONTRADO",
+            fecha_busqueda=stale
+        ),
+    }
+    incremental, backend = service(FIXTURE_ARCHIVE)
+    books, stats = incremental.process_multiple_books(
+        catalog(), show_progress=False, previous_results=previous, max_age_days=30
+    )
+    over, cuentos, mingo = books
+    
+    assert over.url_youtube == "https://www.youtube.com/watch?v=previous001"
+    assert over.fecha_busqueda == fresh
+    # Stale and missing books are searched again
+    assert cuentos.url_youtube == "https://www.youtube.com/watch?v=bOsChFrAg02"
+    assert mingo.disponibilidad == "NO ENCONTRADO"
+    assert backend.misses == 0
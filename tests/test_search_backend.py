@@ -0,0 +1,61 @@
+"""Request counting of the live backends, with fake HTTP sessions."""
+
+import asyncio
+
+from src.clients import AsyncInnerTubeBackend, InnerTubeBackend
+from src.utils import RateLimiter
+
+
+class FakeSession:
+    """Session serving three pages per listing: one GET, two continuations."""
+    
+    def __init__(self):
+        self.http_calls = 0
+    
+    def _pages(self, pace):
+        self.http_calls += 1
+        for _ in range(2):
+            pace()
+            self.http_calls += 1
+        return [{'videoId': 'a'}]
+    
+    def search(self, query, limit, pace=None):
+        return iter(self._pages(pace))
+    
+    channel = playlist = search
+    
+    def close(self):
+        pass
+
+
+class FakeAsyncSession:
+    def __init__(self):
+        self.http_calls = 0
+    
+    async def search(self, query, limit, pace=None):
+        self.http_calls += 1
+        for _ in range(2):
+            await pace()
+            self.http_calls += 1
+        return [{'videoId': 'a'}]
+
+
+def fast_limiter():
+    return RateLimiter(rate=1000.0, max_rate=1000.0, burst=100.0)
+
+
+def test_backend_counts_continuation_pages():
+    session = FakeSession()
+    backend = InnerTubeBackend(session=session, rate_limiter=fast_limiter())
+    backend.search("over", 20)
+    backend.channel("@canal")
+    backend.playlist("PL123")
+    assert backend.requests == session.http_calls == 9
+
+
+def test_async_backend_counts_continuation_pages():
+    session = FakeAsyncSession()
+    network = InnerTubeBackend(session=FakeSession(), rate_limiter=fast_limiter())
+    backend = AsyncInnerTubeBackend(network, session=session)
+    asyncio.run(backend.search("over", 20))
+    assert network.requests == session.http_calls == 3
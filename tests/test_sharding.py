@@ -0,0 +1,77 @@
+"""Sharded runs and their merge, replayed from the fixture archive."""
+
+import csv
+import json
+
+from src.utils import config
+from src.utils.sharding import remove_shard_files, select_shard, shard_metrics_path, shard_of, shard_paths
+from src.utils.catalog_loader import iter_text_books
+
+from conftest import FIXTURE_CATALOG
+
+
+def read_rows(filename):
+    with open(filename, encoding='utf-8', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def test_empty_shard_and_merge(workdir, run_main):
+    # One book: one of the two shards receives nothing
+    (workdir / 'one.txt').write_text("Over | Ramón Marrero Aristy | 1939\n", encoding='utf-8')
+    run_main('--replay', '--books', 'one.txt', '--shard', '1/2')
+    run_main('--replay', '--books', 'one.txt', '--shard', '2/2')
+
+    sizes = [len(read_rows(shard_paths(config.SHARD_DIR, index, 2)[0])) for index in (1, 2)]
+    assert sorted(sizes) == [0, 1]
+
+    run_main('merge', '--books', 'one.txt')
+    rows = read_rows(config.OUTPUT_CSV)
+    assert [row['Título Libro'] for row in rows] == ["Over"]
+    assert rows[0]['Disponibilidad'] == "ENCONTRADO"
+
+
+def test_merge_keeps_catalog_order_and_duplicate_rows(workdir, run_main):
+    # Exact duplicates hash to the same shard, which fans the result out
+    catalog = FIXTURE_CATALOG + "Over | Ramón Marrero Aristy | 1939\n"
+    (workdir / 'books.txt').write_text(catalog, encoding='utf-8')
+    for index in (1, 2):
+        run_main('--replay', '--books', 'books.txt', '--shard', f'{index}/2')
+    run_main('merge', '--books', 'books.txt')
+
+    rows = read_rows(config.OUTPUT_CSV)
+    assert [int(row['Número']) for row in rows] == [1, 2, 3, 4]
+    assert rows[0]['URL YouTube'] == rows[3]['URL YouTube'] != "NO ENCONTRADO"
+
+
+def accepted_candidates(filename):
+    with open(filename, encoding='utf-8') as f:
+        points = json.load(f)['metrics']['counters']['books_eater_candidates_total']
+    return sum(point['value'] for point in points if point['labels'] == {'outcome': 'accepted'})
+
+
+def test_merge_exports_counters_of_every_shard(workdir, run_main):
+    (workdir / 'books.txt').write_text(FIXTURE_CATALOG, encoding='utf-8')
+    for index in (1, 2):
+        run_main('--replay', '--books', 'books.txt', '--shard', f'{index}/2')
+    run_main('merge', '--books', 'books.txt')
+
+    shards = [accepted_candidates(shard_metrics_path(config.SHARD_DIR, index, 2)) for index in (1, 2)]
+    assert accepted_candidates(config.METRICS_JSON_FILE) == sum(shards) > 0
+    assert (workdir / config.METRICS_PROM_FILE).exists()
+
+
+def test_remove_shard_files_clears_every_artifact(tmp_path):
+    names = [f'shard-1-of-3.{ext}' for ext in ('csv', 'json', 'jsonl', 'log', 'metrics.json', 'prom')]
+    for name in names + ['notes.txt']:
+        (tmp_path / name).write_text('', encoding='utf-8')
+
+    assert remove_shard_files(str(tmp_path)) == len(names)
+    assert [path.name for path in tmp_path.iterdir()] == ['notes.txt']
+
+
+def test_shards_partition_the_catalog():
+    books = list(iter_text_books(FIXTURE_CATALOG.splitlines()))
+    shards = [select_shard(books, index, 3) for index in (1, 2, 3)]
+    assert sorted(book.numero for shard in shards for book in shard) == [1, 2, 3]
+    for index, shard in enumerate(shards, 1):
+        assert all(shard_of(book.titulo, book.autor, 3) == index for book in shard)